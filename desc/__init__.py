@@ -1,8 +1,10 @@
 """DESC: a 3D MHD equilibrium solver and stellarator optimization suite."""
 
+import contextlib
 import importlib
 import os
 import re
+import sys
 import warnings
 
 import colorama
@@ -58,7 +60,24 @@ _BANNER = r"""
 BANNER = colored(_BANNER, "magenta")
 
 
-config = {"device": None, "avail_mem": None, "kind": None}
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "desc")
+DEFAULT_COMPILATION_CACHE_DIR = os.path.join(_CACHE_DIR, "jax")
+
+config = {
+    "device": None,
+    "avail_mem": None,
+    "kind": None,
+    "compilation_cache_dir": os.environ.get("DESC_COMPILATION_CACHE_DIR"),
+    "compilation_cache_max_size": (
+        float(os.environ["DESC_COMPILATION_CACHE_MAX_SIZE"])
+        if "DESC_COMPILATION_CACHE_MAX_SIZE" in os.environ
+        else None
+    ),
+    "data_index_cache": os.environ.get(
+        "DESC_DATA_INDEX_CACHE", os.path.join(_CACHE_DIR, "data_index.json")
+    ),
+    "precision": "float64",
+}
 
 
 def set_device(kind="cpu"):
@@ -139,3 +158,69 @@ def set_device(kind="cpu"):
             selected_gpu["mem_total"] - selected_gpu["mem_used"]
         ) / 1024  # in GB
         os.environ["CUDA_VISIBLE_DEVICES"] = str(selected_gpu["index"])
+
+
+def set_compilation_cache(path=None, max_size=None):
+    """Enable JAX's persistent compilation cache.
+
+    Compiled XLA programs (objective functions, Jacobians, optimizer internals etc.)
+    are written to disk and reused by later processes with the same resolution,
+    which avoids recompiling from scratch on every run.
+
+    Can also be enabled by setting the environment variable
+    DESC_COMPILATION_CACHE_DIR (and optionally DESC_COMPILATION_CACHE_MAX_SIZE)
+    before importing DESC. Should be called before anything is compiled, ideally
+    right after ``desc.set_device``.
+
+    Parameters
+    ----------
+    path : str or path-like, optional
+        Directory to store compiled programs in. Defaults to ~/.cache/desc/jax
+    max_size : float, optional
+        Maximum size of the cache directory in GB. When exceeded, the least
+        recently used entries are evicted. Default is no limit.
+
+    """
+    if path is None:
+        path = DEFAULT_COMPILATION_CACHE_DIR
+    config["compilation_cache_dir"] = os.path.abspath(os.path.expanduser(path))
+    config["compilation_cache_max_size"] = max_size
+    if "desc.backend" in sys.modules:
+        # JAX is already initialized, so we need to update it directly
+        from desc.backend import _enable_compilation_cache
+
+        _enable_compilation_cache()
+
+
+@contextlib.contextmanager
+def precision(dtype="float64"):
+    """Set the floating point precision of computations within a context.
+
+    Inside ``with desc.precision("float32"):`` computations with JAX (transforms,
+    Biot-Savart integrals, spline field evaluation etc.) are traced and run in
+    single precision, which is faster and uses half the memory. This is meant for
+    post-processing such as field line tracing, plotting and writing mgrid files,
+    where double precision is not needed. Inputs are cast to the requested
+    precision and results are returned in it. Functions that were compiled in
+    double precision are recompiled the first time they are called inside the
+    context. Equilibrium solves and optimization should use double precision.
+
+    Parameters
+    ----------
+    dtype : {"float32", "float64"}
+        Floating point precision to use.
+
+    """
+    if dtype not in ["float32", "float64"]:
+        raise ValueError(f"dtype should be one of 'float32', 'float64', got {dtype}")
+    from desc.backend import enable_x64, use_jax
+
+    if not use_jax and dtype == "float32":
+        warnings.warn("precision has no effect with the numpy backend")
+    previous = config["precision"]
+    config["precision"] = dtype
+    try:
+        with enable_x64(dtype == "float64"):
+            yield
+    finally:
+        config["precision"] = previous
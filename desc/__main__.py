@@ -32,6 +32,10 @@ def main(cl_args=sys.argv[1:]):
         print("Outputs will be written to {}".format(ir.output_path))
 
     inputs = ir.inputs
+    if ir.args.warm_cache:
+        _warm_cache(inputs, ir.args.verbose)
+        return
+
     if (
         len(inputs) == 1
         and (inputs[-1]["pres_ratio"] is None)
@@ -49,6 +53,7 @@ def main(cl_args=sys.argv[1:]):
             maxiter=inputs[-1]["maxiter"],
             verbose=ir.args.verbose,
             checkpoint_path=ir.output_path,
+            resume=ir.args.resume,
         )
     else:
         # initialize
@@ -86,5 +91,36 @@ def main(cl_args=sys.argv[1:]):
         plt.show()
 
 
+def _warm_cache(inputs, verbose=1):
+    """Compile the equilibrium objective at each resolution in the input file.
+
+    The compiled functions end up in the persistent compilation cache, so that later
+    runs with the same inputs can skip most of the compilation. Also saves the
+    resolved dependencies of the data_index.
+    """
+    from desc.compute import save_data_index_cache
+    from desc.equilibrium import Equilibrium
+
+    save_data_index_cache()
+    resolutions = []
+    for inp in inputs:
+        eq = Equilibrium(**inp, check_kwargs=False)
+        res = (eq.L, eq.M, eq.N, eq.L_grid, eq.M_grid, eq.N_grid)
+        if res in resolutions:
+            continue
+        resolutions.append(res)
+        if verbose > 0:
+            print("Compiling for L={}, M={}, N={}".format(eq.L, eq.M, eq.N))
+        # a solve with no iterations compiles the objective, jacobian and
+        # constraint projection exactly as they are used in a real run
+        eq.solve(
+            objective=inp["objective"],
+            optimizer=inp["optimizer"],
+            maxiter=0,
+            verbose=verbose,
+        )
+    return resolutions
+
+
 if __name__ == "__main__":  # pragma: no cover
     main(sys.argv[1:])
@@ -1,5 +1,6 @@
 """Backend functions for DESC, with options for JAX or regular numpy."""
 
+import contextlib
 import functools
 import os
 import warnings
@@ -11,6 +12,67 @@ import desc
 from desc import config as desc_config
 from desc import set_device
 
+
+def _prune_compilation_cache(path, max_size):
+    """Evict least recently used entries until the cache is smaller than max_size.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the persistent compilation cache.
+    max_size : float
+        Maximum size of the cache directory in GB.
+
+    Returns
+    -------
+    removed : list of str
+        Paths of the files that were removed.
+
+    """
+    if not os.path.isdir(path):
+        return []
+    entries = []
+    for root, _, files in os.walk(path):
+        for f in files:
+            fpath = os.path.join(root, f)
+            stat = os.stat(fpath)
+            entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, fpath))
+    total = sum(e[1] for e in entries)
+    max_bytes = max_size * 1024**3
+    removed = []
+    # oldest first
+    for _, size, fpath in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(fpath)
+        total -= size
+        removed.append(fpath)
+    return removed
+
+
+def _enable_compilation_cache():
+    """Point JAX's persistent compilation cache to desc.config settings."""
+    path = desc_config.get("compilation_cache_dir")
+    if path is None or not use_jax:
+        return
+    max_size = desc_config.get("compilation_cache_max_size")
+    os.makedirs(path, exist_ok=True)
+    if "jax_compilation_cache_dir" in jax_config.values:
+        jax_config.update("jax_compilation_cache_dir", path)
+    else:  # pragma: no cover
+        # older versions of JAX
+        from jax.experimental.compilation_cache import compilation_cache as cc
+
+        cc.initialize_cache(path)
+    if max_size is None:
+        return
+    if "jax_compilation_cache_max_size" in jax_config.values:
+        # JAX handles LRU eviction itself while running
+        jax_config.update("jax_compilation_cache_max_size", int(max_size * 1024**3))
+    else:  # pragma: no cover
+        _prune_compilation_cache(path, max_size)
+
+
 if os.environ.get("DESC_BACKEND") == "numpy":
     jnp = np
     use_jax = False
@@ -32,6 +94,8 @@ else:
             from jax import config as jax_config
 
             jax_config.update("jax_enable_x64", True)
+            use_jax = True
+            _enable_compilation_cache()
             if desc_config.get("kind") == "gpu" and len(jax.devices("gpu")) == 0:
                 warnings.warn(
                     "JAX failed to detect GPU, are you sure you "
@@ -40,7 +104,6 @@ else:
                 set_device("cpu")
             x = jnp.linspace(0, 5)
             y = jnp.exp(x)
-        use_jax = True
         print(
             f"DESC version {desc.__version__},"
             + f"using JAX backend, jax version={jax.__version__}, "
@@ -66,6 +129,8 @@ print(
 )
 
 if use_jax:  # noqa: C901 - FIXME: simplify this, define globally and then assign?
+    from jax.experimental import enable_x64
+
     jit = jax.jit
     fori_loop = jax.lax.fori_loop
     cond = jax.lax.cond
@@ -76,9 +141,18 @@ if use_jax:  # noqa: C901 - FIXME: simplify this, define globally and then assig
     repeat = jnp.repeat
     take = jnp.take
     scan = jax.lax.scan
+    segment_sum = jax.ops.segment_sum
     from jax import custom_jvp
     from jax.experimental.ode import odeint
-    from jax.scipy.linalg import block_diag, cho_factor, cho_solve, qr, solve_triangular
+    from jax.scipy.linalg import (
+        block_diag,
+        cho_factor,
+        cho_solve,
+        lu_factor,
+        lu_solve,
+        qr,
+        solve_triangular,
+    )
     from jax.scipy.special import gammaln, logsumexp
     from jax.tree_util import (
         register_pytree_node,
@@ -399,6 +473,7 @@ if use_jax:  # noqa: C901 - FIXME: simplify this, define globally and then assig
 # for coverage purposes
 else:  # pragma: no cover
     jit = lambda func, *args, **kwargs: func
+    enable_x64 = lambda new_val=True: contextlib.nullcontext()
     execute_on_cpu = lambda func: func
     import scipy.optimize
     from scipy.integrate import odeint  # noqa: F401
@@ -406,6 +481,8 @@ else:  # pragma: no cover
         block_diag,
         cho_factor,
         cho_solve,
+        lu_factor,
+        lu_solve,
         qr,
         solve_triangular,
     )
@@ -668,6 +745,21 @@ else:  # pragma: no cover
             out = out[:total_repeat_length]
         return out
 
+    def segment_sum(
+        data,
+        segment_ids,
+        num_segments=None,
+        indices_are_sorted=False,
+        unique_indices=False,
+    ):
+        """A numpy implementation of jax.ops.segment_sum."""
+        data = np.asarray(data)
+        if num_segments is None:
+            num_segments = np.max(segment_ids) + 1
+        out = np.zeros((num_segments,) + data.shape[1:], dtype=data.dtype)
+        np.add.at(out, segment_ids, data)
+        return out
+
     def custom_jvp(fun, *args, **kwargs):
         """Dummy function for custom_jvp without JAX."""
         fun.defjvp = lambda *args, **kwargs: None
@@ -4,7 +4,6 @@ import functools
 from abc import ABC, abstractmethod
 from math import factorial
 
-import mpmath
 import numpy as np
 
 from desc.backend import custom_jvp, fori_loop, jit, jnp, sign
@@ -1362,6 +1361,9 @@ def polyval_vec(p, x, prec=None):
 
 
 def _polyval_exact(p, x, prec):
+    # mpmath is only needed for very high precision, so import it lazily
+    import mpmath
+
     p = np.atleast_2d(p)
     x = np.atleast_1d(x).flatten()
     # TODO: possibly multithread this bit
@@ -264,6 +264,30 @@ class _Coil(_MagneticField, Optimizable, ABC):
             B = xyz2rpz_vec(B, phi=phi)
         return B
 
+    def _compute_current_response(self, coords, basis="rpz", source_grid=None):
+        """Compute magnetic field per unit current at a set of points.
+
+        Parameters
+        ----------
+        coords : array-like shape(n,3)
+            Nodes to evaluate field at in [R,phi,Z] or [X,Y,Z] coordinates.
+        basis : {"rpz", "xyz"}
+            Basis for input coordinates and returned magnetic field.
+        source_grid : Grid, int or None, optional
+            Grid used to discretize coil.
+
+        Returns
+        -------
+        response : ndarray, shape(n,3,num_currents)
+            Magnetic field from each independent current at unit current, such that
+            the total field is ``response @ currents``.
+
+        """
+        params = self.params_dict
+        params["current"] = 1.0
+        B = self.compute_magnetic_field(coords, params, basis, source_grid)
+        return B[:, :, None]
+
     def __repr__(self):
         """Get the string form of the object."""
         return (
@@ -936,6 +960,65 @@ def _check_type(coil0, coil):
         )
 
 
+def _symmetry_map(coords, NFP, sym, tol=1e-10):
+    """Find the points of a grid that are equivalent under the coil set symmetry.
+
+    Two points are equivalent if they are related by a rotation of 2π/NFP about
+    the Z axis, or (if sym) by the stellarator symmetry (R,ϕ,Z) -> (R,-ϕ,-Z).
+    Points that do not match any other point to within tol are left unmerged, so
+    the map is always exact.
+
+    Parameters
+    ----------
+    coords : ndarray, shape(n,3)
+        Evaluation points in [R,phi,Z] coordinates.
+    NFP : int
+        Number of field periods of the coil set.
+    sym : bool
+        Whether the coil set is stellarator symmetric.
+    tol : float
+        Relative tolerance for two points to be considered the same.
+
+    Returns
+    -------
+    symmap : tuple of ndarray or None
+        (unique, src, flip) such that the field at coords is
+        B[unique][src] * where(flip, [-1, 1, 1], 1) in [R,phi,Z] components.
+        None if no points are equivalent.
+
+    """
+    coords = np.asarray(coords, dtype=float)
+    if coords.ndim != 2 or (NFP == 1 and not sym):
+        return None
+    R, phi, Z = coords.T
+    # periodic embedding of each point, invariant under field period rotations
+    emb = np.stack([R, R * np.cos(NFP * phi), R * np.sin(NFP * phi), Z], axis=-1)
+    scale = tol * max(np.max(np.abs(emb)), 1.0)
+    emb_ref = emb * np.array([1, 1, -1, -1])
+    keys = np.round(np.concatenate([emb, emb_ref]) / scale)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n = coords.shape[0]
+    # representative of each point is the first point in the same equivalence class
+    rep = first[inverse[:n]]
+    flip = np.zeros(n, dtype=bool)
+    if sym:
+        rep_ref = first[inverse[n:]]
+        use_ref = (rep_ref < n) & (rep_ref < rep)
+        rep = np.where(use_ref, rep_ref, rep)
+        flip = use_ref
+    unique = np.unique(rep)
+    if unique.size == n:
+        return None
+    src = np.searchsorted(unique, rep)
+    return unique, src, flip
+
+
+def _symmetry_expand(B, src, flip):
+    """Reconstruct the field at all points from the field at the unique points."""
+    return B[src] * jnp.where(flip[:, None], jnp.array([-1.0, 1.0, 1.0]), 1.0)
+
+
 class CoilSet(OptimizableCollection, _Coil, MutableSequence):
     """Set of coils of different geometry but shared parameterization and resolution.
 
@@ -1187,6 +1270,34 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
             for par, coil in zip(params, self):
                 par["current"] = coil.current
 
+        # if the points are known, only evaluate at the ones not related by symmetry
+        symmap = None
+        if self.NFP > 1 or self.sym:
+            try:
+                coords_np = np.asarray(coords)
+            except TypeError:  # traced
+                coords_np = None
+            if coords_np is not None:
+                if basis.lower() == "xyz":
+                    coords_np = xyz2rpz(coords_np)
+                symmap = _symmetry_map(coords_np, self.NFP, self.sym)
+        if symmap is None:
+            return self._compute_magnetic_field(coords, params, basis, source_grid)
+
+        unique, src, flip = symmap
+        B = self._compute_magnetic_field(
+            coords[unique], params, basis, source_grid, basis_out="rpz"
+        )
+        B = _symmetry_expand(B, src, flip)
+        if basis.lower() == "xyz":
+            B = rpz2xyz_vec(B, x=coords[:, 0], y=coords[:, 1])
+        return B
+
+    def _compute_magnetic_field(
+        self, coords, params, basis, source_grid, basis_out=None
+    ):
+        """Sum the fields of all coils, using symmetry to avoid copying the coils."""
+        basis_out = basis if basis_out is None else basis_out
         # stellarator symmetry is easiest in [X,Y,Z] coordinates
         if basis.lower() == "rpz":
             coords_xyz = rpz2xyz(coords)
@@ -1229,10 +1340,59 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
                 [-1, 1, 1]
             )
 
-        if basis.lower() == "xyz":
+        if basis_out.lower() == "xyz":
             B = rpz2xyz_vec(B, x=coords[:, 0], y=coords[:, 1])
         return B
 
+    def _compute_current_response(self, coords, basis="rpz", source_grid=None):
+        """Compute magnetic field per unit current at a set of points.
+
+        Parameters
+        ----------
+        coords : array-like shape(n,3)
+            Nodes to evaluate field at in [R,phi,Z] or [X,Y,Z] coordinates.
+        basis : {"rpz", "xyz"}
+            Basis for input coordinates and returned magnetic field.
+        source_grid : Grid, int or None, optional
+            Grid used to discretize coils.
+
+        Returns
+        -------
+        response : ndarray, shape(n,3,len(self))
+            Magnetic field from each unique coil (including its symmetric copies)
+            at unit current, such that the total field is ``response @ currents``.
+
+        """
+        assert basis.lower() in ["rpz", "xyz"]
+        coords = jnp.atleast_2d(jnp.asarray(coords))
+        params = []
+        for coil in self:
+            par = get_params(["x_s", "x", "s", "ds"], coil, basis=basis)
+            par["current"] = 1.0
+            params.append(par)
+
+        coords_rpz = xyz2rpz(coords) if basis.lower() == "xyz" else coords
+        symmap = _symmetry_map(coords_rpz, self.NFP, self.sym)
+        x = coords if symmap is None else coords[symmap[0]]
+
+        def body(carry, par):
+            B = self._compute_magnetic_field(x, [par], basis, source_grid, "rpz")
+            return carry, B
+
+        B = jnp.moveaxis(scan(body, None, tree_stack(params))[1], 0, -1)
+        if symmap is not None:
+            _, src, flip = symmap
+            B = B[src] * jnp.where(
+                flip[:, None, None], jnp.array([-1, 1, 1])[:, None], 1
+            )
+        if basis.lower() == "xyz":
+            B = vmap(
+                lambda b: rpz2xyz_vec(b, x=coords[:, 0], y=coords[:, 1]),
+                in_axes=-1,
+                out_axes=-1,
+            )(B)
+        return B
+
     @classmethod
     def linspaced_angular(
         cls, coil, current=None, axis=[0, 0, 1], angle=2 * np.pi, n=10, endpoint=False
@@ -2039,6 +2199,34 @@ class MixedCoilSet(CoilSet):
 
         return B
 
+    def _compute_current_response(self, coords, basis="rpz", source_grid=None):
+        """Compute magnetic field per unit current at a set of points.
+
+        Parameters
+        ----------
+        coords : array-like shape(n,3)
+            Nodes to evaluate field at in [R,phi,Z] or [X,Y,Z] coordinates.
+        basis : {"rpz", "xyz"}
+            Basis for input coordinates and returned magnetic field.
+        source_grid : Grid, int or None or array-like, optional
+            Grid used to discretize coils. If array-like, should be 1 value per coil.
+
+        Returns
+        -------
+        response : ndarray, shape(n,3,num_currents)
+            Magnetic field from each independent current at unit current, in the
+            order of the flattened ``params_dict``.
+
+        """
+        source_grid = self._make_arraylike(source_grid)
+        return jnp.concatenate(
+            [
+                coil._compute_current_response(coords, basis, grd)
+                for coil, grd in zip(self.coils, source_grid)
+            ],
+            axis=-1,
+        )
+
     def to_FourierPlanar(
         self, N=10, grid=None, basis="xyz", name="", check_intersection=False
     ):
@@ -12,7 +12,8 @@ expensive computations.
 from scipy.constants import elementary_charge, mu_0
 from scipy.special import roots_legendre
 
-from ..backend import fori_loop, jnp
+from ..backend import jnp
+from ..utils import errorif
 from .data_index import register_compute_fun
 from .utils import surface_averages_map
 
@@ -34,6 +35,9 @@ from .utils import surface_averages_map
     resolution_requirement="tz",
     n_gauss="int: Number of quadrature points to use for estimating trapped fraction. "
     + "Default 20.",
+    lambda_quad="str: Quadrature rule in the pitch angle. 'legendre' for "
+    + "Gauss-Legendre, 'graded' for Gauss-Legendre in s with λ Bmax = 1 − s², "
+    + "which clusters nodes near the trapped-passing boundary. Default 'legendre'.",
 )
 def _trapped_fraction(params, transforms, profiles, data, **kwargs):
     """Evaluate the effective trapped particle fraction.
@@ -44,39 +48,102 @@ def _trapped_fraction(params, transforms, profiles, data, **kwargs):
         fₜ = 1 − 3/4 〈|B|²〉 ∫₀¹/ᴮᵐᵃˣ λ / 〈√(1 − λ B)〉 dλ
     where 〈 ⋯ 〉 is a flux surface average.
     """
-    # Get nodes and weights for Gauss-Legendre integration:
-    n_gauss = kwargs.get("n_gauss", 20)
-    base_nodes, base_weights = roots_legendre(n_gauss)
-    # Rescale for integration on [0, 1], not [-1, 1]:
-    lambd = jnp.asarray((base_nodes + 1) * 0.5)
-    lambda_weights = jnp.asarray(base_weights * 0.5)
-
+    lambd, lambda_weights = pitch_quadrature(
+        kwargs.get("n_gauss", 20), kwargs.get("lambda_quad", "legendre")
+    )
     grid = transforms["grid"]
-    modB_over_Bmax = data["|B|"] / data["max_tz |B|"]
     Bmax_squared = grid.compress(data["max_tz |B|"]) ** 2
     # to resolve indeterminate form of limit at magnetic axis
     sqrt_g = grid.replace_at_axis(data["sqrt(g)"], lambda: data["sqrt(g)_r"], copy=True)
     V_r = grid.compress(
         grid.replace_at_axis(data["V_r(r)"], lambda: data["V_rr(r)"], copy=True)
     )
-    compute_surface_averages = surface_averages_map(grid, expand_out=False)
-
-    # Sum over the lambda grid points, using fori_loop for efficiency.
-    def body_fun(jlambda, lambda_integral):
-        flux_surf_avg_term = compute_surface_averages(
-            jnp.sqrt(1 - lambd[jlambda] * modB_over_Bmax),
-            sqrt_g=sqrt_g,
-            denominator=V_r,
-        )
-        return lambda_integral + lambda_weights[jlambda] * lambd[jlambda] / (
-            Bmax_squared * flux_surf_avg_term
-        )
-
-    lambda_integral = fori_loop(0, n_gauss, body_fun, jnp.zeros(grid.num_rho))
+    # 〈√(1 − λ B)〉 for every pitch at once with shape (num rho, num lambda)
+    flux_surf_avg_term = pitch_surface_averages(
+        grid,
+        lambda lambd, modB_over_Bmax: jnp.sqrt(1 - lambd * modB_over_Bmax),
+        lambd,
+        data["|B|"] / data["max_tz |B|"],
+        sqrt_g,
+        V_r,
+    )
+    lambda_integral = (lambd / flux_surf_avg_term) @ lambda_weights / Bmax_squared
     data["trapped fraction"] = 1 - 0.75 * data["<|B|^2>"] * grid.expand(lambda_integral)
     return data
 
 
+def pitch_quadrature(n_gauss=20, quad="legendre"):
+    """Quadrature nodes and weights in the normalized pitch λ Bmax on [0, 1].
+
+    Parameters
+    ----------
+    n_gauss : int
+        Number of quadrature points.
+    quad : {"legendre", "graded"}
+        ``"legendre"`` is Gauss-Legendre on [0, 1]. ``"graded"`` substitutes
+        λ Bmax = 1 − s² and uses Gauss-Legendre in s, which clusters nodes
+        near the trapped-passing boundary λ Bmax = 1 where the integrands of
+        bounce averaged quantities are not smooth.
+
+    Returns
+    -------
+    lambd : ndarray
+        Quadrature nodes in λ Bmax.
+    weights : ndarray
+        Quadrature weights.
+
+    """
+    errorif(
+        quad not in {"legendre", "graded"},
+        ValueError,
+        f"Unknown pitch angle quadrature {quad}, expected 'legendre' or 'graded'.",
+    )
+    x, w = roots_legendre(n_gauss)
+    # Rescale for integration on [0, 1], not [-1, 1]:
+    x = (x + 1) / 2
+    w = w / 2
+    if quad == "graded":
+        x, w = 1 - x**2, 2 * x * w
+    return jnp.asarray(x), jnp.asarray(w)
+
+
+def pitch_surface_averages(grid, fun, lambd, modB_over_Bmax, sqrt_g, denominator):
+    """Compute flux surface averages of a function of pitch for all pitches at once.
+
+    The integrand is evaluated for every pitch and node as an array of shape
+    (``grid.num_nodes``, ``lambd.size``), so the averages over all surfaces
+    and pitches are a single matrix product instead of a loop over λ.
+
+    Parameters
+    ----------
+    grid : Grid
+        Collocation grid containing the nodes to evaluate at.
+    fun : callable
+        Integrand with signature ``fun(lambd, modB_over_Bmax)``, e.g.
+        ``lambda lambd, b: jnp.sqrt(1 - lambd * b)``. It is called with
+        arrays that broadcast to shape (``grid.num_nodes``, ``lambd.size``).
+    lambd : ndarray
+        Normalized pitch λ Bmax, see ``pitch_quadrature``.
+    modB_over_Bmax : ndarray
+        |B| / max_tz |B| on the grid nodes.
+    sqrt_g : ndarray
+        Coordinate system Jacobian determinant.
+    denominator : ndarray
+        Surface integral of ``sqrt_g`` with size ``grid.num_rho``, i.e. dV/dρ.
+
+    Returns
+    -------
+    averages : ndarray
+        Shape (``grid.num_rho``, ``lambd.size``).
+        Flux surface average of ``fun`` for each surface and pitch.
+
+    """
+    integrand = fun(lambd, modB_over_Bmax[:, jnp.newaxis])
+    return surface_averages_map(grid, expand_out=False)(
+        integrand, sqrt_g=sqrt_g, denominator=denominator
+    )
+
+
 def compute_J_dot_B_Redl(geom_data, profile_data, helicity_N=None):
     """Compute the bootstrap current 〈𝐉 ⋅ 𝐁〉.
 
@@ -11,10 +11,20 @@ expensive computations.
 
 from interpax import interp1d
 
-from desc.backend import jnp, sign, vmap
+from desc.backend import jnp, vmap
 
 from .data_index import register_compute_fun
-from .utils import cross, dot, safediv
+from .utils import _get_surface_idx, _get_w_mn_index, cross, dot, nufft2d1
+
+
+def _to_surfaces(grid, x):
+    # reshape data at the nodes to shape(num_rho, num_nodes per surface)
+    return x[_get_surface_idx(grid)]
+
+
+def _from_surfaces(grid, x):
+    # inverse of _to_surfaces
+    return jnp.zeros(grid.num_nodes, x.dtype).at[_get_surface_idx(grid)].set(x)
 
 
 @register_compute_fun(
@@ -35,7 +45,9 @@ from .utils import cross, dot, safediv
     resolution_requirement="tz",
 )
 def _B_theta_mn(params, transforms, profiles, data, **kwargs):
-    data["B_theta_mn"] = transforms["B"].fit(data["B_theta"])
+    B_theta = _to_surfaces(transforms["grid"], data["B_theta"])
+    # modes on each surface stored as shape(num_rho * num_modes)
+    data["B_theta_mn"] = vmap(transforms["B"].fit)(B_theta).ravel()
     return data
 
 
@@ -57,7 +69,9 @@ def _B_theta_mn(params, transforms, profiles, data, **kwargs):
     resolution_requirement="tz",
 )
 def _B_zeta_mn(params, transforms, profiles, data, **kwargs):
-    data["B_zeta_mn"] = transforms["B"].fit(data["B_zeta"])
+    B_zeta = _to_surfaces(transforms["grid"], data["B_zeta"])
+    # modes on each surface stored as shape(num_rho * num_modes)
+    data["B_zeta_mn"] = vmap(transforms["B"].fit)(B_zeta).ravel()
     return data
 
 
@@ -78,24 +92,16 @@ def _B_zeta_mn(params, transforms, profiles, data, **kwargs):
     N_booz="int: Maximum toroidal mode number for Boozer harmonics. Default 2*eq.N",
 )
 def _w_mn(params, transforms, profiles, data, **kwargs):
-    w_mn = jnp.zeros((transforms["w"].basis.num_modes,))
-    Bm = transforms["B"].basis.modes[:, 1]
-    Bn = transforms["B"].basis.modes[:, 2]
+    num_rho = transforms["grid"].num_rho
     wm = transforms["w"].basis.modes[:, 1]
-    wn = transforms["w"].basis.modes[:, 2]
-    NFP = transforms["w"].basis.NFP
-    mask_t = (Bm[:, None] == -wm) & (Bn[:, None] == wn) & (wm != 0)
-    mask_z = (Bm[:, None] == wm) & (Bn[:, None] == -wn) & (wm == 0) & (wn != 0)
-
-    num_t = (mask_t @ sign(wn)) * data["B_theta_mn"]
-    den_t = mask_t @ jnp.abs(wm)
-    num_z = (mask_z @ sign(wm)) * data["B_zeta_mn"]
-    den_z = mask_z @ jnp.abs(NFP * wn)
-
-    w_mn = jnp.where(mask_t.any(axis=0), mask_t.T @ safediv(num_t, den_t), w_mn)
-    w_mn = jnp.where(mask_z.any(axis=0), mask_z.T @ safediv(num_z, den_z), w_mn)
-
-    data["w_Boozer_mn"] = w_mn
+    if "w_mn_index" in transforms:
+        idx, factor = transforms["w_mn_index"]
+    else:
+        idx, factor = _get_w_mn_index(transforms["B"].basis, transforms["w"].basis)
+    B_theta_mn = data["B_theta_mn"].reshape((num_rho, -1))
+    B_zeta_mn = data["B_zeta_mn"].reshape((num_rho, -1))
+    w_mn = jnp.where(wm != 0, B_theta_mn[:, idx], B_zeta_mn[:, idx]) * factor
+    data["w_Boozer_mn"] = w_mn.ravel()
     return data
 
 
@@ -117,7 +123,9 @@ def _w_mn(params, transforms, profiles, data, **kwargs):
     N_booz="int: Maximum toroidal mode number for Boozer harmonics. Default 2*eq.N",
 )
 def _w(params, transforms, profiles, data, **kwargs):
-    data["w_Boozer"] = transforms["w"].transform(data["w_Boozer_mn"])
+    grid = transforms["grid"]
+    w_mn = data["w_Boozer_mn"].reshape((grid.num_rho, -1))
+    data["w_Boozer"] = _from_surfaces(grid, vmap(transforms["w"].transform)(w_mn))
     return data
 
 
@@ -139,7 +147,10 @@ def _w(params, transforms, profiles, data, **kwargs):
     N_booz="int: Maximum toroidal mode number for Boozer harmonics. Default 2*eq.N",
 )
 def _w_t(params, transforms, profiles, data, **kwargs):
-    data["w_Boozer_t"] = transforms["w"].transform(data["w_Boozer_mn"], dt=1)
+    grid = transforms["grid"]
+    w_mn = data["w_Boozer_mn"].reshape((grid.num_rho, -1))
+    w_t = vmap(lambda x: transforms["w"].transform(x, dt=1))(w_mn)
+    data["w_Boozer_t"] = _from_surfaces(grid, w_t)
     return data
 
 
@@ -161,7 +172,10 @@ def _w_t(params, transforms, profiles, data, **kwargs):
     N_booz="int: Maximum toroidal mode number for Boozer harmonics. Default 2*eq.N",
 )
 def _w_z(params, transforms, profiles, data, **kwargs):
-    data["w_Boozer_z"] = transforms["w"].transform(data["w_Boozer_mn"], dz=1)
+    grid = transforms["grid"]
+    w_mn = data["w_Boozer_mn"].reshape((grid.num_rho, -1))
+    w_z = vmap(lambda x: transforms["w"].transform(x, dz=1))(w_mn)
+    data["w_Boozer_z"] = _from_surfaces(grid, w_z)
     return data
 
 
@@ -289,18 +303,37 @@ def _sqrtg_B(params, transforms, profiles, data, **kwargs):
     transforms={"B": [[0, 0, 0]]},
     profiles=[],
     coordinates="rtz",
-    data=["sqrt(g)_B", "|B|", "rho", "theta_B", "zeta_B"],
+    data=["sqrt(g)_B", "|B|", "theta_B", "zeta_B"],
     M_booz="int: Maximum poloidal mode number for Boozer harmonics. Default 2*eq.M",
     N_booz="int: Maximum toroidal mode number for Boozer harmonics. Default 2*eq.N",
 )
 def _B_mn(params, transforms, profiles, data, **kwargs):
-    nodes = jnp.array([data["rho"], data["theta_B"], data["zeta_B"]]).T
-    norm = 2 ** (3 - jnp.sum((transforms["B"].basis.modes == 0), axis=1))
+    grid = transforms["grid"]
+    basis = transforms["B"].basis
+    # sums of exp(-i (m theta_B + n NFP zeta_B)) over the nodes of each surface with
+    # a NUFFT instead of evaluating the basis at the Boozer angles
+    f = vmap(lambda x, y, c: nufft2d1(x, y, c, basis.M, basis.N))(
+        _to_surfaces(grid, data["theta_B"]),
+        _to_surfaces(grid, basis.NFP * data["zeta_B"]),
+        _to_surfaces(grid, data["sqrt(g)_B"] * data["|B|"]),
+    )
+    m = basis.modes[:, 1]
+    n = basis.modes[:, 2]
+    f_plus = f[:, abs(m) + basis.M, abs(n) + basis.N]
+    f_minus = f[:, abs(m) + basis.M, basis.N - abs(n)]
+    # products of cos/sin in theta_B and zeta_B from sums of the exponentials
+    B_mn = jnp.where(
+        m >= 0,
+        jnp.where(n >= 0, (f_plus + f_minus).real, (f_minus - f_plus).imag),
+        jnp.where(n >= 0, -(f_plus + f_minus).imag, (f_minus - f_plus).real),
+    )
+    norm = 2 ** (3 - jnp.sum((basis.modes == 0), axis=1))
     data["|B|_mn"] = (
         norm  # 1 if m=n=0, 2 if m=0 or n=0, 4 if m!=0 and n!=0
-        * (transforms["B"].basis.evaluate(nodes).T @ (data["sqrt(g)_B"] * data["|B|"]))
+        * B_mn
+        / 2
         / transforms["B"].grid.num_nodes
-    )
+    ).ravel()  # modes on each surface stored as shape(num_rho * num_modes)
     return data
 
 
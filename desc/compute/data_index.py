@@ -1,10 +1,15 @@
 """data_index contains all the quantities calculated by the compute functions."""
 
 import functools
+import hashlib
+import json
+import os
 from collections import deque
 
 import numpy as np
 
+from desc import config as desc_config
+
 
 def find_permutations(primary, separator="_"):
     """Finds permutations of quantity names for aliases."""
@@ -47,6 +52,36 @@ def assign_alias_data(
     return data
 
 
+class _DataIndexEntry(dict):
+    """Dictionary describing a quantity in the data_index.
+
+    The full (recursive) dependencies and tier of a quantity are expensive to
+    resolve for everything in the data_index at import time, so they are resolved
+    and stored the first time they are requested.
+    """
+
+    def __init__(self, p, name, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._p = p
+        self._name = name
+
+    def __missing__(self, key):
+        # need local import to avoid circular dependencies
+        if key in {"full_dependencies", "full_with_axis_dependencies"}:
+            from .utils import _resolve_dependencies
+
+            full, full_with_axis = _resolve_dependencies(self._p, self._name)
+            self["full_dependencies"] = full
+            self["full_with_axis_dependencies"] = full_with_axis
+            return self[key]
+        if key == "tier":
+            from .utils import set_tier
+
+            set_tier(self._name, self._p)
+            return self[key]
+        raise KeyError(key)
+
+
 def register_compute_fun(  # noqa: C901
     name,
     label,
@@ -187,10 +222,12 @@ def register_compute_fun(  # noqa: C901
                         ):
                             continue
                     d["parameterization"] = p
-                    data_index[base_class][name] = d.copy()
+                    data_index[base_class][name] = _DataIndexEntry(base_class, name, d)
                     all_kwargs[base_class][name] = kwargs
                     for alias in aliases:
-                        data_index[base_class][alias] = d.copy()
+                        data_index[base_class][alias] = _DataIndexEntry(
+                            base_class, alias, d
+                        )
                         # assigns alias compute func to generator to be used later
                         data_index[base_class][alias]["fun"] = functools.partial(
                             assign_alias_data,
@@ -292,3 +329,100 @@ def is_1dz_tor_grid(name, p="desc.equilibrium.equilibrium.Equilibrium"):
         data_index[p][name]["coordinates"] == "z"
         and data_index[p][name]["resolution_requirement"] == "rt"
     )
+
+
+def _source_hash():
+    """Hash of the source files of the compute functions that fill the data_index."""
+    h = hashlib.sha256()
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for fname in sorted(os.listdir(folder)):
+        if fname.endswith(".py"):
+            with open(os.path.join(folder, fname), "rb") as f:
+                h.update(fname.encode())
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def save_data_index_cache(path=None):
+    """Resolve the full dependencies of everything in data_index and save to disk.
+
+    The cache is loaded when ``desc.compute`` is imported, so that the dependency
+    tree doesn't need to be resolved again. It is only used if the source of the
+    compute functions has not changed since it was written.
+
+    Parameters
+    ----------
+    path : str or path-like, optional
+        File to save to. Defaults to ``desc.config["data_index_cache"]``, which can
+        be set with the DESC_DATA_INDEX_CACHE environment variable.
+
+    """
+    path = desc_config["data_index_cache"] if path is None else path
+    index = {}
+    for p in data_index:
+        # store dependencies as indices into the list of names to save space
+        names = list(data_index[p].keys())
+        idx = {name: i for i, name in enumerate(names)}
+        entries = []
+        for name in names:
+            full = data_index[p][name]["full_dependencies"]
+            full_with_axis = data_index[p][name]["full_with_axis_dependencies"]
+            full = dict(full, data=[idx[dep] for dep in full["data"]])
+            full_with_axis = (
+                None  # same as full
+                if full_with_axis is data_index[p][name]["full_dependencies"]
+                else dict(
+                    full_with_axis, data=[idx[dep] for dep in full_with_axis["data"]]
+                )
+            )
+            entries.append([full, full_with_axis, data_index[p][name]["tier"]])
+        index[p] = {"names": names, "entries": entries}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"hash": _source_hash(), "index": index}, f, separators=(",", ":"))
+
+
+def load_data_index_cache(path=None):
+    """Load the full dependencies of everything in data_index from disk.
+
+    Parameters
+    ----------
+    path : str or path-like, optional
+        File to load from. Defaults to ``desc.config["data_index_cache"]``, which
+        can be set with the DESC_DATA_INDEX_CACHE environment variable.
+
+    Returns
+    -------
+    loaded : bool
+        Whether the cache was found and was valid for the current source.
+
+    """
+    path = desc_config["data_index_cache"] if path is None else path
+    if not path or not os.path.isfile(path):
+        return False
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if cache.get("hash") != _source_hash() or set(cache["index"]) != set(data_index):
+        return False
+    for p, val in cache["index"].items():
+        if set(val["names"]) != set(data_index[p]):
+            return False
+    for p, val in cache["index"].items():
+        names = val["names"]
+        for name, (full, full_with_axis, tier) in zip(names, val["entries"]):
+            full["data"] = [names[i] for i in full["data"]]
+            if full_with_axis is None:
+                full_with_axis = full
+            else:
+                full_with_axis["data"] = [names[i] for i in full_with_axis["data"]]
+                for key in full_with_axis:
+                    if full_with_axis[key] == full[key]:
+                        # dereference to save memory
+                        full_with_axis[key] = full[key]
+            data_index[p][name]["full_dependencies"] = full
+            data_index[p][name]["full_with_axis_dependencies"] = full_with_axis
+            data_index[p][name]["tier"] = tier
+    return True
@@ -5,8 +5,8 @@ import inspect
 
 import numpy as np
 
-from desc.backend import cond, execute_on_cpu, fori_loop, jnp, put
-from desc.grid import ConcentricGrid, Grid, LinearGrid
+from desc.backend import cond, execute_on_cpu, fori_loop, jnp, put, segment_sum
+from desc.grid import ConcentricGrid, Grid, LinearGrid, QuadratureGrid
 
 from ..utils import errorif, warnif
 from .data_index import allowed_kwargs, data_index
@@ -260,21 +260,97 @@ def _get_deps_1_key(p, key, has_axis):
     elif "full_dependencies" in data_index[p][key]:
         return data_index[p][key]["full_dependencies"]["data"]
 
+    # the full dependencies of each dependency are resolved (once) on access
+    full = "full_with_axis_dependencies" if has_axis else "full_dependencies"
     deps = data_index[p][key]["dependencies"]["data"]
     if len(deps) == 0:
         return deps
     out = deps.copy()  # to avoid modifying the data_index
     for dep in deps:
-        out += _get_deps_1_key(p, dep, has_axis)
+        out += data_index[p][dep][full]["data"]
     if has_axis:
         axis_limit_deps = data_index[p][key]["dependencies"]["axis_limit_data"]
         out += axis_limit_deps.copy()  # to be safe
         for dep in axis_limit_deps:
-            out += _get_deps_1_key(p, dep, has_axis)
+            out += data_index[p][dep][full]["data"]
 
     return sorted(set(out))
 
 
+def _resolve_dependencies(p, key):
+    """Resolve the full dependencies of ``key`` in the data index.
+
+    Rather than having to recursively compute the full dependencies every time we
+    compute something, it's easier to just do it once for each quantity, the
+    first time it's needed.
+
+    Parameters
+    ----------
+    p : str
+        Type of object to compute for, eg Equilibrium, Curve, etc.
+    key : str
+        Name of the quantity.
+
+    Returns
+    -------
+    full : dict
+        Data, transforms, params and profiles needed to compute ``key``
+        on a grid without a node on the magnetic axis.
+    full_with_axis : dict
+        Same as ``full`` but for a grid with a node on the magnetic axis.
+
+    """
+    full = {
+        "data": get_data_deps(key, p, has_axis=False, basis="rpz"),
+        "transforms": get_derivs(key, p, has_axis=False, basis="rpz"),
+        "params": get_params(key, p, has_axis=False, basis="rpz"),
+        "profiles": get_profiles(key, p, has_axis=False, basis="rpz"),
+    }
+    full_with_axis_data = get_data_deps(key, p, has_axis=True)
+    if len(full["data"]) >= len(full_with_axis_data):
+        # Then this quantity and all its dependencies do not need anything
+        # extra to evaluate its limit at the magnetic axis.
+        # The dependencies in the `full` dictionary and the `full_with_axis`
+        # dictionary will be identical, so we assign the same reference to
+        # avoid storing a copy.
+        full_with_axis = full
+    else:
+        full_with_axis = {
+            "data": full_with_axis_data,
+            "transforms": get_derivs(key, p, has_axis=True, basis="rpz"),
+            "params": get_params(key, p, has_axis=True, basis="rpz"),
+            "profiles": get_profiles(key, p, has_axis=True, basis="rpz"),
+        }
+        for _key, val in full_with_axis.items():
+            if full[_key] == val:
+                # Nothing extra was needed to evaluate this quantity's limit.
+                # One is a copy of the other; dereference to save memory.
+                full_with_axis[_key] = full[_key]
+    return full, full_with_axis
+
+
+def set_tier(name, p):
+    """Determine how deep in the dependency tree a given name is.
+
+    tier of 0 means no dependencies on other data,
+    tier of 1 means it depends on only tier 0 stuff,
+    tier of 2 means it depends on tier 0 and tier 1, etc etc.
+
+    Designed such that if you compute things in the order determined by tiers,
+    all dependencies will always be computed in the correct order.
+    """
+    if "tier" in data_index[p][name]:
+        return
+    if len(data_index[p][name]["full_with_axis_dependencies"]["data"]) == 0:
+        data_index[p][name]["tier"] = 0
+    else:
+        thistier = 0
+        for name1 in data_index[p][name]["full_with_axis_dependencies"]["data"]:
+            set_tier(name1, p)
+            thistier = max(thistier, data_index[p][name1]["tier"])
+        data_index[p][name]["tier"] = thistier + 1
+
+
 def _get_deps(parameterization, names, deps, data=None, has_axis=False, check_fun=None):
     """Gather all quantities required to compute ``names`` given already computed data.
 
@@ -300,6 +376,18 @@ def _get_deps(parameterization, names, deps, data=None, has_axis=False, check_fu
 
     """
     p = _parse_parameterization(parameterization)
+    if not data:
+        # Nothing computed yet, so just look up the full dependencies.
+        full = "full_with_axis_dependencies" if has_axis else "full_dependencies"
+        for name in names:
+            if name in deps:
+                continue
+            for dep in [name] + data_index[p][name][full]["data"]:
+                if dep not in deps:
+                    if check_fun is not None:
+                        check_fun(dep)
+                    deps.add(dep)
+        return deps
     for name in names:
         if name not in deps and (data is None or name not in data):
             if check_fun is not None:
@@ -557,7 +645,7 @@ def get_transforms(
             transforms[c] = c_transform
         elif c == "B":  # used for Boozer transform
             transforms["B"] = Transform(
-                grid,
+                _get_boozer_grid(grid),
                 DoubleFourierSeries(
                     M=kwargs.get("M_booz", 2 * obj.M),
                     N=kwargs.get("N_booz", 2 * obj.N),
@@ -571,7 +659,7 @@ def get_transforms(
             )
         elif c == "w":  # used for Boozer transform
             transforms["w"] = Transform(
-                grid,
+                _get_boozer_grid(grid),
                 DoubleFourierSeries(
                     M=kwargs.get("M_booz", 2 * obj.M),
                     N=kwargs.get("N_booz", 2 * obj.N),
@@ -599,6 +687,13 @@ def get_transforms(
         elif c not in transforms:  # possible other stuff lumped in with transforms
             transforms[c] = getattr(obj, c)
 
+    if "B" in transforms and "w" in transforms:
+        # mapping between the modes of the Boozer transform, computed once here
+        # since the basis modes are not static under jit
+        transforms["w_mn_index"] = _get_w_mn_index(
+            transforms["B"].basis, transforms["w"].basis
+        )
+
     # now build them
     for t in transforms.values():
         if hasattr(t, "build"):
@@ -607,6 +702,55 @@ def get_transforms(
     return transforms
 
 
+def _get_surface_idx(grid):
+    """Indices of the nodes on each flux surface, shape(num_rho, num_nodes/num_rho).
+
+    Assumes each surface has the same number of nodes, ordered the same way.
+    """
+    if grid.num_rho == 1:
+        return jnp.arange(grid.num_nodes)[None]
+    return jnp.argsort(grid.inverse_rho_idx, stable=True).reshape((grid.num_rho, -1))
+
+
+def _get_boozer_grid(grid):
+    """Grid on a single flux surface for the Boozer transforms of each surface."""
+    if grid.num_rho == 1:
+        return grid
+    errorif(
+        np.any(np.bincount(grid.inverse_rho_idx) != grid.num_nodes // grid.num_rho),
+        ValueError,
+        "Boozer transform requires the same nodes on each flux surface.",
+    )
+    nodes = np.asarray(grid.nodes)[np.asarray(_get_surface_idx(grid))]
+    errorif(
+        not np.allclose(nodes[:, :, 1:], nodes[:1, :, 1:]),
+        ValueError,
+        "Boozer transform requires the same poloidal and toroidal nodes on each "
+        "flux surface.",
+    )
+    return Grid(nodes[0], NFP=grid.NFP, sort=False)
+
+
+def _get_w_mn_index(B_basis, w_basis):
+    """Mapping from the Boozer modes of B_theta, B_zeta to the modes of w.
+
+    Returns the index into B_theta_mn (where m != 0) or B_zeta_mn (where m == 0)
+    and the factor multiplying it for each mode of w, from eq 10 in Hirshman 1995.
+    Modes of w without a match have factor 0.
+    """
+    B_idx = {(m, n): i for i, (_, m, n) in enumerate(B_basis.modes)}
+    wm, wn = w_basis.modes[:, 1], w_basis.modes[:, 2]
+    idx = np.array(
+        [B_idx.get((-m, n) if m != 0 else (0, -n), -1) for m, n in zip(wm, wn)]
+    )
+    with np.errstate(divide="ignore"):
+        factor = np.where(
+            wm != 0, np.where(wn >= 0, 1, -1) / np.abs(wm), 1 / np.abs(w_basis.NFP * wn)
+        )
+    factor = np.where((idx >= 0) & ((wm != 0) | (wn != 0)), factor, 0)
+    return idx, factor
+
+
 def has_data_dependencies(parameterization, qty, data, axis=False):
     """Determine if we have the data needed to compute qty."""
     return _has_data(qty, data, parameterization) and (
@@ -749,7 +893,8 @@ def safenorm(x, ord=None, axis=None, fill=0, threshold=0):
     is_zero = (jnp.abs(x) <= threshold).all(axis=axis, keepdims=True)
     y = jnp.where(is_zero, jnp.ones_like(x), x)  # replace x with ones if is_zero
     n = jnp.linalg.norm(y, ord=ord, axis=axis)
-    n = jnp.where(is_zero.squeeze(), fill, n)  # replace norm with zero if is_zero
+    # replace norm with zero if is_zero
+    n = jnp.where(is_zero.squeeze(axis=axis), fill, n)
     return n
 
 
@@ -871,6 +1016,66 @@ def cumtrapz(y, x=None, dx=1.0, axis=-1, initial=None):
     return res
 
 
+def nufft2d1(x, y, c, M, N, eps=1e-12):
+    """Type 1 non-uniform fast Fourier transform in two dimensions.
+
+    Computes f[m, n] = sum_j c_j exp(-i (m x_j + n y_j)) for |m| <= M, |n| <= N
+    by spreading c onto a twice oversampled uniform grid with a Gaussian kernel,
+    taking the FFT and deconvolving the kernel [1]_. The kernel is separable, so the
+    spreading is a product of two sparse (num_points, grid size) matrices. This
+    avoids evaluating the num_points * (2M+1) * (2N+1) complex exponentials of the
+    direct sum and its memory, which also dominates forward mode derivatives.
+
+    Parameters
+    ----------
+    x, y : ndarray, shape(num_points,)
+        Coordinates of the points, periodic with period 2π.
+    c : ndarray, shape(num_points,)
+        Values at the points.
+    M, N : int
+        Maximum mode numbers in x and y.
+    eps : float
+        Requested relative accuracy.
+
+    Returns
+    -------
+    f : ndarray of complex, shape(2*M+1, 2*N+1)
+        Fourier sums, with m = -M, ..., M along the first axis and n = -N, ..., N
+        along the second.
+
+    References
+    ----------
+    .. [1] Greengard, L., & Lee, J. Y. (2004). Accelerating the nonuniform fast
+       Fourier transform. SIAM Review, 46(3), 443-454.
+
+    """
+    # half width of the kernel in grid points, about one per digit of accuracy
+    w = int(np.clip(np.ceil(-np.log10(eps)), 2, 16))
+    k = np.arange(-w + 1, w + 1)
+
+    def kernel(x, K):
+        # 1D Gaussian kernel weights and grid indices for each point
+        n = max(2 * K, 2 * w)  # oversampled grid size
+        tau = np.pi * w / (K**2 * (n / K) * (n / K - 0.5))
+        h = 2 * np.pi / n
+        i = jnp.floor(x / h).astype(int)[:, None] + k
+        weight = jnp.exp(-((x[:, None] - i * h) ** 2) / (4 * tau))
+        # correction for the convolution with the kernel in Fourier space
+        m = np.arange(-(K // 2), K // 2 + 1)
+        scale = np.sqrt(np.pi / tau) * np.exp(m**2 * tau) / n
+        return weight, i % n, n, m, scale
+
+    wx, ix, nx, m, sx = kernel(jnp.asarray(x), 2 * M + 1)
+    wy, iy, ny, n, sy = kernel(jnp.asarray(y), 2 * N + 1)
+    # the kernel is separable, so spreading is a product of two sparse matrices
+    j = jnp.arange(c.size)[:, None]
+    Wx = jnp.zeros((c.size, nx), dtype=wx.dtype).at[j, ix].add(wx)
+    Wy = jnp.zeros((c.size, ny), dtype=wy.dtype).at[j, iy].add(wy)
+    f = Wx.T @ (c[:, None] * Wy)
+    f = jnp.fft.fft2(f)[m[:, None], n]
+    return f * sx[:, None] * sy
+
+
 def _get_grid_surface(grid, surface_label):
     """Return grid quantities associated with the given surface label.
 
@@ -914,6 +1119,45 @@ def _get_grid_surface(grid, surface_label):
     return unique_size, inverse_idx, spacing, has_endpoint_dupe, has_idx
 
 
+def _get_grid_shape(grid):
+    """Return the shape to reshape nodes of a tensor-product grid into.
+
+    Parameters
+    ----------
+    grid : Grid
+        Collocation grid containing the nodes to evaluate at.
+
+    Returns
+    -------
+    shape : tuple of int or None
+        Shape such that ``grid.nodes.reshape(*shape, 3)`` iterates over a
+        single coordinate along each axis, or None if the grid is not known
+        to be a tensor-product grid.
+    axes : dict
+        Axis of ``shape`` along which each surface label varies.
+
+    """
+    if not all(
+        hasattr(grid, f"_{kind}_{label}_idx")
+        for kind in ("unique", "inverse")
+        for label in ("rho", "poloidal", "zeta")
+    ):
+        return None, {}
+    if grid.is_meshgrid:
+        shape = (grid.num_rho, grid.num_poloidal, grid.num_zeta)
+        axes = {"rho": 0, "poloidal": 1, "zeta": 2}
+    elif isinstance(grid, (LinearGrid, QuadratureGrid)):
+        # nodes are ordered with theta changing fastest, then rho, then zeta
+        shape = (grid.num_zeta, grid.num_rho, grid.num_poloidal)
+        axes = {"zeta": 0, "rho": 1, "poloidal": 2}
+    else:
+        return None, {}
+    if np.prod(shape) != grid.num_nodes:
+        # e.g. a LinearGrid with repeated rho values
+        return None, {}
+    return shape, axes
+
+
 def line_integrals(
     grid,
     q=jnp.array([1.0]),
@@ -1083,38 +1327,24 @@ def surface_integrals_map(grid, surface_label="rho", expand_out=True, tol=1e-14)
         grid, surface_label
     )
     spacing = jnp.prod(spacing, axis=1)
+    shape, axes = _get_grid_shape(grid)
+
+    if has_idx and shape is not None:
+        # On tensor-product grids the integral over each surface is a sum
+        # over the other two axes of the reshaped integrand.
+        axis = axes[surface_label]
+        sum_axes = tuple(i for i in range(3) if i != axis)
+
+        def _integrate(integrands):
+            integrands = integrands.reshape(shape + integrands.shape[1:])
+            return integrands.sum(axis=sum_axes)
+
+    elif has_idx:
+        # Otherwise each node is added to its surface with a segment sum,
+        # which is O(grid.num_nodes) in time and memory.
+        def _integrate(integrands):
+            return segment_sum(integrands, inverse_idx, num_segments=unique_size)
 
-    # Todo: Define mask as a sparse matrix once sparse matrices are no longer
-    #       experimental in jax.
-    if has_idx:
-        # The ith row of masks is True only at the indices which correspond to the
-        # ith surface. The integral over the ith surface is the dot product of the
-        # ith row vector and the integrand defined over all the surfaces.
-        mask = inverse_idx == jnp.arange(unique_size)[:, jnp.newaxis]
-        # Imagine a torus cross-section at zeta=π.
-        # A grid with a duplicate zeta=π node has 2 of those cross-sections.
-        #     In grid.py, we multiply by 1/n the areas of surfaces with
-        # duplicity n. This prevents the area of that surface from being
-        # double-counted, as surfaces with the same node value are combined
-        # into 1 integral, which sums their areas. Thus, if the zeta=π
-        # cross-section has duplicity 2, we ensure that the area on the zeta=π
-        # surface will have the correct total area of π+π = 2π.
-        #     An edge case exists if the duplicate surface has nodes with
-        # different values for the surface label, which only occurs when
-        # has_endpoint_dupe is true. If ``has_endpoint_dupe`` is true, this grid
-        # has a duplicate surface at surface_label=0 and
-        # surface_label=max surface value. Although the modulo of these values
-        # are equal, their numeric values are not, so the integration
-        # would treat them as different surfaces. We solve this issue by
-        # combining the indices corresponding to the integrands of the duplicated
-        # surface, so that the duplicate surface is treated as one, like in the
-        # previous paragraph.
-        mask = cond(
-            has_endpoint_dupe,
-            lambda _: put(mask, jnp.array([0, -1]), mask[0] | mask[-1]),
-            lambda _: mask,
-            operand=None,
-        )
     else:
         # If we don't have the idx attributes, we are forced to expand out.
         errorif(
@@ -1136,6 +1366,34 @@ def surface_integrals_map(grid, surface_label="rho", expand_out=True, tol=1e-14)
         # The above implementation was benchmarked to be more efficient than
         # alternatives with explicit loops in GitHub pull request #934.
 
+        def _integrate(integrands):
+            return jnp.tensordot(mask, integrands, axes=1)
+
+    def _merge_endpoint_dupe(integrals):
+        # Imagine a torus cross-section at zeta=π.
+        # A grid with a duplicate zeta=π node has 2 of those cross-sections.
+        #     In grid.py, we multiply by 1/n the areas of surfaces with
+        # duplicity n. This prevents the area of that surface from being
+        # double-counted, as surfaces with the same node value are combined
+        # into 1 integral, which sums their areas. Thus, if the zeta=π
+        # cross-section has duplicity 2, we ensure that the area on the zeta=π
+        # surface will have the correct total area of π+π = 2π.
+        #     An edge case exists if the duplicate surface has nodes with
+        # different values for the surface label, which only occurs when
+        # has_endpoint_dupe is true. If ``has_endpoint_dupe`` is true, this grid
+        # has a duplicate surface at surface_label=0 and
+        # surface_label=max surface value. Although the modulo of these values
+        # are equal, their numeric values are not, so the integration
+        # would treat them as different surfaces. We solve this issue by
+        # combining the integrals of the duplicated surface, so that the
+        # duplicate surface is treated as one, like in the previous paragraph.
+        return cond(
+            has_endpoint_dupe,
+            lambda _: put(integrals, jnp.array([0, -1]), integrals[0] + integrals[-1]),
+            lambda _: integrals,
+            operand=None,
+        )
+
     def integrate(q=jnp.array([1.0])):
         """Compute a surface integral for each surface in the grid.
 
@@ -1161,7 +1419,9 @@ def surface_integrals_map(grid, surface_label="rho", expand_out=True, tol=1e-14)
 
         """
         integrands = (spacing * jnp.nan_to_num(q).T).T
-        integrals = jnp.tensordot(mask, integrands, axes=1)
+        integrals = _integrate(integrands)
+        if has_idx:
+            integrals = _merge_endpoint_dupe(integrals)
         return grid.expand(integrals, surface_label) if expand_out else integrals
 
     return integrate
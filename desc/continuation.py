@@ -1,12 +1,15 @@
 """Functions for solving for equilibria with multigrid continuation method."""
 
 import copy
+import functools
+import os
 import warnings
 
 import numpy as np
 from termcolor import colored
 
 from desc.equilibrium import EquilibriaFamily, Equilibrium
+from desc.io import load
 from desc.objectives import get_equilibrium_objective, get_fixed_boundary_constraints
 from desc.optimize import Optimizer
 from desc.perturbations import get_deltas
@@ -15,6 +18,13 @@ from desc.utils import Timer, errorif
 MIN_MRES_STEP = 1
 MIN_PRES_STEP = 0.1
 MIN_BDRY_STEP = 0.05
+# ratios within this of a whole number of steps are rounded to it
+_RATIO_TOL = 1e-6
+# adaptive steps are shrunk before solving if the perturbed residual is this many
+# times larger than predicted from the previous step
+_PRED_TOL = 4
+# adaptive steps grow or shrink to aim for solves taking this many iterations
+_TARGET_NIT = 10
 
 
 def _solve_axisym(
@@ -29,8 +39,12 @@ def _solve_axisym(
     maxiter=100,
     verbose=1,
     checkpoint_path=None,
+    eqfam=None,
 ):
-    """Solve initial axisymmetric case with adaptive step sizing."""
+    """Solve initial axisymmetric case with adaptive step sizing.
+
+    If eqfam is given, continues increasing the resolution from its last member.
+    """
     timer = Timer()
 
     surface = eq.surface
@@ -75,9 +89,16 @@ def _solve_axisym(
     if not isinstance(optimizer, Optimizer):
         optimizer = Optimizer(optimizer)
 
-    eqfam = EquilibriaFamily()
+    if eqfam is None or len(eqfam) == 0:
+        eqfam_temp = None
+        eqfam = EquilibriaFamily()
+        ii = 0
+    else:
+        eqfam_temp = eqfam.copy()
+        # skip the steps that were already done
+        Mi = eqfam[-1].M
+        ii = max(mres_steps - int(np.ceil((M - Mi) / mres_step)), 1)
 
-    ii = 0
     stop = False
     while ii < mres_steps and not stop:
         timer.start("Iteration {} total".format(ii + 1))
@@ -146,7 +167,7 @@ def _solve_axisym(
         if checkpoint_path is not None:
             if verbose > 0:
                 print("Saving latest iteration")
-            eqfam.save(checkpoint_path)
+            eqfam.save(checkpoint_path, file_mode="a")
         timer.stop("Iteration {} total".format(ii + 1))
         if verbose > 1:
             timer.disp("Iteration {} total".format(ii + 1))
@@ -178,6 +199,7 @@ def _solve_axisym(
                 maxiter,
                 verbose,
                 checkpoint_path,
+                eqfam_temp,
             )
 
     return eqfam
@@ -205,23 +227,25 @@ def _add_pressure(
     # make sure its at full radial/poloidal resolution
     eqi.change_resolution(L=eq.L, M=eq.M, L_grid=eq.L_grid, M_grid=eq.M_grid)
 
+    # start from the pressure of the last equilibrium, which may be partway
+    # there when resuming from a checkpoint
+    pres_ratio = _get_ratio(eqi.pressure, eq.pressure)
     pres_steps = (
         0
         if (abs(eq.pressure(np.linspace(0, 1, 20))) < 1e-14).all() or pres_step == 0
-        else int(np.ceil(1 / pres_step))
+        else int(np.ceil((1 - pres_ratio) / pres_step - _RATIO_TOL))
     )
-    pres_ratio = 0 if pres_steps else 1
+    pres_ratio = pres_ratio if pres_steps else 1
 
     ii = len(eqfam_temp)
     stop = False
     while ii - len(eqfam_temp) < pres_steps and not stop:
         timer.start("Iteration {} total".format(ii + 1))
         # increase pressure
-        deltas = get_deltas(
-            {"pressure": eqfam_temp[-1].pressure}, {"pressure": eq.pressure}
-        )
-        deltas["p_l"] *= pres_step
-        pres_ratio += pres_step
+        step = min(pres_step, 1 - pres_ratio)
+        deltas = get_deltas({"pressure": eqi.pressure}, {"pressure": eq.pressure})
+        deltas["p_l"] *= step / (1 - pres_ratio)
+        pres_ratio += step
 
         constraints_i = get_fixed_boundary_constraints(eq=eqi)
         objective_i = get_equilibrium_objective(eq=eqi, mode=objective)
@@ -272,7 +296,7 @@ def _add_pressure(
         if checkpoint_path is not None:
             if verbose > 0:
                 print("Saving latest iteration")
-            eqfam.save(checkpoint_path)
+            eqfam.save(checkpoint_path, file_mode="a")
         timer.stop("Iteration {} total".format(ii + 1))
         if verbose > 1:
             timer.disp("Iteration {} total".format(ii + 1))
@@ -333,24 +357,28 @@ def _add_shaping(
     # make sure its at full resolution
     eqi.change_resolution(eq.L, eq.M, eq.N, eq.L_grid, eq.M_grid, eq.N_grid)
 
-    bdry_steps = 0 if eq.N == 0 or bdry_step == 0 else int(np.ceil(1 / bdry_step))
-    bdry_ratio = 0 if eq.N else 1
-
-    surf_axisym = eq.surface.copy()
-    surf_axisym.change_resolution(eq.L, eq.M, 0)
-    surf_axisym.change_resolution(eq.L, eq.M, eq.N)
+    # start from the shaping of the last equilibrium, which may be partway
+    # there when resuming from a checkpoint
+    bdry_ratio = _get_ratio(eqi.surface, eq.surface)
+    bdry_steps = (
+        0
+        if eq.N == 0 or bdry_step == 0
+        else int(np.ceil((1 - bdry_ratio) / bdry_step - _RATIO_TOL))
+    )
+    bdry_ratio = bdry_ratio if bdry_steps else 1
 
     ii = len(eqfam_temp)
     stop = False
     while ii - len(eqfam_temp) < bdry_steps and not stop:
         timer.start("Iteration {} total".format(ii + 1))
         # increase shaping
-        deltas = get_deltas({"surface": surf_axisym}, {"surface": eq.surface})
+        step = min(bdry_step, 1 - bdry_ratio)
+        deltas = get_deltas({"surface": eqi.surface}, {"surface": eq.surface})
         if "Rb_lmn" in deltas:
-            deltas["Rb_lmn"] *= bdry_step
+            deltas["Rb_lmn"] *= step / (1 - bdry_ratio)
         if "Zb_lmn" in deltas:
-            deltas["Zb_lmn"] *= bdry_step
-        bdry_ratio += bdry_step
+            deltas["Zb_lmn"] *= step / (1 - bdry_ratio)
+        bdry_ratio += step
 
         constraints_i = get_fixed_boundary_constraints(eq=eqi)
         objective_i = get_equilibrium_objective(eq=eqi, mode=objective)
@@ -401,7 +429,7 @@ def _add_shaping(
         if checkpoint_path is not None:
             if verbose > 0:
                 print("Saving latest iteration")
-            eqfam.save(checkpoint_path)
+            eqfam.save(checkpoint_path, file_mode="a")
         timer.stop("Iteration {} total".format(ii + 1))
         if verbose > 1:
             timer.disp("Iteration {} total".format(ii + 1))
@@ -440,6 +468,155 @@ def _add_shaping(
     return eqfam
 
 
+def _add_adaptive(  # noqa: C901
+    eq,
+    eqfam,
+    step,
+    objective="force",
+    optimizer="lsq-exact",
+    pert_order=2,
+    ftol=None,
+    xtol=None,
+    gtol=None,
+    maxiter=100,
+    verbose=1,
+    checkpoint_path=None,
+    name="pressure",
+):
+    """Add pressure or 3D shaping with step sizes chosen from the solver progress.
+
+    The residual after perturbing is compared to the one predicted from the previous
+    step, which grows like step**(pert_order+1), and steps that are much harder than
+    predicted are shrunk before solving. The next step then grows or shrinks depending
+    on the number of iterations the solve took. Failed steps are retried from the last
+    good equilibrium with half the step size instead of restarting the stage.
+    """
+    timer = Timer()
+
+    eqi = eqfam[-1].copy()
+    if name == "pressure":
+        # make sure its at full radial/poloidal resolution
+        eqi.change_resolution(L=eq.L, M=eq.M, L_grid=eq.L_grid, M_grid=eq.M_grid)
+        min_step = MIN_PRES_STEP
+        step_name = "pres_step"
+        skip = (abs(eq.pressure(np.linspace(0, 1, 20))) < 1e-14).all()
+    else:
+        # make sure its at full resolution
+        eqi.change_resolution(eq.L, eq.M, eq.N, eq.L_grid, eq.M_grid, eq.N_grid)
+        min_step = MIN_BDRY_STEP
+        step_name = "bdry_step"
+        skip = eq.N == 0
+    ratio = (
+        1 if skip or step == 0 else _get_ratio(getattr(eqi, name), getattr(eq, name))
+    )
+    target_nit = max(min(_TARGET_NIT, maxiter // 2), 1)
+    res_prev = step_prev = None
+
+    ii = len(eqfam)
+    while 1 - ratio > _RATIO_TOL:
+        timer.start("Iteration {} total".format(ii + 1))
+        step = min(step, 1 - ratio)
+        if 1 - ratio - step < min_step:
+            # don't leave a tiny step for the end
+            step = 1 - ratio
+        deltas = get_deltas({name: getattr(eqi, name)}, {name: getattr(eq, name)})
+        deltas = {key: val * step / (1 - ratio) for key, val in deltas.items()}
+
+        eqp = eqi.copy()
+        constraints_i = get_fixed_boundary_constraints(eq=eqp)
+        objective_i = get_equilibrium_objective(eq=eqp, mode=objective)
+
+        if verbose:
+            _print_iteration_summary(
+                ii,
+                None,
+                eqp,
+                0 if name == "pressure" else ratio + step,
+                ratio + step if name == "pressure" else 1,
+                1,
+                pert_order,
+                objective_i,
+                optimizer,
+            )
+
+        if len(deltas) > 0:
+            if verbose > 0:
+                print("Perturbing equilibrium")
+            eqp.perturb(
+                objective=objective_i,
+                constraints=constraints_i,
+                deltas=deltas,
+                order=pert_order,
+                verbose=verbose,
+                copy=False,
+            )
+        res = np.linalg.norm(objective_i.compute_scaled_error(objective_i.x(eqp)))
+
+        if res_prev is not None and step > min_step:
+            res_pred = res_prev * max(step / step_prev, 1) ** (pert_order + 1)
+            if res > _PRED_TOL * res_pred:
+                step = max(step * (res_pred / res) ** (1 / (pert_order + 1)), min_step)
+                if verbose > 0:
+                    print(
+                        "Residual {:10.3e} is larger than predicted {:10.3e}, ".format(
+                            res, res_pred
+                        )
+                        + "reducing {} to {:.4f}".format(step_name, step)
+                    )
+                timer.stop("Iteration {} total".format(ii + 1))
+                continue
+
+        result = None
+        if eqp.is_nested():
+            _, result = eqp.solve(
+                optimizer=optimizer,
+                objective=objective_i,
+                constraints=constraints_i,
+                ftol=ftol,
+                xtol=xtol,
+                gtol=gtol,
+                verbose=verbose,
+                maxiter=maxiter,
+            )
+        timer.stop("Iteration {} total".format(ii + 1))
+        if verbose > 1:
+            timer.disp("Iteration {} total".format(ii + 1))
+
+        if result is None or not eqp.is_nested():
+            if step <= min_step:
+                raise RuntimeError(
+                    "Automatic continuation failed with "
+                    + f"{step_name}={step}, something is probably very wrong with "
+                    + "your desired equilibrium."
+                )
+            warnings.warn(
+                colored(
+                    "WARNING: Automatic continuation failed with "
+                    + f"{step_name}={step}, retrying with {step_name}="
+                    + f"{max(step / 2, min_step)}",
+                    "yellow",
+                )
+            )
+            step = max(step / 2, min_step)
+            continue
+
+        eqfam.append(eqp)
+        eqi = eqp
+        ratio += step
+        res_prev, step_prev = res, step
+        # grow the step if the solve was easy, shrink it if not
+        nit = result.get("nit", target_nit) if result["success"] else 2 * target_nit
+        step *= np.clip(target_nit / max(nit, 1), 1 / 2, 2)
+
+        if checkpoint_path is not None:
+            if verbose > 0:
+                print("Saving latest iteration")
+            eqfam.save(checkpoint_path, file_mode="a")
+        ii += 1
+
+    return eqfam
+
+
 def solve_continuation_automatic(  # noqa: C901
     eq,
     objective="force",
@@ -451,6 +628,7 @@ def solve_continuation_automatic(  # noqa: C901
     maxiter=100,
     verbose=1,
     checkpoint_path=None,
+    resume=False,
     **kwargs,
 ):
     """Solve for an equilibrium using an automatic continuation method.
@@ -482,6 +660,11 @@ def solve_continuation_automatic(  # noqa: C901
         * 3: as above plus detailed solver output
     checkpoint_path : str or path-like
         file to save checkpoint data (Default value = None)
+    resume : bool
+        If True and ``checkpoint_path`` exists from a previous (interrupted) run for
+        the same equilibrium, continue from the last equilibrium saved there instead
+        of starting over. Saved steps that don't lead to ``eq``, or that aren't
+        nested, are discarded.
     **kwargs : dict, optional
         * ``mres_step``: int, default 6. The amount to increase Mpol by at each
           continuation step
@@ -489,6 +672,12 @@ def solve_continuation_automatic(  # noqa: C901
           increase pres_ratio by at each continuation step
         * ``bdry_step``: float, ``0<=bdry_step<=1``, default 0.25. The amount to
           increase bdry_ratio by at each continuation step
+        * ``adaptive``: bool, default False. Whether to choose the pressure and
+          shaping steps adaptively, starting from ``pres_step`` and ``bdry_step``.
+          Steps are shrunk before solving if the residual after the perturbation is
+          much larger than predicted from the previous step, and grown after solves
+          that converge in few iterations. Failed steps are retried from the last
+          converged equilibrium instead of restarting the pressure or shaping stage.
 
     Returns
     -------
@@ -513,28 +702,39 @@ def solve_continuation_automatic(  # noqa: C901
     mres_step = kwargs.pop("mres_step", 6)
     pres_step = kwargs.pop("pres_step", 1 / 2)
     bdry_step = kwargs.pop("bdry_step", 1 / 4)
+    adaptive = kwargs.pop("adaptive", False)
     assert len(kwargs) == 0, "Got an unexpected kwarg {}".format(kwargs.keys())
     if not isinstance(optimizer, Optimizer):
         optimizer = Optimizer(optimizer)
 
-    eqfam = _solve_axisym(
-        eq,
-        mres_step,
-        objective,
-        optimizer,
-        pert_order,
-        ftol,
-        xtol,
-        gtol,
-        maxiter,
-        verbose,
-        checkpoint_path,
-    )
+    eqfam = _load_checkpoint(eq, checkpoint_path, verbose) if resume else None
+
+    if adaptive:
+        add_pressure = functools.partial(_add_adaptive, name="pressure")
+        add_shaping = functools.partial(_add_adaptive, name="surface")
+    else:
+        add_pressure, add_shaping = _add_pressure, _add_shaping
+
+    if eqfam is None or eqfam[-1].M < eq.M:
+        eqfam = _solve_axisym(
+            eq,
+            mres_step,
+            objective,
+            optimizer,
+            pert_order,
+            ftol,
+            xtol,
+            gtol,
+            maxiter,
+            verbose,
+            checkpoint_path,
+            eqfam,
+        )
 
     # for zero current we want to do shaping before pressure to avoid having a
     # tokamak with zero current but finite pressure (non-physical)
     if eq.current is not None and np.all(eq.current(np.linspace(0, 1, 20)) == 0):
-        eqfam = _add_shaping(
+        eqfam = add_shaping(
             eq,
             eqfam,
             bdry_step,
@@ -549,7 +749,7 @@ def solve_continuation_automatic(  # noqa: C901
             checkpoint_path,
         )
 
-        eqfam = _add_pressure(
+        eqfam = add_pressure(
             eq,
             eqfam,
             pres_step,
@@ -567,7 +767,7 @@ def solve_continuation_automatic(  # noqa: C901
     # for other cases such as fixed iota or nonzero current we do pressure first
     # since its cheaper to do it without the 3d modes
     else:
-        eqfam = _add_pressure(
+        eqfam = add_pressure(
             eq,
             eqfam,
             pres_step,
@@ -582,7 +782,7 @@ def solve_continuation_automatic(  # noqa: C901
             checkpoint_path,
         )
 
-        eqfam = _add_shaping(
+        eqfam = add_shaping(
             eq,
             eqfam,
             bdry_step,
@@ -607,7 +807,7 @@ def solve_continuation_automatic(  # noqa: C901
     if checkpoint_path is not None:
         if verbose > 0:
             print("Output written to {}".format(checkpoint_path))
-        eqfam.save(checkpoint_path)
+        eqfam.save(checkpoint_path, file_mode="a")
     if verbose:
         print("====================")
 
@@ -771,7 +971,7 @@ def solve_continuation(  # noqa: C901
         if checkpoint_path is not None:
             if verbose > 0:
                 print("Saving latest iteration")
-            eqfam.save(checkpoint_path)
+            eqfam.save(checkpoint_path, file_mode="a")
         timer.stop("Iteration {} total".format(ii + 1))
         if verbose > 1:
             timer.disp("Iteration {} total".format(ii + 1))
@@ -786,12 +986,108 @@ def solve_continuation(  # noqa: C901
     if checkpoint_path is not None:
         if verbose > 0:
             print("Output written to {}".format(checkpoint_path))
-        eqfam.save(checkpoint_path)
+        eqfam.save(checkpoint_path, file_mode="a")
     if verbose:
         print("====================")
     return eqfam
 
 
+def _load_checkpoint(eq, checkpoint_path, verbose=1):
+    """Load the steps towards eq saved by a previous automatic continuation.
+
+    Returns None if there is nothing usable to resume from.
+    """
+    if checkpoint_path is None or not os.path.exists(checkpoint_path):
+        return None
+    try:
+        saved = load(checkpoint_path)
+    except (OSError, KeyError, ValueError) as e:
+        warnings.warn(
+            colored(
+                f"WARNING: Could not read checkpoint {checkpoint_path} ({e}), "
+                + "starting continuation from scratch",
+                "yellow",
+            )
+        )
+        return None
+    if isinstance(saved, Equilibrium):
+        saved = [saved]
+    if not isinstance(saved, EquilibriaFamily) and not isinstance(saved, list):
+        return None
+
+    eqfam = EquilibriaFamily()
+    for eqi in saved:
+        if not isinstance(eqi, Equilibrium) or not _is_continuation_step(eqi, eq):
+            break
+        eqfam.append(eqi)
+    # the last steps may have been saved right before backtracking
+    while len(eqfam) and not eqfam[-1].is_nested():
+        eqfam.pop()
+
+    if not len(eqfam):
+        warnings.warn(
+            colored(
+                f"WARNING: Checkpoint {checkpoint_path} has no steps towards the "
+                + "desired equilibrium, starting continuation from scratch",
+                "yellow",
+            )
+        )
+        return None
+    if verbose > 0:
+        print("====================")
+        print(
+            "Resuming from step {} of {}: M={}, N={}, ".format(
+                len(eqfam), checkpoint_path, eqfam[-1].M, eqfam[-1].N
+            )
+            + "pres_ratio={:.4f}, bdry_ratio={:.4f}".format(
+                _get_ratio(eqfam[-1].pressure, eq.pressure),
+                _get_ratio(eqfam[-1].surface, eq.surface) if eqfam[-1].N else 0,
+            )
+        )
+        print("====================")
+    return eqfam
+
+
+def _is_continuation_step(eqi, eq):
+    """Whether eqi could be an intermediate step of the automatic continuation."""
+    if (
+        eqi.NFP != eq.NFP
+        or eqi.sym != eq.sym
+        or eqi.spectral_indexing != eq.spectral_indexing
+        or not np.isclose(eqi.Psi, eq.Psi)
+        or eqi.M > eq.M
+        or eqi.N > eq.N
+    ):
+        return False
+    # iota/current are held fixed during the continuation
+    for name in ["iota", "current"]:
+        profi, prof = getattr(eqi, name), getattr(eq, name)
+        if (profi is None) != (prof is None):
+            return False
+        if prof is not None and (
+            profi.params.shape != prof.params.shape
+            or not np.allclose(profi.params, prof.params)
+        ):
+            return False
+    # pressure and non-axisymmetric boundary modes are scaled from the target
+    if eqi.pressure.params.shape != eq.pressure.params.shape:
+        return False
+    pres_ratio = _get_ratio(eqi.pressure, eq.pressure)
+    if not np.allclose(eqi.pressure.params, pres_ratio * eq.pressure.params):
+        return False
+    surf = eq.surface.copy()
+    surf.change_resolution(eqi.surface.L, eqi.surface.M, eqi.surface.N)
+    bdry_ratio = _get_ratio(eqi.surface, surf) if eqi.N else 0
+    for basis, xi, x in [
+        (surf.R_basis, eqi.surface.R_lmn, surf.R_lmn),
+        (surf.Z_basis, eqi.surface.Z_lmn, surf.Z_lmn),
+    ]:
+        x = np.where(basis.modes[:, 2] != 0, bdry_ratio * x, x)
+        if xi.shape != x.shape or not np.allclose(xi, x, atol=1e-10):
+            return False
+    return True
+
+
 def _get_ratio(thing1, thing2):
     """Figure out bdry_ratio, pres_ratio etc from objects."""
     if thing1 is None or thing2 is None:
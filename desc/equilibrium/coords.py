@@ -596,12 +596,15 @@ def to_sfl(
     theta = grid.nodes[:, 1]
     vartheta = theta + toroidal_coords["lambda"]
     sfl_grid = grid
+    # grid arrays are shared with other grids of the same resolution
+    sfl_grid._nodes = grid.nodes.copy()
     sfl_grid.nodes[:, 1] = vartheta
 
     bdry_coords = eq.compute(["R", "Z", "lambda"], grid=bdry_grid)
     bdry_theta = bdry_grid.nodes[:, 1]
     bdry_vartheta = bdry_theta + bdry_coords["lambda"]
     bdry_sfl_grid = bdry_grid
+    bdry_sfl_grid._nodes = bdry_grid.nodes.copy()
     bdry_sfl_grid.nodes[:, 1] = bdry_vartheta
 
     if copy:
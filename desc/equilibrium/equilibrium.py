@@ -2357,6 +2357,7 @@ class EquilibriaFamily(IOAble, MutableSequence):
         maxiter=100,
         verbose=1,
         checkpoint_path=None,
+        resume=False,
         **kwargs,
     ):
         """Solve for an equilibrium using an automatic continuation method.
@@ -2388,6 +2389,10 @@ class EquilibriaFamily(IOAble, MutableSequence):
             * 3: as above plus detailed solver output
         checkpoint_path : str or path-like
             file to save checkpoint data (Default value = None)
+        resume : bool
+            If True and ``checkpoint_path`` exists from a previous (interrupted) run
+            for the same equilibrium, continue from the last equilibrium saved there
+            instead of starting over.
         **kwargs : dict, optional
             * ``mres_step``: int, default 6. The amount to increase Mpol by at each
               continuation step
@@ -2395,6 +2400,10 @@ class EquilibriaFamily(IOAble, MutableSequence):
               increase pres_ratio by at each continuation step
             * ``bdry_step``: float, ``0<=bdry_step<=1``, default 0.25. The amount to
               increase bdry_ratio by at each continuation step
+            * ``adaptive``: bool, default False. Whether to choose the pressure and
+              shaping steps adaptively, starting from ``pres_step`` and
+              ``bdry_step``, based on the residual after each perturbation and the
+              number of iterations of each solve.
 
         Returns
         -------
@@ -2416,6 +2425,7 @@ class EquilibriaFamily(IOAble, MutableSequence):
             maxiter,
             verbose,
             checkpoint_path,
+            resume,
             **kwargs,
         )
 
@@ -51,7 +51,8 @@ def get(name, data=None):
     path = here + "/" + h5s[idx]
     assert os.path.exists(path)
 
-    eqf = desc.io.load(path)
+    # only the final equilibrium is needed unless all are requested
+    eqf = desc.io.load(path, lazy=data != "all")
 
     if data is None:
         return eqf[-1]
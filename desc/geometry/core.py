@@ -483,6 +483,7 @@ class Surface(IOAble, Optimizable, ABC):
                 )
             elif hasattr(self, "zeta"):  # constant zeta surface
                 grid = QuadratureGrid(L=2 * self.L + 5, M=2 * self.M + 5, N=0, NFP=1)
+                grid._nodes = grid.nodes.copy()
                 grid._nodes[:, 2] = self.zeta
         elif not isinstance(grid, _Grid):
             raise TypeError(
@@ -538,6 +539,7 @@ class Surface(IOAble, Optimizable, ABC):
                 calc0d = False
             else:
                 grid0d = QuadratureGrid(L=2 * self.L + 5, M=2 * self.M + 5, N=0, NFP=1)
+                grid0d._nodes = grid0d.nodes.copy()
                 grid0d._nodes[:, 2] = self.zeta
 
         if calc0d and override_grid:
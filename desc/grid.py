@@ -1,6 +1,10 @@
 """Classes for representing flux coordinates."""
 
+import functools
+import inspect
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 import numpy as np
 from scipy import optimize, special
@@ -19,6 +23,65 @@ __all__ = [
 ]
 
 
+# maximum number of grids whose nodes, spacing, weights etc. are kept for reuse
+GRID_CACHE_SIZE = 32
+_grid_cache = OrderedDict()
+_grid_cache_lock = threading.Lock()
+
+
+def _hashable_arg(x):
+    """Return a hashable key for a grid constructor argument."""
+    if x is None or isinstance(x, (str, bool, int, float)):
+        return type(x).__name__, x
+    x = np.asarray(x)
+    errorif(x.dtype == object, TypeError)
+    return x.dtype.str, x.shape, x.tobytes()
+
+
+def _cached_grid(init):
+    """Reuse the arrays of previously constructed grids with the same arguments.
+
+    The attributes of each new grid are computed once and stored in an LRU cache
+    of size ``GRID_CACHE_SIZE`` keyed by the class and constructor arguments.
+    Later grids with the same arguments get a shallow copy of those attributes,
+    so the node, spacing, weight, and index arrays are shared between them and
+    are made read-only.
+    """
+    signature = inspect.signature(init)
+
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        try:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (type(self),) + tuple(
+                (name, _hashable_arg(val))
+                for name, val in bound.arguments.items()
+                if name != "self"
+            )
+        except Exception:
+            # e.g. traced or unusual arguments, just don't cache
+            return init(self, *args, **kwargs)
+
+        with _grid_cache_lock:
+            cached = _grid_cache.get(key)
+            if cached is not None:
+                _grid_cache.move_to_end(key)
+        if cached is not None:
+            self.__dict__.update(cached)
+            return
+        init(self, *args, **kwargs)
+        for val in self.__dict__.values():
+            if isinstance(val, np.ndarray):
+                val.flags.writeable = False
+        with _grid_cache_lock:
+            _grid_cache[key] = dict(self.__dict__)
+            while len(_grid_cache) > GRID_CACHE_SIZE:
+                _grid_cache.popitem(last=False)
+
+    return wrapper
+
+
 class _Grid(IOAble, ABC):
     """Base class for collocation grids."""
 
@@ -119,9 +182,10 @@ class _Grid(IOAble, ABC):
 
         # Scale up all nodes so that their spacing accounts for the node
         # that is their reflection across the symmetry line.
-        self._spacing[off_sym_line_idx, 1] *= scale
+        spacing = self.spacing.copy()
+        spacing[off_sym_line_idx, 1] *= scale
         self._nodes = self.nodes[~to_delete_idx]
-        self._spacing = self.spacing[~to_delete_idx]
+        self._spacing = spacing[~to_delete_idx]
 
     def _sort_nodes(self):
         """Sort nodes for use with FFT."""
@@ -885,6 +949,7 @@ class LinearGrid(_Grid):
         Note that if supplied the values may be reordered in the resulting grid.
     """
 
+    @_cached_grid
     def __init__(
         self,
         L=None,
@@ -1192,6 +1257,7 @@ class QuadratureGrid(_Grid):
 
     """
 
+    @_cached_grid
     def __init__(self, L, M, N, NFP=1):
         self._L = check_nonnegint(L, "L", False)
         self._M = check_nonnegint(M, "N", False)
@@ -1333,6 +1399,7 @@ class ConcentricGrid(_Grid):
 
     """
 
+    @_cached_grid
     def __init__(self, L, M, N, NFP=1, sym=False, axis=False, node_pattern="jacobi"):
         self._L = check_nonnegint(L, "L", False)
         self._M = check_nonnegint(M, "M", False)
@@ -1516,6 +1583,12 @@ def _round(x, tol):
     return x
 
 
+def _round_array(x, tol):
+    # vectorized version of _round
+    x = np.asarray(x)
+    return np.where((np.abs(x % 1) < tol) | (np.abs((x % 1) - 1) < tol), np.round(x), x)
+
+
 def dec_to_cf(x, dmax=20, itol=1e-14):
     """Compute continued fraction form of a number.
 
@@ -1569,56 +1642,89 @@ def cf_to_dec(cf):
         return cf[0] + 1 / cf_to_dec(cf[1:])
 
 
-def most_rational(a, b, itol=1e-14):
+@functools.lru_cache
+def _farey_table(max_denominator):
+    """Reduced fractions p/q in [0, 1] with q ≤ max_denominator, simplest first.
+
+    The fractions are sorted by denominator and then numerator, so the first
+    entry in a sub-interval of [0, 1] is the node of the Stern-Brocot tree
+    closest to the root, i.e. the most rational number in the interval.
+    """
+    p, q = np.meshgrid(
+        np.arange(max_denominator + 1), np.arange(1, max_denominator + 1)
+    )
+    mask = (p <= q) & (np.gcd(p, q) == 1)
+    return p[mask] / q[mask]
+
+
+def _most_rational_cf(a, b):
+    """Most rational number in [a,b] from continued fractions for 0 < a < b."""
+    a_cf = dec_to_cf(a)
+    b_cf = dec_to_cf(b)
+    # first index of dissimilar digits
+    for idx in range(min(a_cf.size, b_cf.size)):
+        if a_cf[idx] != b_cf[idx]:
+            break
+    else:
+        # one continued fraction is a truncation of the other
+        idx = min(a_cf.size, b_cf.size)
+    f = 1
+    while True:
+        dec = cf_to_dec(np.append(a_cf[0:idx], f))
+        if a <= dec <= b:
+            return dec
+        f += 1
+
+
+def most_rational(a, b, itol=1e-14, max_denominator=100):
     """Compute the most rational number in the range [a,b].
 
     Parameters
     ----------
-    a,b : float
-        lower and upper bounds
+    a,b : float or ndarray
+        lower and upper bounds. Arrays compute the most rational number in
+        each interval [a[i], b[i]] at once.
     itol : float, optional
         tolerance for rounding float to nearest int
+    max_denominator : int, optional
+        largest denominator in the cached table of fractions. Intervals that
+        contain none of those fractions fall back to a continued fraction search.
 
     Returns
     -------
-    x : float
+    x : float or ndarray
         most rational number between [a,b]
 
     """
-    a = float(_round(a, itol))
-    b = float(_round(b, itol))
+    scalar = np.ndim(a) == 0 and np.ndim(b) == 0
+    a, b = np.broadcast_arrays(
+        *(_round_array(np.atleast_1d(x).astype(float), itol) for x in (a, b))
+    )
+    # ensure a < b and handle negative ranges
+    a, b = np.minimum(a, b), np.maximum(a, b)
+    s = np.where(b < 0, -1, 1)
+    a, b = np.where(s < 0, -b, a), np.where(s < 0, -a, b)
+
+    # smallest integer in range, if there is one
+    out = np.where(np.ceil(a) <= b, np.ceil(a), np.nan)
     # handle empty range
-    if a == b:
-        return a
-    # ensure a < b
-    elif a > b:
-        c = a
-        a = b
-        b = c
+    out = np.where(a == b, a, out)
     # return 0 if in range
-    if np.sign(a * b) <= 0:
-        return 0
-    # handle negative ranges
-    elif np.sign(a) < 0:
-        s = -1
-        a *= -1
-        b *= -1
-    else:
-        s = 1
+    out = np.where(a * b <= 0, 0.0, out)
 
-    a_cf = dec_to_cf(a)
-    b_cf = dec_to_cf(b)
-    idx = 0  # first index of dissimilar digits
-    for i in range(min(a_cf.size, b_cf.size)):
-        if a_cf[i] != b_cf[i]:
-            idx = i
-            break
-    f = 1
-    while True:
-        dec = cf_to_dec(np.append(a_cf[0:idx], f))
-        if a <= dec <= b:
-            return dec * s
-        f += 1
+    # otherwise, the first fraction in the table that is in range
+    todo = np.flatnonzero(np.isnan(out))
+    if todo.size:
+        m = np.floor(a[todo, np.newaxis])
+        x = m + _farey_table(max_denominator)
+        in_range = (a[todo, np.newaxis] <= x) & (x <= b[todo, np.newaxis])
+        found = in_range.any(axis=1)
+        out[todo] = np.where(found, x[np.arange(todo.size), in_range.argmax(axis=1)], 0)
+        for i in todo[~found]:
+            out[i] = _most_rational_cf(a[i], b[i])
+
+    out = s * out
+    return float(out[0]) if scalar else out
 
 
 def n_most_rational(a, b, n, eps=1e-12, itol=1e-14):
@@ -1649,33 +1755,54 @@ def n_most_rational(a, b, n, eps=1e-12, itol=1e-14):
     # rational in the largest sub-interval
     out = []
     intervals = np.array(sorted([a, b]))
-    for i in range(n):
+
+    def _most_rational(ai, bi):
+        # most rational number in each of the sub-intervals [ai, bi] at once
+        ai = np.where(np.isin(ai, out), ai + eps, ai)
+        bi = np.where(np.isin(bi, out), bi - eps, bi)
+        return most_rational(ai, bi, itol=itol)
+
+    # The most rational number of each sub-interval is cached since only the
+    # two halves of the interval that was split need to be recomputed.
+    rationals = _most_rational(intervals[:1], intervals[1:])
+    for _ in range(n):
         i = np.argmax(np.diff(intervals))
-        ai, bi = intervals[i : i + 2]
-        if ai in out:
-            ai += eps
-        if bi in out:
-            bi -= eps
-        c = most_rational(ai, bi)
+        if np.isnan(rationals[i]):
+            rationals[i] = _most_rational(
+                intervals[i : i + 1], intervals[i + 1 : i + 2]
+            )
+        c = rationals[i]
         out.append(c)
-        j = np.searchsorted(intervals, c)
-        intervals = np.insert(intervals, j, c)
+        ai, bi = intervals[i : i + 2]
+        intervals = np.insert(intervals, i + 1, c)
+        # skip empty sub-intervals until they are needed
+        new = np.full(2, np.nan)
+        nonempty = np.array([ai, c]) < np.array([c, bi])
+        new[nonempty] = _most_rational(
+            np.array([ai, c])[nonempty], np.array([c, bi])[nonempty]
+        )
+        rationals = np.concatenate([rationals[:i], new, rationals[i + 1 :]])
     return np.array(out)
 
 
-def _find_rho(iota, iota_vals, tol=1e-14):
+def _find_rho(iota, iota_vals, tol=1e-14, maxiter=50):
     """Find rho values for iota_vals in iota profile."""
+    iota_vals = np.atleast_1d(iota_vals).astype(float)
+    if iota_vals.size == 0:
+        return iota_vals
     r = np.linspace(0, 1, 1000)
     io = iota(r)
-    rho = []
-    for ior in iota_vals:
-        f = lambda r: iota(np.atleast_1d(r))[0] - ior
-        df = lambda r: iota(np.atleast_1d(r), dr=1)[0]
-        # nearest neighbor search for initial guess
-        x0 = r[np.argmin(np.abs(io - ior))]
-        rho_i = optimize.root_scalar(f, x0=x0, fprime=df, xtol=tol).root
-        rho.append(rho_i)
-    return np.array(rho)
+    # nearest neighbor search for initial guess
+    rho = r[np.argmin(np.abs(io - iota_vals[:, np.newaxis]), axis=1)]
+    # Newton's method for all values at once
+    for _ in range(maxiter):
+        f = iota(rho) - iota_vals
+        df = iota(rho, dr=1)
+        step = np.divide(f, df, out=np.zeros_like(f), where=df != 0)
+        rho = rho - step
+        if np.all(np.abs(step) <= tol):
+            break
+    return rho
 
 
 def find_most_rational_surfaces(iota, n, atol=1e-14, itol=1e-14, eps=1e-12, **kwargs):
@@ -11,7 +11,8 @@ from datetime import datetime
 import numpy as np
 from termcolor import colored
 
-from desc import set_device
+from desc import config as desc_config
+from desc import set_compilation_cache, set_device
 
 # shouldn't import anything else from DESC here, since that will initialize JAX
 # before we have a chance to parse user inputs to see if they want to use GPU
@@ -124,6 +125,20 @@ class InputReader:
         else:
             set_device("cpu")
 
+        if (
+            args.compilation_cache is not None
+            or args.cache_max_size is not None
+            or args.warm_cache
+        ):
+            set_compilation_cache(
+                args.compilation_cache or desc_config["compilation_cache_dir"],
+                (
+                    args.cache_max_size
+                    if args.cache_max_size is not None
+                    else desc_config["compilation_cache_max_size"]
+                ),
+            )
+
         return args
 
     def _get_parser_(self):
@@ -1684,6 +1699,35 @@ def get_parser():
     parser.add_argument(
         "--version", action="store_true", help="Display version number and exit."
     )
+    parser.add_argument(
+        "--compilation-cache",
+        metavar="path",
+        default=None,
+        help="Directory for the persistent compilation cache. Compiled functions "
+        + "are saved there and reused by later runs at the same resolution. "
+        + "Can also be set with the DESC_COMPILATION_CACHE_DIR environment variable.",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        metavar="GB",
+        type=float,
+        default=None,
+        help="Maximum size of the compilation cache in GB. Least recently used "
+        + "entries are evicted when exceeded.",
+    )
+    parser.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="Compile the equilibrium objective and constraints at each resolution "
+        + "in the input file and save them to the compilation cache, then exit "
+        + "without solving.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted automatic continuation from the equilibria "
+        + "already saved in the output file.",
+    )
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
         "-q",
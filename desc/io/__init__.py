@@ -1,14 +1,30 @@
 """Functions and classes for reading and writing DESC data."""
 
+import importlib
+
 # InputReader lives outside this module for import ordering reasons, so we can
 # import InputReader in __main__ without importing optimizable_io which imports JAX
 # stuff potentially before we've set the GPU correctly.
 # We include a link to it here for backwards compatibility
 from desc.input_reader import InputReader
 
-from .ascii_io import read_ascii, write_ascii
-from .hdf5_io import hdf5Reader, hdf5Writer
-from .optimizable_io import IOAble, load
-from .pickle_io import PickleReader, PickleWriter
-
 __all__ = ["InputReader", "load"]
+
+# the rest are imported on first access (PEP 562), so that eg ``from desc.io import
+# InputReader`` doesn't initialize JAX
+_lazy_attrs = {
+    "read_ascii": ".ascii_io",
+    "write_ascii": ".ascii_io",
+    "hdf5Reader": ".hdf5_io",
+    "hdf5Writer": ".hdf5_io",
+    "IOAble": ".optimizable_io",
+    "load": ".optimizable_io",
+    "PickleReader": ".pickle_io",
+    "PickleWriter": ".pickle_io",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_attrs:
+        return getattr(importlib.import_module(_lazy_attrs[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 """Classes for reading and writing HDF5 files."""
 
+import hashlib
 import numbers
 import pydoc
 import warnings
@@ -82,28 +83,122 @@ class hdf5IO(IO):
         return list(loc.keys())
 
 
+class _LazyHDF5Object:
+    """Placeholder for an object that is only read from file when first accessed.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the hdf5 file.
+    path : str
+        Name of the group in the file the object is stored in.
+    cls : type
+        Class of the object.
+
+    """
+
+    def __init__(self, filename, path, cls):
+        self.filename = filename
+        self.path = path
+        self.cls = cls
+
+    def load(self):
+        """Read the object from file."""
+        with h5py.File(self.filename, "r") as f:
+            obj = self.cls.load(f[self.path], file_format="hdf5", lazy=True)
+        return obj
+
+    def __repr__(self):
+        return f"<unloaded {self.cls.__name__} at '{self.path}' in '{self.filename}'>"
+
+
+class _LazyList(list):
+    """List that reads its members from file when they are first accessed."""
+
+    def _resolve(self, i):
+        item = super().__getitem__(i)
+        if isinstance(item, _LazyHDF5Object):
+            item = item.load()
+            super().__setitem__(i, item)
+        return item
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._resolve(j) for j in range(*i.indices(len(self)))]
+        return self._resolve(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._resolve(i)
+
+    def __reversed__(self):
+        for i in reversed(range(len(self))):
+            yield self._resolve(i)
+
+    def pop(self, i=-1):
+        item = self._resolve(i)
+        super().pop(i)
+        return item
+
+    def copy(self):
+        return list(self)
+
+    @property
+    def loaded(self):
+        """list: Whether each member has been read from file yet."""
+        return [not isinstance(item, _LazyHDF5Object) for item in super().__iter__()]
+
+
 class hdf5Reader(hdf5IO, Reader):
     """Class specifying a Reader with hdf5IO."""
 
-    def __init__(self, target):
+    def __init__(self, target, lazy=False):
         """Initialize hdf5Reader class.
 
         Parameters
         ----------
         target : str or file instance
             Path to file OR file instance to be read.
+        lazy : bool
+            If True, objects stored in lists (such as the members of an
+            EquilibriaFamily) are only read when first accessed, and uncompressed
+            arrays are memory mapped instead of being read into memory.
 
         """
         self.target = target
         self.file_mode = "r"
+        self.lazy = lazy
         super().__init__()
 
-    def _decode_attr(self, loc, attr):
+    def _memmap(self, dset):
+        """Memory map a contiguous, uncompressed dataset, or return None."""
+        if (
+            dset.ndim == 0
+            or dset.chunks is not None  # chunked or compressed
+            or dset.dtype.kind not in "iufc"
+        ):
+            return None
+        offset = dset.id.get_offset()
+        if offset is None:  # storage not allocated
+            return None
+        # copy on write, so the file is never modified
+        return np.memmap(
+            dset.file.filename,
+            dtype=dset.dtype,
+            mode="c",
+            offset=offset,
+            shape=dset.shape,
+        )
 
-        if isinstance(loc[attr][()], bytes):
-            s = loc[attr][()].decode("utf-8")
-        else:
-            s = loc[attr][()]
+    def _decode_attr(self, loc, attr):
+        dset = loc[attr]
+        if self.lazy:
+            s = self._memmap(dset)
+            if s is not None:
+                return s
+        s = dset[()]
+        if isinstance(s, bytes):
+            s = s.decode("utf-8")
 
         # isinstance check to avoid comparing strings with numpy arrays
         if isinstance(s, str) and s == "None":
@@ -169,14 +264,7 @@ class hdf5Reader(hdf5IO, Reader):
                     # use importlib to import the correct class
                     cls = pydoc.locate(cls_name)
                     if cls is not None:
-                        setattr(
-                            obj,
-                            attr,
-                            cls.load(
-                                load_from=loc[attr],
-                                file_format=self._file_format_,
-                            ),
-                        )
+                        setattr(obj, attr, self._load_cls(cls, loc[attr]))
                     else:
                         warnings.warn(
                             "Class '{}' could not be imported.".format(cls_name),
@@ -218,10 +306,7 @@ class hdf5Reader(hdf5IO, Reader):
                     # use importlib to import the correct class
                     cls = pydoc.locate(cls_name)
                     if cls is not None:
-                        thedict[key] = cls.load(
-                            load_from=loc[key],
-                            file_format=self._file_format_,
-                        )
+                        thedict[key] = self._load_cls(cls, loc[key])
                     else:
                         warnings.warn(
                             "Class '{}' could not be imported.".format(cls_name),
@@ -265,13 +350,12 @@ class hdf5Reader(hdf5IO, Reader):
                 else:
                     # use importlib to import the correct class
                     cls = pydoc.locate(cls_name)
-                    if cls is not None:
+                    if cls is not None and self.lazy:
                         thelist.append(
-                            cls.load(
-                                load_from=loc[str(i)],
-                                file_format=self._file_format_,
-                            ),
+                            _LazyHDF5Object(loc.file.filename, loc[str(i)].name, cls)
                         )
+                    elif cls is not None:
+                        thelist.append(self._load_cls(cls, loc[str(i)]))
                     else:
                         warnings.warn(
                             "Class '{}' could not be imported.".format(cls_name),
@@ -280,27 +364,138 @@ class hdf5Reader(hdf5IO, Reader):
                         continue
             i += 1
 
+        if any(isinstance(item, _LazyHDF5Object) for item in thelist):
+            thelist = _LazyList(thelist)
         return thelist
 
+    def _load_cls(self, cls, loc):
+        """Load an object of type cls stored in group loc."""
+        if self.lazy:
+            return cls.load(load_from=loc, file_format=self._file_format_, lazy=True)
+        return cls.load(load_from=loc, file_format=self._file_format_)
+
+
+def _isarray(x):
+    return hasattr(x, "shape") and hasattr(x, "dtype")
+
+
+def _update_fingerprint(h, x):
+    """Add the data that would be saved for x to hash h."""
+    if hasattr(x, "_io_attrs_"):
+        h.update(fullname(x).encode())
+        for attr in x._io_attrs_:
+            h.update(attr.encode())
+            _update_fingerprint(h, getattr(x, attr, None))
+    elif isinstance(x, dict):
+        h.update(b"dict")
+        for key in x:
+            h.update(str(key).encode())
+            _update_fingerprint(h, x[key])
+    elif isinstance(x, (list, tuple)):
+        h.update(b"list")
+        for y in x:
+            _update_fingerprint(h, y)
+    elif _isarray(x) and np.asarray(x).dtype != object:
+        x = np.ascontiguousarray(x)
+        h.update(f"{x.dtype}{x.shape}".encode())
+        h.update(x.tobytes())
+    else:
+        h.update(repr(x).encode())
+
+
+def _fingerprint(obj):
+    """Hash of the data that would be saved for obj."""
+    h = hashlib.sha1()
+    _update_fingerprint(h, obj)
+    return h.hexdigest()
 
-class hdf5Writer(hdf5IO, Writer):
-    """Class specifying a writer with hdf5IO."""
-
-    def __init__(self, target, file_mode="w"):
-        """Initialize hdf5Writer class.
-
-        Parameters
-        ----------
-        target : str or file instance
-            path OR file instance to write to
-        file_mode : str
-            mode used when opening file.
 
-        """
+class hdf5Writer(hdf5IO, Writer):
+    """Class specifying a writer with hdf5IO.
+
+    Parameters
+    ----------
+    target : str or file instance
+        path OR file instance to write to
+    file_mode : str
+        mode used when opening file. If ``'a'`` (or ``'r+'``), an existing file is
+        updated in place rather than overwritten: datasets are replaced, and only
+        members of lists (such as the equilibria in an EquilibriaFamily) that are
+        new or have changed since the last save are written. This makes repeated
+        checkpointing of a growing family cost O(one member) per save. Note that
+        HDF5 does not reclaim the space of replaced data.
+    compression : {"gzip", "lzf", None}
+        Compression filter for arrays. None means no compression, which is
+        fastest to write and allows memory mapping on load, at the cost of larger
+        files.
+    compression_opts : int, optional
+        Compression level for gzip, from 0 to 9. Default is 4.
+    chunks : bool or dict, optional
+        Chunk shape for arrays. True lets HDF5 choose, a dict maps names of
+        attributes to chunk shapes. Default (None) is to use contiguous storage for
+        uncompressed arrays and let HDF5 choose for compressed ones.
+
+    """
+
+    def __init__(
+        self,
+        target,
+        file_mode="w",
+        compression="gzip",
+        compression_opts=None,
+        chunks=None,
+    ):
+        """Initialize hdf5Writer class."""
+        if compression not in {"gzip", "lzf", None}:
+            raise ValueError(
+                f"compression should be one of 'gzip', 'lzf' or None, got {compression}"
+            )
         self.target = target
         self.file_mode = file_mode
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.chunks = chunks
         super().__init__()
 
+    @property
+    def _append(self):
+        return self.file_mode in {"a", "r+"}
+
+    @property
+    def _options(self):
+        """Writer options to pass on when saving nested objects."""
+        return {
+            "compression": self.compression,
+            "compression_opts": self.compression_opts,
+            "chunks": self.chunks,
+        }
+
+    def _create_dataset(self, loc, name, data):
+        """Create (or replace) dataset, compressing arrays if requested."""
+        if name in loc:
+            del loc[name]
+        if not (_isarray(data) and np.asarray(data).size > 1):
+            return loc.create_dataset(name, data=data)
+        chunks = self.chunks.get(name) if isinstance(self.chunks, dict) else self.chunks
+        if chunks is not None and not isinstance(chunks, bool):
+            # chunks can't be bigger than the data
+            chunks = tuple(min(c, n) for c, n in zip(chunks, np.shape(data)))
+        return loc.create_dataset(
+            name,
+            data=data,
+            compression=self.compression,
+            compression_opts=(
+                self.compression_opts if self.compression == "gzip" else None
+            ),
+            chunks=chunks,
+        )
+
+    def _create_group(self, loc, name):
+        """Create (or replace) group."""
+        if name in loc:
+            del loc[name]
+        return loc.create_group(name)
+
     def write_obj(self, obj, where=None):
         """Write object to file in group specified by where argument.
 
@@ -314,14 +509,11 @@ class hdf5Writer(hdf5IO, Writer):
         """
         loc = self.resolve_where(where)
 
-        def isarray(x):
-            return hasattr(x, "shape") and hasattr(x, "dtype")
-
         # save name of object class
-        loc.create_dataset("__class__", data=fullname(obj))
+        self._create_dataset(loc, "__class__", fullname(obj))
         from desc import __version__
 
-        loc.create_dataset("__version__", data=__version__)
+        self._create_dataset(loc, "__version__", __version__)
         for attr in obj._io_attrs_:
             try:
                 data = getattr(obj, attr)
@@ -334,28 +526,31 @@ class hdf5Writer(hdf5IO, Writer):
                 continue
             if data is None:
                 data = "None"
-            if isarray(data):
+            if _isarray(data):
                 data = np.asarray(data)  # convert jax arrs to np
 
             if (
-                isarray(data)
+                _isarray(data)
                 or isinstance(data, numbers.Number)
                 or isinstance(data, str)
             ):
-                compression = "gzip" if isarray(data) and data.size > 1 else None
-                loc.create_dataset(attr, data=data, compression=compression)
+                self._create_dataset(loc, attr, data)
             elif isinstance(data, dict):
-                group = loc.create_group(attr)
+                group = self._create_group(loc, attr)
                 self.write_dict(data, where=group)
             elif isinstance(data, (list, tuple)):
-                group = loc.create_group(attr)
+                if self._append and isinstance(loc.get(attr), h5py.Group):
+                    # update in place, so unchanged members aren't rewritten
+                    group = loc[attr]
+                else:
+                    group = self._create_group(loc, attr)
                 self.write_list(data, where=group)
             else:
                 from .optimizable_io import IOAble
 
                 if isinstance(data, IOAble):
-                    group = loc.create_group(attr)
-                    data.save(group)
+                    group = self._create_group(loc, attr)
+                    data.save(group, **self._options)
                 else:
                     raise TypeError(
                         f"don't know how to save attribute {attr} of type {type(data)}"
@@ -373,25 +568,19 @@ class hdf5Writer(hdf5IO, Writer):
 
         """
         loc = self.resolve_where(where)
-        loc.create_dataset("__class__", data="dict")
+        self._create_dataset(loc, "__class__", "dict")
         for key in thedict.keys():
             if isinstance(thedict[key], list):
-                group = loc.create_group(key)
+                group = self._create_group(loc, key)
                 self.write_list(thedict[key], where=group)
             elif isinstance(thedict[key], dict):
-                group = loc.create_group(key)
+                group = self._create_group(loc, key)
                 self.write_dict(thedict[key], where=group)
             else:
                 try:
-                    data = thedict[key]
-                    compression = (
-                        "gzip"
-                        if isinstance(data, np.ndarray) and np.asarray(data).size > 1
-                        else None
-                    )
-                    loc.create_dataset(key, data=data, compression=compression)
+                    self._create_dataset(loc, key, thedict[key])
                 except TypeError:
-                    group = loc.create_group(key)
+                    group = self._create_group(loc, key)
                     self.write_obj(thedict[key], group)
 
     def write_list(self, thelist, where=None):
@@ -406,23 +595,36 @@ class hdf5Writer(hdf5IO, Writer):
 
         """
         loc = self.resolve_where(where)
-        loc.create_dataset("__class__", data="list")
+        self._create_dataset(loc, "__class__", "list")
         for i in range(len(thelist)):
+            name = str(i)
             if isinstance(thelist[i], list):
-                subloc = loc.create_group(str(i))
+                subloc = self._create_group(loc, name)
                 self.write_list(thelist[i], where=subloc)
             elif isinstance(thelist[i], dict):
-                subloc = loc.create_group(str(i))
+                subloc = self._create_group(loc, name)
                 self.write_dict(thelist[i], where=subloc)
+            elif hasattr(thelist[i], "_io_attrs_"):
+                if self._append:
+                    fingerprint = _fingerprint(thelist[i])
+                    if (
+                        isinstance(loc.get(name), h5py.Group)
+                        and loc[name].attrs.get("__fingerprint__") == fingerprint
+                    ):
+                        # already saved and hasn't changed
+                        continue
+                subloc = self._create_group(loc, name)
+                self.write_obj(thelist[i], where=subloc)
+                if self._append:
+                    subloc.attrs["__fingerprint__"] = fingerprint
             else:
                 try:
-                    data = thelist[i]
-                    compression = (
-                        "gzip"
-                        if isinstance(data, np.ndarray) and np.asarray(data).size > 1
-                        else None
-                    )
-                    loc.create_dataset(str(i), data=data, compression=compression)
+                    self._create_dataset(loc, name, thelist[i])
                 except TypeError:
-                    subloc = loc.create_group(str(i))
+                    subloc = self._create_group(loc, name)
                     self.write_obj(thelist[i], where=subloc)
+        # remove members left over from a longer list
+        i = len(thelist)
+        while str(i) in loc:
+            del loc[str(i)]
+            i += 1
@@ -18,7 +18,7 @@ from .hdf5_io import hdf5Reader, hdf5Writer
 from .pickle_io import PickleReader, PickleWriter
 
 
-def load(load_from, file_format=None):
+def load(load_from, file_format=None, lazy=False):
     """Load any DESC object from previously saved file.
 
     Parameters
@@ -27,6 +27,11 @@ def load(load_from, file_format=None):
         file to initialize from
     file_format : {``'hdf5'``, ``'pickle'``} (Default: infer from file name)
         file format of file initializing from
+    lazy : bool
+        Only used for hdf5 files. If True, objects stored in lists (such as the
+        members of an EquilibriaFamily) are only read from the file when they are
+        first accessed, and uncompressed arrays are memory mapped rather than read
+        into memory. Useful when only part of a large file is needed.
 
     Returns
     -------
@@ -60,7 +65,7 @@ def load(load_from, file_format=None):
                 cls_name = f["__class__"][()].decode("utf-8")
                 cls = pydoc.locate(cls_name)
                 obj = cls.__new__(cls)
-                reader = reader_factory(load_from, file_format)
+                reader = reader_factory(load_from, file_format, lazy=lazy)
                 reader.read_obj(obj)
                 reader.close()
             else:
@@ -180,7 +185,7 @@ class IOAble(ABC, metaclass=_CombinedMeta):
     """
 
     @classmethod
-    def load(cls, load_from, file_format=None):
+    def load(cls, load_from, file_format=None, lazy=False):
         """Initialize from file.
 
         Parameters
@@ -189,6 +194,10 @@ class IOAble(ABC, metaclass=_CombinedMeta):
             file to initialize from
         file_format : {``'hdf5'``, ``'pickle'``} (Default: infer from file name)
             file format of file initializing from
+        lazy : bool
+            Only used for hdf5 files. If True, objects stored in lists are only read
+            from the file when first accessed, and uncompressed arrays are memory
+            mapped. See ``desc.io.load``.
 
         """
         if file_format is None and isinstance(load_from, (str, os.PathLike)):
@@ -208,10 +217,10 @@ class IOAble(ABC, metaclass=_CombinedMeta):
                     )
                 )
         if isinstance(load_from, (str, os.PathLike)):  # load from top level of file
-            self = load(load_from, file_format)
+            self = load(load_from, file_format, lazy=lazy)
         else:  # being called from within a nested object
             self = cls.__new__(cls)  # create a blank object bypassing init
-            reader = reader_factory(load_from, file_format)
+            reader = reader_factory(load_from, file_format, lazy=lazy)
             reader.read_obj(self)
 
             # to set other secondary stuff that wasn't saved possibly:
@@ -220,7 +229,7 @@ class IOAble(ABC, metaclass=_CombinedMeta):
 
         return self
 
-    def save(self, file_name, file_format=None, file_mode="w"):
+    def save(self, file_name, file_format=None, file_mode="w", **kwargs):
         """Save the object.
 
         Parameters
@@ -230,7 +239,13 @@ class IOAble(ABC, metaclass=_CombinedMeta):
         file_format : str (Default hdf5)
             format of save file. Only used if file_name is a file path
         file_mode : str (Default w - overwrite)
-            mode for save file. Only used if file_name is a file path
+            mode for save file. Only used if file_name is a file path. For hdf5,
+            ``'a'`` updates an existing file in place, only rewriting list members
+            that have changed.
+        **kwargs : dict
+            additional options for the writer, such as ``compression``,
+            ``compression_opts`` and ``chunks`` for hdf5. See
+            ``desc.io.hdf5_io.hdf5Writer`` for details.
 
         """
         if file_format is None:
@@ -245,7 +260,9 @@ class IOAble(ABC, metaclass=_CombinedMeta):
             else:
                 file_format = "hdf5"
 
-        writer = writer_factory(file_name, file_format=file_format, file_mode=file_mode)
+        writer = writer_factory(
+            file_name, file_format=file_format, file_mode=file_mode, **kwargs
+        )
         writer.write_obj(self)
         writer.close()
 
@@ -324,7 +341,7 @@ class IOAble(ABC, metaclass=_CombinedMeta):
         return new
 
 
-def reader_factory(load_from, file_format):
+def reader_factory(load_from, file_format, lazy=False):
     """Select and return instance of appropriate reader class for given file format.
 
     Parameters
@@ -333,6 +350,8 @@ def reader_factory(load_from, file_format):
         file path or instance from which to read
     file_format : str
         format of file to be read
+    lazy : bool
+        Whether to read objects and arrays on demand. Only used for hdf5.
 
     Returns
     -------
@@ -340,7 +359,7 @@ def reader_factory(load_from, file_format):
 
     """
     if file_format == "hdf5":
-        reader = hdf5Reader(load_from)
+        reader = hdf5Reader(load_from, lazy=lazy)
     elif file_format == "pickle":
         reader = PickleReader(load_from)
     else:
@@ -350,7 +369,7 @@ def reader_factory(load_from, file_format):
     return reader
 
 
-def writer_factory(file_name, file_format, file_mode="w"):
+def writer_factory(file_name, file_format, file_mode="w", **kwargs):
     """Select and return instance of appropriate reader class for given file format.
 
     Parameters
@@ -359,6 +378,10 @@ def writer_factory(file_name, file_format, file_mode="w"):
         file path or instance from which to read
     file_format : str
         format of file to be read
+    file_mode : str
+        mode used when opening file
+    **kwargs : dict
+        additional options passed to the writer. Ignored for pickle.
 
     Returns
     -------
@@ -366,7 +389,7 @@ def writer_factory(file_name, file_format, file_mode="w"):
 
     """
     if file_format == "hdf5":
-        writer = hdf5Writer(file_name, file_mode)
+        writer = hdf5Writer(file_name, file_mode, **kwargs)
     elif file_format == "pickle":
         writer = PickleWriter(file_name, file_mode)
     else:
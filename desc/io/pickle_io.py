@@ -93,11 +93,12 @@ class PickleWriter(PickleIO, Writer):
         target : str or file instance
             path OR file instance to write to
         file_mode : str
-            mode used when opening file.
+            mode used when opening file. Pickles can't be updated in place, so
+            append mode ``'a'`` overwrites the file.
 
         """
         self.target = target
-        self.file_mode = file_mode
+        self.file_mode = file_mode.replace("a", "w")
         super().__init__()
 
     def write_obj(self, obj, where=None):
@@ -1,14 +1,15 @@
 """Classes for magnetic fields."""
 
+import itertools
 from abc import ABC, abstractmethod
 from collections.abc import MutableSequence
 
 import numpy as np
 import scipy.linalg
 from interpax import approx_df, interp1d, interp2d, interp3d
-from netCDF4 import Dataset, chartostring, stringtochar
+from interpax._coefs import A_BICUBIC, A_TRICUBIC
 
-from desc.backend import fori_loop, jit, jnp, odeint, sign
+from desc.backend import fori_loop, jit, jnp, odeint, sign, tree_map
 from desc.basis import (
     ChebyshevDoubleFourierBasis,
     ChebyshevPolynomial,
@@ -452,6 +453,8 @@ class _MagneticField(IOAble, ABC):
         B_Z = field[:, 2].reshape(nphi, nZ, nR)
 
         # write mgrid file
+        from netCDF4 import Dataset, stringtochar
+
         file = Dataset(path, mode="w", format="NETCDF3_64BIT_OFFSET")
 
         # dimensions
@@ -1063,6 +1066,86 @@ class PoloidalMagneticField(_MagneticField, Optimizable):
         return B
 
 
+def _spline_cell_coefs(nodes, f, derivs):
+    """Polynomial coefficients of a bicubic or tricubic spline in each grid cell.
+
+    Parameters
+    ----------
+    nodes : tuple of ndarray
+        Grid nodes in each dimension (2 or 3 dimensions).
+    f : ndarray, shape(n1,n2,[n3],...)
+        Function values on the grid.
+    derivs : dict of ndarray
+        Derivatives of f on the grid, with the same names as used by interpax
+        ("fx", "fy", "fxy" etc.)
+
+    Returns
+    -------
+    coefs : ndarray, shape(n1-1,n2-1,[n3-1],4,4,[4],...)
+        Coefficients of t_x^a t_y^b [t_z^c] in each cell, where t are the local
+        coordinates in [0, 1] across the cell.
+
+    """
+    d = len(nodes)
+    if d == 2:
+        A, names = A_BICUBIC, ["f", "fx", "fy", "fxy"]
+    else:
+        A, names = A_TRICUBIC, ["f", "fx", "fy", "fz", "fxy", "fxz", "fyz", "fxyz"]
+    fs = {"f": f, **derivs}
+    ncell = [len(x) - 1 for x in nodes]
+    trailing = (1,) * (f.ndim - d)
+    dx = [
+        jnp.diff(x).reshape([-1 if i == k else 1 for i in range(d)] + list(trailing))
+        for k, x in enumerate(nodes)
+    ]
+    F = []
+    for name in names:
+        # corners are ordered with the first axis varying fastest
+        for corner in itertools.product([0, 1], repeat=d):
+            corner = corner[::-1]
+            val = fs[name][tuple(slice(c, c + n) for c, n in zip(corner, ncell))]
+            for k, label in enumerate("xyz"[:d]):
+                if label in name[1:]:
+                    val = val * dx[k]
+            F.append(val)
+    coefs = jnp.stack(F, axis=-1) @ A.T
+    # coefficient index is a + 4*b + 16*c for t_x^a t_y^b t_z^c
+    coefs = coefs.reshape(coefs.shape[:-1] + (4,) * d)
+    coefs = jnp.moveaxis(coefs, range(-1, -d - 1, -1), range(d, 2 * d))
+    return coefs
+
+
+def _spline_cell_eval(xq, nodes, coefs):
+    """Evaluate a spline from the coefficients in each cell.
+
+    Parameters
+    ----------
+    xq : tuple of ndarray, shape(nq,)
+        Query points in each dimension.
+    nodes : tuple of ndarray
+        Grid nodes in each dimension.
+    coefs : ndarray
+        Cell coefficients from ``_spline_cell_coefs``.
+
+    Returns
+    -------
+    fq : ndarray, shape(nq,...)
+        Spline evaluated at the query points.
+
+    """
+    idx, ts = [], []
+    for x, q in zip(nodes, xq):
+        i = jnp.clip(jnp.searchsorted(x, q, side="right"), 1, len(x) - 1)
+        dx = x[i] - x[i - 1]
+        t = (q - x[i - 1]) * jnp.where(dx == 0, 0, 1 / dx)
+        idx.append(i - 1)
+        ts.append(jnp.stack([jnp.ones_like(t), t, t**2, t**3], axis=-1))
+    c = coefs[tuple(idx)]
+    if len(nodes) == 2:
+        return jnp.einsum("lij...,li,lj->l...", c, *ts)
+    return jnp.einsum("lijk...,li,lj,lk->l...", c, *ts)
+
+
 class SplineMagneticField(_MagneticField, Optimizable):
     """Magnetic field from precomputed values on a grid.
 
@@ -1088,6 +1171,12 @@ class SplineMagneticField(_MagneticField, Optimizable):
         interpolation method.
     extrap : bool, optional
         whether to extrapolate beyond the domain of known field values or return nan.
+    precompute_coefs : bool, optional
+        Whether to precompute the polynomial coefficients of the spline in each grid
+        cell, so that evaluating the field only requires gathering the coefficients
+        of the cell containing each point. Faster for repeated evaluations (e.g. field
+        line tracing), but uses 8x the memory of the field values and their
+        derivatives. Only for cubic interpolation methods.
 
     """
 
@@ -1104,13 +1193,25 @@ class SplineMagneticField(_MagneticField, Optimizable):
         "_axisym",
         "_currents",
         "_NFP",
+        "_precompute_coefs",
     ]
     # by default floats are considered dynamic but for this to work with jit these
     # need to be static
     _static_attrs = ["_extrap", "_period"]
 
     def __init__(
-        self, R, phi, Z, BR, Bphi, BZ, currents=1.0, NFP=1, method="cubic", extrap=False
+        self,
+        R,
+        phi,
+        Z,
+        BR,
+        Bphi,
+        BZ,
+        currents=1.0,
+        NFP=1,
+        method="cubic",
+        extrap=False,
+        precompute_coefs=False,
     ):
         R, phi, Z, currents = map(
             lambda x: jnp.atleast_1d(jnp.asarray(x)), (R, phi, Z, currents)
@@ -1153,6 +1254,51 @@ class SplineMagneticField(_MagneticField, Optimizable):
         self._derivs["Bphi"] = self._approx_derivs(self._Bphi)
         self._derivs["BZ"] = self._approx_derivs(self._BZ)
 
+        errorif(
+            precompute_coefs and method in ["nearest", "linear"],
+            ValueError,
+            f"precompute_coefs requires a cubic interpolation method, got {method}.",
+        )
+        self._precompute_coefs = precompute_coefs
+        self._set_up()
+
+    def _set_up(self):
+        """Stack the field components and their derivatives for fused evaluation."""
+        self._NFP = int(self._NFP)
+        self._axisym = bool(self._axisym)
+        self._precompute_coefs = bool(getattr(self, "_precompute_coefs", False))
+        # all components and groups are interpolated together, shape(...,3,ngroups)
+        B = jnp.stack([self._BR, self._Bphi, self._BZ], axis=-2)
+        if self._axisym:
+            # interp2d labels the axes x, y, so d/dZ is "fy"
+            keys = {"fx": "fx", "fy": "fz", "fxy": "fxz"}
+            derivs = {
+                k: jnp.stack([self._derivs[c][v] for c in ["BR", "Bphi", "BZ"]], -2)
+                for k, v in keys.items()
+            }
+            nodes = (self._R, self._Z)
+            B = B[:, 0, :]
+        else:
+            derivs = {
+                k: jnp.stack([self._derivs[c][k] for c in ["BR", "Bphi", "BZ"]], -2)
+                for k in ["fx", "fy", "fz", "fxy", "fxz", "fyz", "fxyz"]
+            }
+            # pad once in phi instead of on every evaluation
+            period = 2 * np.pi / self.NFP
+            phi = self._phi % period
+            i = jnp.argsort(phi)
+            phi = jnp.concatenate([phi[i][-1:] - period, phi[i], phi[i][:1] + period])
+            i = jnp.concatenate([i[-1:], i, i[:1]])
+            B = B[:, i]
+            derivs = {k: v[:, i] for k, v in derivs.items()}
+            nodes = (self._R, phi, self._Z)
+
+        self._interp = {"nodes": nodes, "f": B}
+        if self._precompute_coefs:
+            self._interp["coefs"] = _spline_cell_coefs(nodes, B, derivs)
+        else:
+            self._interp["derivs"] = derivs
+
     @property
     def NFP(self):
         """int: Number of toroidal field periods."""
@@ -1221,89 +1367,49 @@ class SplineMagneticField(_MagneticField, Optimizable):
         if basis == "xyz":
             coords = xyz2rpz(coords)
         Rq, phiq, Zq = coords.T
+        # cast to the current default precision, see desc.precision
+        interp = tree_map(lambda x: jnp.asarray(x, dtype=float), self._interp)
+        nodes = interp["nodes"]
         if self._axisym:
-            BRq = interp2d(
-                Rq,
-                Zq,
-                self._R,
-                self._Z,
-                self._BR[:, 0, :],
-                self._method,
-                (0, 0),
-                self._extrap,
-                (None, None),
-                **self._derivs["BR"],
-            )
-            Bphiq = interp2d(
-                Rq,
-                Zq,
-                self._R,
-                self._Z,
-                self._Bphi[:, 0, :],
-                self._method,
-                (0, 0),
-                self._extrap,
-                (None, None),
-                **self._derivs["Bphi"],
+            xq = (Rq, Zq)
+            extrap = self._extrap
+        else:
+            xq = (Rq, phiq % (2 * np.pi / self.NFP), Zq)
+            # phi is padded to be periodic, so is never out of bounds
+            extrap = (
+                (self._extrap, self._extrap),
+                (True, True),
+                (self._extrap, self._extrap),
             )
-            BZq = interp2d(
-                Rq,
-                Zq,
-                self._R,
-                self._Z,
-                self._BZ[:, 0, :],
+
+        if self._precompute_coefs:
+            B = _spline_cell_eval(xq, nodes, interp["coefs"])
+            if not self._extrap:
+                R, Z = nodes[0], nodes[-1]
+                out = (Rq < R[0]) | (Rq > R[-1]) | (Zq < Z[0]) | (Zq > Z[-1])
+                B = jnp.where(out[:, None, None], jnp.nan, B)
+        elif self._axisym:
+            B = interp2d(
+                *xq,
+                *nodes,
+                interp["f"],
                 self._method,
                 (0, 0),
-                self._extrap,
+                extrap,
                 (None, None),
-                **self._derivs["BZ"],
+                **interp["derivs"],
             )
-
         else:
-            BRq = interp3d(
-                Rq,
-                phiq,
-                Zq,
-                self._R,
-                self._phi,
-                self._Z,
-                self._BR,
-                self._method,
-                (0, 0, 0),
-                self._extrap,
-                (None, 2 * np.pi / self.NFP, None),
-                **self._derivs["BR"],
-            )
-            Bphiq = interp3d(
-                Rq,
-                phiq,
-                Zq,
-                self._R,
-                self._phi,
-                self._Z,
-                self._Bphi,
-                self._method,
-                (0, 0, 0),
-                self._extrap,
-                (None, 2 * np.pi / self.NFP, None),
-                **self._derivs["Bphi"],
-            )
-            BZq = interp3d(
-                Rq,
-                phiq,
-                Zq,
-                self._R,
-                self._phi,
-                self._Z,
-                self._BZ,
+            B = interp3d(
+                *xq,
+                *nodes,
+                interp["f"],
                 self._method,
                 (0, 0, 0),
-                self._extrap,
-                (None, 2 * np.pi / self.NFP, None),
-                **self._derivs["BZ"],
+                extrap,
+                (None, None, None),
+                **interp["derivs"],
             )
-        # BRq etc shape(nq, ngroups)
-        B = jnp.stack([BRq, Bphiq, BZq], axis=1)
         # B shape(nq, 3, ngroups)
         B = jnp.sum(B * currents, axis=-1)
         if basis == "xyz":
@@ -1311,7 +1417,14 @@ class SplineMagneticField(_MagneticField, Optimizable):
         return B
 
     @classmethod
-    def from_mgrid(cls, mgrid_file, extcur=None, method="cubic", extrap=False):
+    def from_mgrid(
+        cls,
+        mgrid_file,
+        extcur=None,
+        method="cubic",
+        extrap=False,
+        precompute_coefs=False,
+    ):
         """Create a SplineMagneticField from an "mgrid" file from MAKEGRID.
 
         Parameters
@@ -1326,8 +1439,12 @@ class SplineMagneticField(_MagneticField, Optimizable):
         extrap : bool
             Whether to extrapolate beyond the domain of known field values (True)
             or return NaN (False).
+        precompute_coefs : bool
+            Whether to precompute the spline coefficients in each grid cell.
 
         """
+        from netCDF4 import Dataset, chartostring
+
         mgrid = Dataset(mgrid_file, "r")
         mode = chartostring(mgrid["mgrid_mode"][()])
         if extcur is None:
@@ -1367,11 +1484,32 @@ class SplineMagneticField(_MagneticField, Optimizable):
         bz = np.moveaxis(bz, (0, 1, 2), (1, 2, 0))
 
         mgrid.close()
-        return cls(Rgrid, pgrid, Zgrid, br, bp, bz, extcur, nfp, method, extrap)
+        return cls(
+            Rgrid,
+            pgrid,
+            Zgrid,
+            br,
+            bp,
+            bz,
+            extcur,
+            nfp,
+            method,
+            extrap,
+            precompute_coefs,
+        )
 
     @classmethod
     def from_field(
-        cls, field, R, phi, Z, params=None, method="cubic", extrap=False, NFP=1
+        cls,
+        field,
+        R,
+        phi,
+        Z,
+        params=None,
+        method="cubic",
+        extrap=False,
+        NFP=1,
+        precompute_coefs=False,
     ):
         """Create a splined magnetic field from another field for faster evaluation.
 
@@ -1390,6 +1528,8 @@ class SplineMagneticField(_MagneticField, Optimizable):
             whether to extrapolate splines beyond specified R,phi,Z
         NFP : int, optional
             Number of toroidal field periods.
+        precompute_coefs : bool
+            Whether to precompute the spline coefficients in each grid cell.
 
         """
         R, phi, Z = map(np.asarray, (R, phi, Z))
@@ -1408,6 +1548,7 @@ class SplineMagneticField(_MagneticField, Optimizable):
             NFP=NFP,
             method=method,
             extrap=extrap,
+            precompute_coefs=precompute_coefs,
         )
 
 
@@ -1543,6 +1684,9 @@ def field_line_integrate(
     r0 = r0.flatten()
     z0 = z0.flatten()
     x0 = jnp.array([r0, phis[0] * jnp.ones_like(r0), z0]).T
+    # tolerances finer than the floating point precision can't be met
+    eps = jnp.finfo(x0.dtype).eps
+    rtol, atol = max(rtol, 10 * eps), max(atol, 10 * eps)
 
     @jit
     def odefun(rpz, s):
@@ -4,9 +4,11 @@ Original python implementation by Jonathan Schilling (jonathan.schilling@ipp.mpg
 Rewritten to use JAX by DESC team.
 """
 
+import functools
+
 import numpy as np
 
-from desc.backend import fori_loop, jnp, put
+from desc.backend import fori_loop, jnp, lu_factor, lu_solve, put
 from desc.grid import LinearGrid
 from desc.io import IOAble
 from desc.transform import Transform
@@ -473,6 +475,78 @@ def compute_T_S(jacobian, mf, nf, ntheta, nzeta, sym):
     return arrs
 
 
+def _compact(*arrs):
+    # drop axes along which the tables are constant so they broadcast instead, which
+    # keeps the constants embedded in compiled code small
+    out = []
+    for arr in arrs:
+        for axis in range(arr.ndim):
+            first = arr.take([0], axis=axis)
+            if np.all(arr == first):
+                arr = first
+        arr.flags.writeable = False
+        out.append(arr)
+    return tuple(out)
+
+
+@functools.lru_cache
+def _analytic_tables(mf, nf, ntheta, nzeta, sym):
+    """Resolution dependent index and phase tables for the analytic integrals."""
+    ntheta_sym = ntheta // 2 + 1 if sym else ntheta
+    m, n = np.meshgrid(
+        np.arange(mf + 1),
+        np.concatenate([np.arange(nf + 1), np.arange(-nf, 0)]),
+        indexing="ij",
+    )
+    kt, kz = np.divmod(np.arange(ntheta_sym * nzeta), nzeta)
+    sin_mni = np.sin(
+        2 * np.pi * (m[..., None] * kt / ntheta - n[..., None] * kz / nzeta)
+    )
+    return _compact(m, n, sin_mni)
+
+
+@functools.lru_cache
+def _regularized_tables(ntheta, nzeta, NFP, sym):
+    """Resolution dependent index tables for the regularized Fourier transforms."""
+    ntheta_sym = ntheta // 2 + 1 if sym else ntheta
+    NFP_eff = 64 if (nzeta == 1) else NFP
+    zeta_fp = 2.0 * np.pi / NFP_eff * np.arange(NFP_eff)
+
+    # indices over regular and primed arrays
+    kt_ip, kz_ip, kt_i, kz_i = np.meshgrid(
+        np.arange(ntheta_sym),
+        np.arange(nzeta),
+        np.arange(ntheta),
+        np.arange(nzeta),
+        indexing="ij",
+    )
+    ip5 = (kt_ip * nzeta + kz_ip)[..., np.newaxis]  # linear index over primed grid
+    i = kt_i * nzeta + kz_i  # linear index over regular grid
+    izoff0 = ntheta * nzeta - ip5
+    itoff = nzeta * (ntheta - kt_ip)[..., np.newaxis]
+
+    kp = np.arange(NFP_eff)
+    izoff = izoff0 + 2 * ntheta * kp.reshape((1, 1, 1, 1, -1))
+    i_itoff = i[..., np.newaxis] + itoff
+    i_izoff = i[..., np.newaxis] + izoff
+    if nzeta == 1:
+        # Tokamak: NFP_eff toroidal "modules"
+        delta_kt = i_itoff % (2 * ntheta)
+        delta_kz = i_izoff // (2 * ntheta)
+    else:
+        # Stellarator: nv toroidal grid points
+        delta_kt = i_itoff // nzeta
+        delta_kz = i_izoff % nzeta
+
+    # periods other than the first, which don't contain the singularity
+    mask_reg = ~((zeta_fp == 0) | (nzeta == 1)).reshape((1, 1, 1, 1, -1))
+    # first period, excluding the singular point itself
+    mask_sing = ((kt_ip != kt_i) | (kz_ip != kz_i) | (nzeta == 1 and kp > 0))[
+        :, :, :, :, np.newaxis
+    ] & ((zeta_fp == 0) | (nzeta == 1))
+    return _compact(zeta_fp, delta_kt, delta_kz, mask_reg, mask_sing)
+
+
 def compute_analytic_integrals(
     normal, jacobian, TS, B_field, mf, nf, ntheta, nzeta, cmns, weights, sym
 ):
@@ -517,77 +591,23 @@ def compute_analytic_integrals(
     ft_T_m = jnp.fft.ifft(T_m, axis=1) * ntheta
     ft_T_m = jnp.fft.fft(ft_T_m, axis=2)
 
-    kt, kz = jnp.meshgrid(jnp.arange(ntheta_sym), jnp.arange(nzeta))
-    i = nzeta * kt + kz
-
-    num_four = mf + nf + 1
-    S_p_4d = jnp.zeros([num_four, ntheta_sym, nzeta, ntheta_sym * nzeta])
-    S_m_4d = jnp.zeros([num_four, ntheta_sym, nzeta, ntheta_sym * nzeta])
-
-    S_p_4d = put(
-        S_p_4d,
-        Index[:, kt, kz, i],
-        TS["S_p_l"].reshape(num_four, ntheta_sym, nzeta)[:, kt, kz],
-    )
-    S_m_4d = put(
-        S_m_4d,
-        Index[:, kt, kz, i],
-        TS["S_m_l"].reshape(num_four, ntheta_sym, nzeta)[:, kt, kz],
+    # the S^{\pm}_l terms only contribute at the source point, so their transforms
+    # reduce to a (precomputed) phase factor for each node
+    m, n, sin_mni = _analytic_tables(mf, nf, ntheta, nzeta, sym)
+    both = jnp.logical_or(m == 0, n == 0)
+    c_p = jnp.where(jnp.logical_or(both, n > 0), cmns[:, m, n], 0)
+    c_m = jnp.where(
+        both,
+        cmns[:, m, n],
+        jnp.where(jnp.logical_and(m != 0, n < 0), cmns[:, m, -n], 0),
     )
 
-    S_p_4d = jnp.pad(S_p_4d, ((0, 0), (0, ntheta - ntheta_sym), (0, 0), (0, 0)))
-    ft_S_p = jnp.fft.ifft(S_p_4d, axis=1) * ntheta
-    ft_S_p = jnp.fft.fft(ft_S_p, axis=2)
+    I_mn = jnp.sum(c_p * ft_T_p[:, m, n].imag + c_m * ft_T_m[:, m, n].imag, axis=0)
+    I_mn = jnp.where(both, (n >= 0) * I_mn, I_mn)
 
-    S_m_4d = jnp.pad(S_m_4d, ((0, 0), (0, ntheta - ntheta_sym), (0, 0), (0, 0)))
-    ft_S_m = jnp.fft.ifft(S_m_4d, axis=1) * ntheta
-    ft_S_m = jnp.fft.fft(ft_S_m, axis=2)
-
-    m, n = jnp.meshgrid(
-        jnp.arange(mf + 1),
-        jnp.concatenate([jnp.arange(nf + 1), jnp.arange(-nf, 0)]),
-        indexing="ij",
-    )
-
-    I_mn = jnp.zeros([mf + 1, 2 * nf + 1])
-    I_mn = jnp.where(
-        jnp.logical_or(m == 0, n == 0),
-        (n >= 0)
-        * jnp.sum(
-            cmns[:, m, n] * (ft_T_p[:, m, n].imag + ft_T_m[:, m, n].imag), axis=0
-        ),
-        I_mn,
-    )
-    I_mn = jnp.where(
-        jnp.logical_and(m != 0, n > 0),
-        jnp.sum(cmns[:, m, n] * ft_T_p[:, m, n].imag, axis=0),
-        I_mn,
-    )
-    I_mn = jnp.where(
-        jnp.logical_and(m != 0, n < 0),
-        jnp.sum(cmns[:, m, -n] * ft_T_m[:, m, n].imag, axis=0),
-        I_mn,
-    )
-
-    K_mntz = jnp.zeros([mf + 1, 2 * nf + 1, ntheta_sym * nzeta])
-    K_mntz = jnp.where(
-        jnp.logical_or(m == 0, n == 0)[:, :, jnp.newaxis],
-        jnp.sum(
-            cmns[:, m, n, jnp.newaxis]
-            * (ft_S_p[:, m, n, :].imag + ft_S_m[:, m, n, :].imag),
-            axis=0,
-        ),
-        K_mntz,
-    )
-    K_mntz = jnp.where(
-        jnp.logical_and(m != 0, n > 0)[:, :, jnp.newaxis],
-        jnp.sum(cmns[:, m, n, jnp.newaxis] * ft_S_p[:, m, n, :].imag, axis=0),
-        K_mntz,
-    )
-    K_mntz = jnp.where(
-        jnp.logical_and(m != 0, n < 0)[:, :, jnp.newaxis],
-        jnp.sum(cmns[:, m, -n, jnp.newaxis] * ft_S_m[:, m, n, :].imag, axis=0),
-        K_mntz,
+    K_mntz = sin_mni * (
+        jnp.einsum("lmn,li->mni", c_p, TS["S_p_l"])
+        + jnp.einsum("lmn,li->mni", c_m, TS["S_m_l"])
     )
     K_mntz = K_mntz.reshape(mf + 1, 2 * nf + 1, ntheta_sym, nzeta)
     return I_mn, K_mntz
@@ -640,55 +660,34 @@ def regularizedFourierTransforms(
     """
     ntheta_sym = ntheta // 2 + 1 if sym else ntheta
     NFP_eff = 64 if (nzeta == 1) else NFP
-    zeta_fp = 2.0 * jnp.pi / NFP_eff * jnp.arange(NFP_eff)
-
-    # indices over regular and primed arrays
-    kt_ip, kz_ip, kt_i, kz_i = jnp.meshgrid(
-        jnp.arange(ntheta_sym),
-        jnp.arange(nzeta),
-        jnp.arange(ntheta),
-        jnp.arange(nzeta),
-        indexing="ij",
+    zeta_fp, delta_kt, delta_kz, mask_reg, mask_sing = _regularized_tables(
+        ntheta, nzeta, NFP, sym
     )
-    ip = kt_ip * nzeta + kz_ip  # linear index over primed grid
-    ip5 = (kt_ip * nzeta + kz_ip)[..., jnp.newaxis]  # linear index over primed grid
-    i = kt_i * nzeta + kz_i  # linear index over primed grid
-    izoff0 = ntheta * nzeta - ip5
-    itoff = nzeta * (ntheta - kt_ip)[..., jnp.newaxis]
+
+    def primed(x):
+        # quantities on the primed grid, broadcast against the regular grid
+        return x[: ntheta_sym * nzeta].reshape((ntheta_sym, nzeta, 1, 1))
 
     # field-period invariant vectors
     r_squared = (coords["R_full"] ** 2 + coords["Z_full"] ** 2).reshape((-1, nzeta))
     gsave = (
-        r_squared[kt_ip, kz_ip]
+        primed(r_squared.flatten())
         + r_squared
-        - 2.0
-        * coords["Z"][ip].reshape(kt_ip.shape)
-        * coords["Z_full"].reshape((-1, nzeta))
+        - 2.0 * primed(coords["Z"]) * coords["Z_full"].reshape((-1, nzeta))
     )
     drv = -(coords["R"] * normal["R_n"] + coords["Z"] * normal["Z_n"])
-    dsave = (
-        drv[ip]
-        + coords["Z_full"].reshape((-1, nzeta))
-        * normal["Z_n"].reshape((ntheta_sym, nzeta))[kt_ip, kz_ip]
-    )
+    dsave = primed(drv) + coords["Z_full"].reshape((-1, nzeta)) * primed(normal["Z_n"])
 
     # copy cartesian coordinates in first field period to full domain
     X_full, Y_full = copy_vector_periods(
-        jnp.array(
-            [
-                coords["X"].reshape((-1, nzeta))[kt_ip, kz_ip],
-                coords["Y"].reshape((-1, nzeta))[kt_ip, kz_ip],
-            ]
-        ),
-        zeta_fp,
+        jnp.array([primed(coords["X"]), primed(coords["Y"])]), zeta_fp
     )
     # cartesian components of surface normal on full domain
-    X_n = (normal["R_n"][ip5] * X_full - normal["phi_n"][ip5] * Y_full) / coords["R"][
-        ip5
-    ]
-    Y_n = (normal["R_n"][ip5] * Y_full + normal["phi_n"][ip5] * X_full) / coords["R"][
-        ip5
-    ]
+    R_n = primed(normal["R_n"])[..., jnp.newaxis]
+    phi_n = primed(normal["phi_n"])[..., jnp.newaxis]
+    R = primed(coords["R"])[..., jnp.newaxis]
+    X_n = (R_n * X_full - phi_n * Y_full) / R
+    Y_n = (R_n * Y_full + phi_n * X_full) / R
 
     # greens functions for kernel and source
     # theta', zeta', theta, zeta, period
@@ -715,50 +714,20 @@ def regularizedFourierTransforms(
     )
     kernel_update = ftemp * htemp * gtemp
     source_update = htemp
-    mask = ~((zeta_fp == 0) | (nzeta == 1)).reshape(
-        (
-            1,
-            1,
-            1,
-            1,
-            -1,
-        )
-    )
-    kernel = jnp.where(mask, kernel + kernel_update, kernel)
-    source = jnp.where(mask, source + source_update, source)
-
-    kp = jnp.arange(NFP_eff)
-    izoff = izoff0 + 2 * ntheta * kp.reshape((1, 1, 1, 1, -1))
-    i_itoff = i[..., jnp.newaxis] + itoff
-    i_izoff = i[..., jnp.newaxis] + izoff
-    if nzeta == 1:
-        # Tokamak: NFP_eff toroidal "modules"
-        delta_kt = i_itoff % (2 * ntheta)
-        delta_kz = i_izoff // (2 * ntheta)
-    else:
-        # Stellarator: nv toroidal grid points
-        delta_kt = i_itoff // nzeta
-        delta_kz = i_izoff % nzeta
+    kernel = jnp.where(mask_reg, kernel + kernel_update, kernel)
+    source = jnp.where(mask_reg, source + source_update, source)
 
     # subtract out singular part of the kernels
     tant = tan_theta[(delta_kt,)]
     tanz = tan_zeta[(delta_kz,)]
-    ga1 = (
-        tant * (jacobian["g_tt"][(ip5,)] * tant + 2 * jacobian["g_tz"][(ip5,)] * tanz)
-        + jacobian["g_zz"][(ip5,)] * tanz**2
-    )
-    ga2 = (
-        tant * (jacobian["a_tt"][(ip5,)] * tant + jacobian["a_tz"][(ip5,)] * tanz)
-        + jacobian["a_zz"][(ip5,)] * tanz**2
-    )
+    jac = {key: primed(val)[..., jnp.newaxis] for key, val in jacobian.items()}
+    ga1 = tant * (jac["g_tt"] * tant + 2 * jac["g_tz"] * tanz) + jac["g_zz"] * tanz**2
+    ga2 = tant * (jac["a_tt"] * tant + jac["a_tz"] * tanz) + jac["a_zz"] * tanz**2
 
     kernel_sing = -(ga2 / ga1 * 1 / jnp.sqrt(ga1))
     source_sing = -1 / jnp.sqrt(ga1)
-    mask = ((kt_ip != kt_i) | (kz_ip != kz_i) | (nzeta == 1 and kp > 0))[
-        :, :, :, :, jnp.newaxis
-    ] & ((zeta_fp == 0) | (nzeta == 1))
-    kernel = jnp.where(mask, kernel + kernel_update + kernel_sing, kernel)
-    source = jnp.where(mask, source + source_update + source_sing, source)
+    kernel = jnp.where(mask_sing, kernel + kernel_update + kernel_sing, kernel)
+    source = jnp.where(mask_sing, source + source_update + source_sing, source)
 
     if nzeta == 1:
         # Tokamak: need to do toroidal average / integral:
@@ -820,33 +789,8 @@ def regularizedFourierTransforms(
     return g_mntz, h_mn
 
 
-def compute_scalar_magnetic_potential(
-    I_mn, K_mntz, g_mntz, h_mn, mf, nf, ntheta, nzeta, weights, sym
-):
-    """Computes the magnetic scalar potential to cancel the normal field on the surface.
-
-    Parameters
-    ----------
-    I_mn : ndarray
-        singular part of source term, indexed by m, n
-    K_mntz : ndarray
-        singular part of greens function kernel, indexed by m, n, theta, zeta
-    g_mntz : ndarray
-        regularized part of greens function kernel, indexed by m, n, theta, zeta
-    h_mn : ndarray
-        regularized part of source term, indexed by m, n
-    mf, nf : integer
-        maximum poloidal and toroidal mode numbers
-    ntheta, nzeta : integer
-        number of grid points in poloidal, toroidal directions
-    weights : ndarray
-        quadrature weights for integration
-
-    Returns
-    -------
-    phi_mn : ndarray
-        scalar magnetic potential, indexed by m, n
-    """
+def _compute_amatrix(K_mntz, g_mntz, mf, nf, ntheta, nzeta, weights, sym):
+    """Fourier transform the full kernel to get the system matrix for phi_mn."""
     ntheta_sym = ntheta // 2 + 1 if sym else ntheta
 
     # add in analytic part to get full kernel
@@ -873,15 +817,58 @@ def compute_scalar_magnetic_potential(
         amatrix_4d, Index[m, n, m, n], amatrix_4d[m, n, m, n] + 4.0 * jnp.pi**3
     )
 
-    amatrix = amatrix_4d.reshape([(mf + 1) * (2 * nf + 1), (mf + 1) * (2 * nf + 1)])
+    return amatrix_4d.reshape([(mf + 1) * (2 * nf + 1), (mf + 1) * (2 * nf + 1)])
+
+
+def compute_scalar_magnetic_potential(
+    I_mn, K_mntz, g_mntz, h_mn, mf, nf, ntheta, nzeta, weights, sym, lu=None, refine=2
+):
+    """Computes the magnetic scalar potential to cancel the normal field on the surface.
+
+    Parameters
+    ----------
+    I_mn : ndarray
+        singular part of source term, indexed by m, n
+    K_mntz : ndarray
+        singular part of greens function kernel, indexed by m, n, theta, zeta
+    g_mntz : ndarray
+        regularized part of greens function kernel, indexed by m, n, theta, zeta
+    h_mn : ndarray
+        regularized part of source term, indexed by m, n
+    mf, nf : integer
+        maximum poloidal and toroidal mode numbers
+    ntheta, nzeta : integer
+        number of grid points in poloidal, toroidal directions
+    weights : ndarray
+        quadrature weights for integration
+    lu : tuple of ndarray, optional
+        LU factorization of the system matrix for a nearby surface, as returned by
+        ``lu_factor``. If given, it is used in place of a dense solve, with the
+        solution corrected by iterative refinement against the current matrix.
+    refine : integer
+        number of iterative refinement steps to use when ``lu`` is given.
+
+    Returns
+    -------
+    phi_mn : ndarray
+        scalar magnetic potential, indexed by m, n
+    """
+    amatrix = _compute_amatrix(K_mntz, g_mntz, mf, nf, ntheta, nzeta, weights, sym)
 
     # combine with contribution from analytic integral; available here in I_mn
     bvec = h_mn + I_mn
     # final fixup from fouri: zero out (m=0, n<0) components (#TODO: why ?) from fortran
     bvec = put(bvec, Index[0, nf + 1 :], 0.0).flatten()
 
-    phi_mn = jnp.linalg.solve(amatrix, bvec).reshape([mf + 1, 2 * nf + 1])
-    return phi_mn
+    if lu is None:
+        phi_mn = jnp.linalg.solve(amatrix, bvec)
+    else:
+
+        def body_fun(i, x):
+            return x + lu_solve(lu, bvec - amatrix @ x)
+
+        phi_mn = fori_loop(0, refine, body_fun, lu_solve(lu, bvec))
+    return phi_mn.reshape([mf + 1, 2 * nf + 1])
 
 
 def compute_vacuum_magnetic_field(
@@ -1003,10 +990,27 @@ class Nestor(IOAble):
         number of grid points in poloidal, toroidal directions to use
     field_grid : Grid, optional
         Grid used to discretize external field.
+    reuse_lu : bool
+        If True, factorize the system matrix once for the initial boundary of
+        ``equil`` and reuse the factorization in later calls to ``compute``, correcting
+        the solution by iterative refinement. The system matrix depends only on the
+        boundary shape, so this is accurate as long as the boundary stays close to the
+        one it was factorized at. Use ``update_lu`` to refactorize.
+    refine : int
+        Number of iterative refinement steps to use when ``reuse_lu=True``.
     """
 
     def __init__(
-        self, equil, ext_field, M=None, N=None, ntheta=None, nzeta=None, field_grid=None
+        self,
+        equil,
+        ext_field,
+        M=None,
+        N=None,
+        ntheta=None,
+        nzeta=None,
+        field_grid=None,
+        reuse_lu=False,
+        refine=2,
     ):
 
         M = setdefault(M, equil.M + 1)
@@ -1109,6 +1113,11 @@ class Nestor(IOAble):
         self.tanu = jnp.asarray(self.tanu)
         self.tanv = jnp.asarray(self.tanv)
 
+        self.refine = refine
+        self._lu = None
+        if reuse_lu:
+            self.update_lu(equil.R_lmn, equil.Z_lmn)
+
     def eval_external_field(self, coords, normal, params=None):
         """Wrapper for handling fields from different coil types."""
         surf_coords = jnp.array([coords["R"], coords["phi"], coords["Z"]]).T
@@ -1129,8 +1138,8 @@ class Nestor(IOAble):
 
         return B_ex
 
-    def compute(self, R_lmn, Z_lmn, current, field_params=None):
-        """Compute B^2 in the vacuum region and the scalar potential."""
+    def _compute_kernels(self, R_lmn, Z_lmn, current, field_params=None):
+        """Compute the surface geometry and the Fourier transformed kernels."""
         surface_coords = eval_surface_geometry(
             R_lmn,
             Z_lmn,
@@ -1183,6 +1192,42 @@ class Nestor(IOAble):
             self.weights,
             self.sym,
         )
+        return surface_coords, normal, jacobian, B_field, I_mn, K_mntz, g_mntz, h_mn
+
+    def update_lu(self, R_lmn, Z_lmn):
+        """Factorize the system matrix for a given boundary, for reuse in compute.
+
+        Parameters
+        ----------
+        R_lmn, Z_lmn : ndarray
+            spectral coefficients of the equilibrium R, Z to factorize at.
+
+        """
+        _, _, _, _, _, K_mntz, g_mntz, _ = self._compute_kernels(R_lmn, Z_lmn, 0.0)
+        amatrix = _compute_amatrix(
+            K_mntz,
+            g_mntz,
+            self.M,
+            self.N,
+            self.ntheta,
+            self.nzeta,
+            self.weights,
+            self.sym,
+        )
+        self._lu = lu_factor(amatrix)
+
+    def compute(self, R_lmn, Z_lmn, current, field_params=None):
+        """Compute B^2 in the vacuum region and the scalar potential."""
+        (
+            surface_coords,
+            normal,
+            jacobian,
+            B_field,
+            I_mn,
+            K_mntz,
+            g_mntz,
+            h_mn,
+        ) = self._compute_kernels(R_lmn, Z_lmn, current, field_params)
         phi_mn = compute_scalar_magnetic_potential(
             I_mn,
             K_mntz,
@@ -1194,6 +1239,8 @@ class Nestor(IOAble):
             self.nzeta,
             self.weights,
             self.sym,
+            lu=self._lu,
+            refine=self.refine,
         )
         Btot = compute_vacuum_magnetic_field(
             surface_coords,
@@ -3,6 +3,7 @@ import numbers
 import numpy as np
 
 from desc.backend import (
+    cond,
     fori_loop,
     jnp,
     tree_flatten,
@@ -700,6 +701,57 @@ class CoilCurrentLength(CoilLength):
         return out
 
 
+def _bounding_spheres(pts):
+    """Center and radius of spheres containing each set of points, shape(...,n,3)."""
+    center = jnp.mean(pts, axis=-2)
+    radius = jnp.max(safenorm(pts - center[..., None, :], axis=-1), axis=-1)
+    return center, radius
+
+
+def _pruned_min_distance(pts, blocks, exclude=None):
+    """Minimum distance from a set of points to several blocks of points.
+
+    Blocks are visited in order of the distance between their bounding spheres, and
+    the distance to the points in a block is only computed if its bounding sphere is
+    closer than the smallest distance found so far. This gives the same result as
+    comparing to every point.
+
+    Parameters
+    ----------
+    pts : ndarray, shape(n,3)
+        Points to compute distance from.
+    blocks : ndarray, shape(m,k,3)
+        Blocks of points to compute distance to.
+    exclude : int, optional
+        Index of a block to skip, eg the block containing pts.
+
+    Returns
+    -------
+    d : float
+        Minimum distance between pts and any point in blocks.
+
+    """
+    center, radius = _bounding_spheres(pts)
+    centers, radii = _bounding_spheres(blocks)
+    lower = safenorm(centers - center, axis=-1) - radii - radius
+    if exclude is not None:
+        lower = lower.at[exclude].set(jnp.inf)
+    order = jnp.argsort(lower)
+
+    def body(i, d):
+        j = order[i]
+        return cond(
+            lower[j] < d,
+            lambda d: jnp.minimum(
+                d, jnp.min(safenorm(blocks[j][:, None] - pts[None], axis=-1))
+            ),
+            lambda d: d,
+            d,
+        )
+
+    return fori_loop(0, blocks.shape[0], body, jnp.array(jnp.inf))
+
+
 class CoilSetMinDistance(_Objective):
     """Target the minimum distance between coils in a coilset.
 
@@ -742,6 +794,11 @@ class CoilSetMinDistance(_Objective):
         If a list, must have the same structure as coils.
     name : str, optional
         Name of the objective function.
+    prune : bool, optional
+        Whether to skip pairs of coils whose bounding spheres are farther apart than
+        the closest distance found so far, and to only compute the distances for the
+        unique coils of a symmetric CoilSet. Gives the same result as comparing every
+        pair of coils, but is much faster for large coil sets. Default is False.
 
     """
 
@@ -761,12 +818,14 @@ class CoilSetMinDistance(_Objective):
         deriv_mode="auto",
         grid=None,
         name="coil-coil minimum distance",
+        prune=False,
     ):
         from desc.coils import CoilSet
 
         if target is None and bounds is None:
             bounds = (1, np.inf)
         self._grid = grid
+        self._prune = prune
         errorif(
             not isinstance(coil, CoilSet),
             ValueError,
@@ -795,11 +854,22 @@ class CoilSetMinDistance(_Objective):
             Level of output.
 
         """
+        from desc.coils import MixedCoilSet
+
         coilset = self.things[0]
         grid = self._grid or None
 
         self._dim_f = coilset.num_coils
         self._constants = {"coilset": coilset, "grid": grid, "quad_weights": 1.0}
+        # coils related by symmetry are the same distance from the other coils
+        if isinstance(coilset, MixedCoilSet):
+            self._sym, self._NFP, self._num_unique = False, 1, self._dim_f
+        else:
+            self._sym, self._NFP, self._num_unique = (
+                coilset.sym,
+                coilset.NFP,
+                len(coilset),
+            )
 
         if self._normalize:
             coils = tree_leaves(coilset, is_leaf=lambda x: not hasattr(x, "__len__"))
@@ -831,6 +901,20 @@ class CoilSetMinDistance(_Objective):
             params=params, grid=constants["grid"], basis="xyz"
         )
 
+        if self._prune:
+            min_dist = fori_loop(
+                0,
+                self._num_unique,
+                lambda k, min_dist: min_dist.at[k].set(
+                    _pruned_min_distance(pts[k], pts, exclude=k)
+                ),
+                jnp.zeros(self._num_unique),
+            )
+            # coils from the reflected half period are stored in reverse order
+            if self._sym:
+                min_dist = jnp.concatenate([min_dist, min_dist[::-1]])
+            return jnp.tile(min_dist, self._NFP)
+
         def body(k):
             # dist btwn all pts; shape(ncoils,num_nodes,num_nodes)
             # dist[i,j,n] is the distance from the jth point on the kth coil
@@ -916,6 +1000,12 @@ class PlasmaCoilSetMinDistance(_Objective):
         False by default, so that self.things = [coil, eq].
     name : str, optional
         Name of the objective function.
+    prune : bool, optional
+        Whether to split the plasma points into blocks (one per toroidal cross
+        section for a LinearGrid) and skip blocks whose bounding sphere is farther
+        from a coil than the closest distance found so far. Gives the same result as
+        comparing every pair of points, but is much faster for large coil sets and
+        fine plasma grids. Default is False.
 
     """
 
@@ -939,9 +1029,11 @@ class PlasmaCoilSetMinDistance(_Objective):
         eq_fixed=False,
         coils_fixed=False,
         name="plasma-coil minimum distance",
+        prune=False,
     ):
         if target is None and bounds is None:
             bounds = (1, np.inf)
+        self._prune = prune
         self._eq = eq
         self._coil = coil
         self._plasma_grid = plasma_grid
@@ -996,6 +1088,7 @@ class PlasmaCoilSetMinDistance(_Objective):
 
         self._dim_f = coil.num_coils
         self._eq_data_keys = ["R", "phi", "Z"]
+        self._block_size = -(-plasma_grid.num_nodes // plasma_grid.num_zeta)
 
         eq_profiles = get_profiles(self._eq_data_keys, obj=eq, grid=plasma_grid)
         eq_transforms = get_transforms(self._eq_data_keys, obj=eq, grid=plasma_grid)
@@ -1084,6 +1177,21 @@ class PlasmaCoilSetMinDistance(_Objective):
             )
             plasma_pts = rpz2xyz(jnp.array([data["R"], data["phi"], data["Z"]]).T)
 
+        if self._prune:
+            # pad with copies of the last point, which doesn't change the minimum
+            pad = -plasma_pts.shape[0] % self._block_size
+            blocks = jnp.concatenate(
+                [plasma_pts, jnp.broadcast_to(plasma_pts[-1], (pad, 3))]
+            ).reshape((-1, self._block_size, 3))
+            return fori_loop(
+                0,
+                self.dim_f,
+                lambda k, min_dist: min_dist.at[k].set(
+                    _pruned_min_distance(coils_pts[k], blocks)
+                ),
+                jnp.zeros(self.dim_f),
+            )
+
         def body(k):
             # dist btwn all pts; shape(ncoils,plasma_grid.num_nodes,coil_grid.num_nodes)
             dist = safenorm(coils_pts[k][None, :, :] - plasma_pts[:, None, :], axis=-1)
@@ -1144,6 +1252,13 @@ class QuadraticFlux(_Objective):
     vacuum : bool
         If true, B_plasma (the contribution to the normal field on the boundary from the
         plasma currents) is set to zero.
+    fixed_shape : bool
+        If true, assume the field is a coil or set of coils whose shapes are held
+        fixed (e.g. by ``FixCurveShift``, ``FixCurveRotation`` and fixing the shape
+        parameters) so that only the currents change. The normal field from each
+        coil per unit current is then precomputed during ``build``, and the field
+        is a matrix vector product with the coil currents. Changes to the coil
+        shapes after ``build`` are ignored.
     name : str
         Name of the objective function.
 
@@ -1168,6 +1283,7 @@ class QuadraticFlux(_Objective):
         eval_grid=None,
         field_grid=None,
         vacuum=False,
+        fixed_shape=False,
         name="Quadratic flux",
     ):
         if target is None and bounds is None:
@@ -1178,6 +1294,7 @@ class QuadraticFlux(_Objective):
         self._field = field
         self._field_grid = field_grid
         self._vacuum = vacuum
+        self._fixed_shape = fixed_shape
         things = [field]
         super().__init__(
             things=things,
@@ -1240,12 +1357,38 @@ class QuadraticFlux(_Objective):
                 eq, eval_grid, self._source_grid, normal_only=True
             )
 
+        # local import to avoid circular import
+        from desc.coils import CoilSet, MixedCoilSet, _Coil, _symmetry_map
+
+        x = np.array([eval_data["R"], eval_data["phi"], eval_data["Z"]]).T
+        symmap = None
+        response = None
+        if self._fixed_shape:
+            errorif(
+                not isinstance(self._field, _Coil),
+                ValueError,
+                "fixed_shape=True requires field to be a Coil or CoilSet, "
+                + f"got {type(self._field)}.",
+            )
+            # normal field from each coil at unit current
+            response = self._field._compute_current_response(
+                x, basis="rpz", source_grid=self._field_grid
+            )
+            response = jnp.sum(response * eval_data["n_rho"][:, :, None], axis=1)
+        elif isinstance(self._field, CoilSet) and not isinstance(
+            self._field, MixedCoilSet
+        ):
+            # coil sets only need the field at points not related by their symmetry
+            symmap = _symmetry_map(x, self._field.NFP, self._field.sym)
+
         self._constants = {
             "field": self._field,
             "field_grid": self._field_grid,
             "quad_weights": w,
             "eval_data": eval_data,
             "B_plasma": Bplasma,
+            "field_symmetry": symmap,
+            "current_response": response,
         }
 
         timer.stop("Precomputing transforms")
@@ -1282,7 +1425,23 @@ class QuadraticFlux(_Objective):
         eval_data = constants["eval_data"]
         B_plasma = constants["B_plasma"]
 
+        response = constants.get("current_response", None)
+        if response is not None:
+            # coil shapes are fixed, so the field is linear in the currents
+            currents = jnp.concatenate(
+                [
+                    jnp.atleast_1d(p["current"])
+                    for p in tree_leaves(
+                        field_params, is_leaf=lambda x: isinstance(x, dict)
+                    )
+                ]
+            )
+            return (response @ currents + B_plasma) * eval_data["|e_theta x e_zeta|"]
+
         x = jnp.array([eval_data["R"], eval_data["phi"], eval_data["Z"]]).T
+        symmap = constants.get("field_symmetry", None)
+        if symmap is not None:
+            x = x[symmap[0]]
 
         # B_ext is not pre-computed because field is not fixed
         B_ext = constants["field"].compute_magnetic_field(
@@ -1291,6 +1450,9 @@ class QuadraticFlux(_Objective):
             basis="rpz",
             params=field_params,
         )
+        if symmap is not None:
+            _, src, flip = symmap
+            B_ext = B_ext[src] * jnp.where(flip[:, None], jnp.array([-1, 1, 1]), 1)
         B_ext = jnp.sum(B_ext * eval_data["n_rho"], axis=-1)
         f = (B_ext + B_plasma) * eval_data["|e_theta x e_zeta|"]
         return f
@@ -390,6 +390,14 @@ class BoundaryError(_Objective):
     loop : bool
         If True, evaluate integral using loops, as opposed to vmap. Slower, but uses
         less memory.
+    chunk_size : int, optional
+        If given, evaluate integral in blocks of this many points, vectorized within
+        a block and looped over blocks. A middle ground between ``loop=True`` and
+        ``loop=False`` for speed and memory use. Overrides ``loop``.
+    far_field_tol : float, optional
+        If given, interactions between well separated parts of the surface are
+        approximated by a hierarchical low rank matrix to about this relative
+        tolerance, which is much faster for high resolution grids.
     name : str
         Name of the objective function.
 
@@ -436,6 +444,8 @@ class BoundaryError(_Objective):
         field_grid=None,
         field_fixed=False,
         loop=True,
+        chunk_size=None,
+        far_field_tol=None,
         name="Boundary error",
     ):
         if target is None and bounds is None:
@@ -447,6 +457,8 @@ class BoundaryError(_Objective):
         self._field = field
         self._field_grid = field_grid
         self._loop = loop
+        self._chunk_size = chunk_size
+        self._far_field_tol = far_field_tol
         self._sheet_current = hasattr(eq.surface, "Phi_mn")
         if field_fixed:
             things = [eq]
@@ -672,6 +684,8 @@ class BoundaryError(_Objective):
             source_data,
             constants["interpolator"],
             loop=self._loop,
+            chunk_size=self._chunk_size,
+            far_field_tol=self._far_field_tol,
         )
         # need extra factor of B/2 bc we're evaluating on plasma surface
         Bplasma = Bplasma + eval_data["B"] / 2
@@ -810,6 +824,10 @@ class BoundaryErrorNESTOR(_Objective):
         number of grid points in poloidal, toroidal directions to use in NESTOR.
     field_grid : Grid, optional
         Grid used to discretize field.
+    reuse_lu : bool
+        Whether to factorize the NESTOR system matrix once at the initial boundary
+        and reuse it, with iterative refinement, in later evaluations. Cheaper per
+        iteration when the boundary changes slowly.
     normalize : bool
         Whether to compute the error in physical units or non-dimensionalize.
     normalize_target : bool
@@ -848,6 +866,7 @@ class BoundaryErrorNESTOR(_Objective):
         ntheta=None,
         nzeta=None,
         field_grid=None,
+        reuse_lu=False,
         normalize=True,
         normalize_target=True,
         loss_function=None,
@@ -862,6 +881,7 @@ class BoundaryErrorNESTOR(_Objective):
         self.nzeta = nzeta
         self.field = field
         self.field_grid = field_grid
+        self.reuse_lu = reuse_lu
         super().__init__(
             things=eq,
             target=target,
@@ -899,6 +919,7 @@ class BoundaryErrorNESTOR(_Objective):
             self.ntheta,
             self.nzeta,
             self.field_grid,
+            reuse_lu=self.reuse_lu,
         )
         self.grid = LinearGrid(rho=1, theta=self.ntheta, zeta=self.nzeta, NFP=eq.NFP)
         self._data_keys = ["current", "|B|^2", "p", "|e_theta x e_zeta|"]
@@ -1,6 +1,7 @@
 """Objectives for targeting geometrical quantities."""
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 from desc.backend import jnp, vmap
 from desc.compute import get_profiles, get_transforms, rpz2xyz, xyz2rpz
@@ -500,6 +501,58 @@ class Volume(_Objective):
         return data["V"]
 
 
+def _sector_neighbors(plasma_coords, surface_coords, num_sectors):
+    """Find the plasma points in toroidal sectors near each surface point.
+
+    Parameters
+    ----------
+    plasma_coords, surface_coords : ndarray, shape(N,3)
+        Cartesian coordinates of the plasma and surface points.
+    num_sectors : int
+        Number of sectors to divide the toroidal angle into.
+
+    Returns
+    -------
+    surface_sector : ndarray, shape(surface_coords.shape[0],)
+        Sector index of each surface point.
+    sector_points : ndarray, shape(num_sectors, K)
+        Indices of the plasma points to compare to for surface points in each sector,
+        padded with zeros.
+    sector_mask : ndarray, shape(num_sectors, K)
+        False for the padded entries of ``sector_points``.
+
+    """
+    width = 2 * np.pi / num_sectors
+    plasma_sector = (
+        np.arctan2(plasma_coords[:, 1], plasma_coords[:, 0]) % (2 * np.pi) // width
+    ).astype(int) % num_sectors
+    surface_sector = (
+        np.arctan2(surface_coords[:, 1], surface_coords[:, 0]) % (2 * np.pi) // width
+    ).astype(int) % num_sectors
+
+    # how many sectors away the nearest plasma point to any surface point is
+    nearest = cKDTree(plasma_coords).query(surface_coords)[1]
+    offset = (plasma_sector[nearest] - surface_sector + num_sectors // 2) % num_sectors
+    halo = np.max(np.abs(offset - num_sectors // 2)) + 1
+
+    members = [np.flatnonzero(plasma_sector == k) for k in range(num_sectors)]
+    points = [
+        np.unique(
+            np.concatenate(
+                [members[(k + o) % num_sectors] for o in range(-halo, halo + 1)]
+            )
+        )
+        for k in range(num_sectors)
+    ]
+    K = max(len(p) for p in points)
+    sector_points = np.zeros((num_sectors, K), dtype=int)
+    sector_mask = np.zeros((num_sectors, K), dtype=bool)
+    for k, p in enumerate(points):
+        sector_points[k, : len(p)] = p
+        sector_mask[k, : len(p)] = True
+    return surface_sector, sector_points, sector_mask
+
+
 class PlasmaVesselDistance(_Objective):
     """Target the distance between the plasma and a surrounding surface.
 
@@ -587,6 +640,17 @@ class PlasmaVesselDistance(_Objective):
         more accurate approximation of the true min.
     name : str, optional
         Name of the objective function.
+    num_sectors : int, optional
+        If given, the points are sorted into this many sectors in toroidal angle, and
+        each surface point is only compared to plasma points in nearby sectors, rather
+        than to every plasma point. This reduces the memory from
+        O(plasma_grid.num_nodes * surface_grid.num_nodes) to roughly
+        O(surface_grid.num_nodes * plasma_grid.num_nodes / num_sectors), for fine
+        surface grids such as those from CAD meshes. How many neighboring sectors to
+        include is chosen during ``build`` so that the nearest plasma point to each
+        surface point is found exactly for the initial geometry, plus one sector
+        of margin. If the plasma or surface move far from their initial positions,
+        the objective should be rebuilt. Default is None, which compares all points.
     """
 
     _coordinates = "rtz"
@@ -612,11 +676,13 @@ class PlasmaVesselDistance(_Objective):
         softmin_alpha=1.0,
         name="plasma-vessel distance",
         use_signed_distance=False,
+        num_sectors=None,
         **kwargs,
     ):
         if target is None and bounds is None:
             bounds = (1, np.inf)
         self._surface = surface
+        self._num_sectors = num_sectors
         self._surface_grid = surface_grid
         self._plasma_grid = plasma_grid
         self._use_softmin = use_softmin
@@ -767,6 +833,34 @@ class PlasmaVesselDistance(_Objective):
                 profiles=equil_profiles,
             )
             self._constants["data_equil"] = data_eq
+        if self._num_sectors is not None:
+            # bucket points by toroidal sector at the initial geometry
+            data_eq = compute_fun(
+                eq,
+                self._equil_data_keys,
+                params=eq.params_dict,
+                transforms=equil_transforms,
+                profiles=equil_profiles,
+            )
+            surface_coords = compute_fun(
+                surface,
+                self._surface_data_keys,
+                params=surface.params_dict,
+                transforms=surface_transforms,
+                profiles={},
+            )["x"]
+            plasma_coords = rpz2xyz(
+                jnp.array([data_eq["R"], data_eq["phi"], data_eq["Z"]]).T
+            )
+            (
+                self._constants["surface_sector"],
+                self._constants["sector_points"],
+                self._constants["sector_mask"],
+            ) = _sector_neighbors(
+                np.asarray(plasma_coords),
+                np.asarray(rpz2xyz(surface_coords)),
+                self._num_sectors,
+            )
         timer.stop("Precomputing transforms")
         if verbose > 1:
             timer.disp("Precomputing transforms")
@@ -831,8 +925,16 @@ class PlasmaVesselDistance(_Objective):
             )["x"]
             surface_coords = rpz2xyz(surface_coords)
 
-        diff_vec = plasma_coords[:, None, :] - surface_coords[None, :, :]
-        d = safenorm(diff_vec, axis=-1)
+        if self._num_sectors is None:
+            diff_vec = plasma_coords[:, None, :] - surface_coords[None, :, :]
+            d = safenorm(diff_vec, axis=-1)
+        else:
+            # only compare to plasma points in nearby sectors, padded entries
+            # are masked out with inf
+            idx = constants["sector_points"][constants["surface_sector"]].T
+            mask = constants["sector_mask"][constants["surface_sector"]].T
+            diff_vec = plasma_coords[idx] - surface_coords[None, :, :]
+            d = jnp.where(mask, safenorm(diff_vec, axis=-1), jnp.inf)
 
         point_signs = jnp.ones(surface_coords.shape[0])
         if self._use_signed_distance:
@@ -4,6 +4,7 @@ import inspect
 import numbers
 import tkinter
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import matplotlib
 import matplotlib.pyplot as plt
@@ -43,6 +44,7 @@ __all__ = [
     "plot_qs_error",
     "plot_section",
     "plot_surfaces",
+    "PlotSession",
 ]
 
 
@@ -255,7 +257,7 @@ def _get_plot_axes(grid):
     return tuple(plot_axes)
 
 
-def _compute(eq, name, grid, component=None, reshape=True):
+def _compute(eq, name, grid, component=None, reshape=True, data=None):
     """Compute quantity specified by name on grid for Equilibrium eq.
 
     Parameters
@@ -268,6 +270,9 @@ def _compute(eq, name, grid, component=None, reshape=True):
         Grid of coordinates to evaluate at.
     component : str, optional
         For vector variables, which element to plot. Default is the norm of the vector.
+    data : dict, optional
+        Data already computed on grid. If it contains name, it is used instead of
+        computing the quantity again.
 
     Returns
     -------
@@ -292,9 +297,9 @@ def _compute(eq, name, grid, component=None, reshape=True):
 
     label = data_index[parameterization][name]["label"]
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        data = eq.compute(name, grid=grid)[name]
+    if data is None or name not in data:
+        data = _compute_tasks([(eq, name, grid)])[0]
+    data = data[name]
 
     if data_index[parameterization][name]["dim"] > 1:
         if component is None:
@@ -316,6 +321,328 @@ def _compute(eq, name, grid, component=None, reshape=True):
     return data, label
 
 
+def _parallel_map(fun, items, max_workers=1):
+    """Apply fun to each item, optionally using a pool of threads.
+
+    Parameters
+    ----------
+    fun : callable
+        Function of a single argument.
+    items : iterable
+        Arguments to apply fun to.
+    max_workers : int or None
+        Maximum number of threads to use. If 1, the items are evaluated serially.
+        If None, uses the default of ``concurrent.futures.ThreadPoolExecutor``.
+
+    Returns
+    -------
+    out : list
+        ``fun(item)`` for each item, in the same order as items.
+
+    """
+    items = list(items)
+    if len(items) < 2 or (max_workers is not None and max_workers <= 1):
+        return [fun(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fun, items))
+
+
+def _grid_key(grid):
+    """Hashable key that is equal for grids with the same nodes, spacing, weights."""
+    # custom grids may not have spacing or weights defined
+    arrays = (
+        grid.nodes,
+        getattr(grid, "spacing", None),
+        getattr(grid, "weights", None),
+    )
+    return (type(grid), grid.NFP, grid.sym) + tuple(
+        None if x is None else np.ascontiguousarray(x).tobytes() for x in arrays
+    )
+
+
+class PlotSession:
+    """Share computed data between plots.
+
+    Inside ``with PlotSession() as session:``, the data computed by the plotting
+    functions, including the intermediate quantities it depends on, is kept for
+    each object and grid. Later plots on the same grid pass it to ``compute`` so
+    only the quantities that are missing are computed. Quantities can also be
+    requested ahead of time with ``request``, so that they are computed together
+    with the first plot that uses that grid.
+
+    Objects should not be modified while the session is active, since their
+    data would not be recomputed.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from desc.plotting import PlotSession, plot_1d, plot_fsa
+        with PlotSession() as session:
+            session.request(eq, ["|B|", "|F|"], grid)
+            plot_1d(eq, "|B|", grid=grid)
+            plot_1d(eq, "|F|", grid=grid)  # no new compute call
+            plot_fsa(eq, "|B|")
+
+    """
+
+    def __init__(self):
+        self._objects = {}
+        self._data = {}
+        self._requests = {}
+        self._previous = []
+
+    def __enter__(self):
+        global _plot_session
+        self._previous.append(_plot_session)
+        _plot_session = self
+        return self
+
+    def __exit__(self, *args):
+        global _plot_session
+        _plot_session = self._previous.pop()
+
+    def request(self, eq, names, grid):
+        """Request quantities to be computed on grid with the next plot using it.
+
+        Parameters
+        ----------
+        eq : Equilibrium, Surface, Curve, etc.
+            Object to compute quantities of.
+        names : str or list of str
+            Names of quantities to compute.
+        grid : Grid
+            Grid to compute quantities on.
+
+        """
+        for name in np.atleast_1d(names).tolist():
+            requests = self._requests.setdefault(_task_key(eq, name, grid), [])
+            if name not in requests:
+                requests.append(name)
+
+    def get_data(self, eq, grid):
+        """dict: Data of eq computed on grid so far in this session.
+
+        Does not include volume quantities such as ``<|B|>_vol``, which are kept
+        separately.
+        """
+        return self._data.get(_task_key(eq, None, grid), {})
+
+    def _compute(self, key, eq, names, grid):
+        """Compute names on grid, reusing and updating the data for key."""
+        # keep a reference so the id isn't reused by another object
+        self._objects[id(eq)] = eq
+        names = list(names) + [
+            name for name in self._requests.pop(key, []) if name not in names
+        ]
+        data = self._data.get(key, {})
+        missing = [name for name in names if name not in data]
+        if missing:
+            data = eq.compute(missing, grid=grid, data=dict(data))
+            self._data[key] = data
+        return data
+
+
+_plot_session = None
+
+
+def _task_key(eq, name, grid):
+    """Key of the compute call that quantity name of eq on grid is part of."""
+    p = data_index.get(_parse_parameterization(eq), {})
+    # volume quantities may change the grids used to compute the dependencies
+    # of other quantities in the same call, so they aren't merged
+    merge = name is None or p.get(name, {}).get("coordinates") != ""
+    return (id(eq), _grid_key(grid), None if merge else name)
+
+
+def _compute_tasks(tasks, max_workers=1):
+    """Compute the data for a batch of plotting tasks.
+
+    Tasks that request quantities of the same object on identical grids are
+    merged, so each distinct (object, grid) pair is computed with a single call
+    to ``compute``. Volume quantities, such as ``<|B|>_vol``, get one call per
+    (object, grid, name).
+
+    Parameters
+    ----------
+    tasks : list of tuple
+        Each task is ``(eq, names, grid)``, where names is a str or list of str
+        of quantities to compute on grid for object eq.
+    max_workers : int or None
+        Maximum number of threads used to evaluate the merged tasks.
+
+    Returns
+    -------
+    data : list of dict
+        Computed data for each task, containing at least the requested names.
+
+    """
+    session = _plot_session
+    groups = {}
+    keys = []
+    for eq, names, grid in tasks:
+        keys.append([])
+        for name in np.atleast_1d(names).tolist():
+            key = _task_key(eq, name, grid)
+            if key not in groups:
+                groups[key] = (eq, [], grid)
+            if name not in groups[key][1]:
+                groups[key][1].append(name)
+            if key not in keys[-1]:
+                keys[-1].append(key)
+    if session is not None:
+        # also compute anything requested in the session for the same grids
+        for key in list(session._requests):
+            group = next((g for k, g in groups.items() if k[:2] == key[:2]), None)
+            if group is not None and key not in groups:
+                groups[key] = (group[0], [], group[2])
+
+    def fun(key):
+        eq, names, grid = groups[key]
+        if session is not None:
+            return session._compute(key, eq, names, grid)
+        return eq.compute(names, grid=grid)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        data = _parallel_map(fun, groups.keys(), max_workers)
+    data = dict(zip(groups.keys(), data))
+    out = []
+    for task_keys in keys:
+        out.append({})
+        for key in task_keys:
+            out[-1].update(data[key])
+    return out
+
+
+def _map_section_grid(eq, grid):
+    """Map a grid in (rho, theta, phi) coordinates to computational coordinates."""
+    return Grid(
+        map_coordinates(
+            eq,
+            grid.nodes,
+            ["rho", "theta", "phi"],
+            ["rho", "theta", "zeta"],
+            period=(np.inf, 2 * np.pi, 2 * np.pi),
+            guess=grid.nodes,
+        ),
+        sort=False,
+    )
+
+
+def _surfaces_data(eqs, rho, theta, phi, NR=50, NT=180, max_workers=1):
+    """Compute the coordinates of the flux surfaces plotted by plot_surfaces.
+
+    Parameters
+    ----------
+    eqs : list of Equilibrium
+        Objects from which to plot.
+    rho : ndarray
+        Values of rho to plot contours of.
+    theta : ndarray or None
+        Values of vartheta to plot contours of. If None, no vartheta contours
+        are computed.
+    phi : ndarray
+        Values of phi to plot contours at.
+    NR, NT : int
+        Number of rho and theta points in the vartheta and rho contours.
+    max_workers : int or None
+        Maximum number of threads used to map coordinates and compute data.
+
+    Returns
+    -------
+    plot_data : list of dict
+        Contour coordinates for each of eqs, with the same keys as the data
+        returned by plot_surfaces.
+
+    """
+
+    def get_grids(eq):
+        grid = _get_grid(
+            rho=rho,
+            NFP=eq.NFP,
+            theta=np.linspace(0, 2 * np.pi, NT, endpoint=True),
+            zeta=phi,
+        )
+        shape = (grid.num_theta, grid.num_rho, grid.num_zeta)
+        grids = [("rho", _map_section_grid(eq, grid), shape)]
+        if theta is not None:
+            # Note: theta* (also known as vartheta) is the poloidal straight field
+            # line angle in PEST-like flux coordinates
+            grid = _get_grid(
+                rho=np.linspace(0, 1, NR), NFP=eq.NFP, theta=theta, zeta=phi
+            )
+            shape = (grid.num_theta, grid.num_rho, grid.num_zeta)
+            grid = Grid(
+                map_coordinates(
+                    eq,
+                    grid.nodes,
+                    ["rho", "theta_PEST", "phi"],
+                    ["rho", "theta", "zeta"],
+                    period=(np.inf, 2 * np.pi, 2 * np.pi),
+                    guess=grid.nodes,
+                ),
+                sort=False,
+            )
+            grids.append(("vartheta", grid, shape))
+        return grids
+
+    grids = _parallel_map(get_grids, eqs, max_workers)
+    data = iter(
+        _compute_tasks(
+            [(eq, ["R", "Z"], grid) for eq, g in zip(eqs, grids) for _, grid, _ in g],
+            max_workers,
+        )
+    )
+    plot_data = []
+    for g in grids:
+        plot_data.append({})
+        for prefix, _, shape in g:
+            coords = next(data)
+            plot_data[-1][prefix + "_R_coords"] = coords["R"].reshape(shape, order="F")
+            plot_data[-1][prefix + "_Z_coords"] = coords["Z"].reshape(shape, order="F")
+    return plot_data
+
+
+def _boundaries_data(eqs, phi, plot_axis=True, max_workers=1):
+    """Compute the coordinates of the boundaries plotted by plot_boundaries.
+
+    Parameters
+    ----------
+    eqs : list of Equilibrium or Surface
+        Objects from which to plot.
+    phi : ndarray
+        Values of phi to plot boundary surface at.
+    plot_axis : bool
+        Whether to also compute the magnetic axis locations.
+    max_workers : int or None
+        Maximum number of threads used to map coordinates and compute data.
+
+    Returns
+    -------
+    plot_data : list of dict
+        R and Z coordinates for each of eqs, of shape (num_theta, num_rho, num_phi).
+        The magnetic axis is at rho index 0 if it was computed.
+
+    """
+
+    def get_grid(eq):
+        # don't plot axis for FourierRZToroidalSurface, since it's not defined.
+        rho = np.array([0.0, 1.0]) if (plot_axis and eq.L > 0) else np.array([1.0])
+        grid = _get_grid(NFP=eq.NFP, rho=rho, theta=100, zeta=phi)
+        shape = (grid.num_theta, grid.num_rho, grid.num_zeta)
+        return _map_section_grid(eq, grid), shape
+
+    grids = _parallel_map(get_grid, eqs, max_workers)
+    data = _compute_tasks(
+        [(eq, ["R", "Z"], grid) for eq, (grid, _) in zip(eqs, grids)], max_workers
+    )
+    return [
+        {"R": d["R"].reshape(shape, order="F"), "Z": d["Z"].reshape(shape, order="F")}
+        for d, (_, shape) in zip(data, grids)
+    ]
+
+
 def plot_coefficients(eq, L=True, M=True, N=True, ax=None, **kwargs):
     """Plot spectral coefficient magnitudes vs spectral mode number.
 
@@ -1177,8 +1504,22 @@ def plot_fsa(  # noqa: C901
             # surface average we have the recipe to compute in data_index is the
             # desired surface average.
             name = "<" + name + ">"
+    # Compute the quantity and whatever is needed to average it in one call.
+    # Derivatives for the magnetic axis limit depend on various naming schemes.
+    # e.g. B -> B_r, V(r) -> V_r(r), S_r(r) -> S_rr(r)
+    schemes = (
+        name + "_r",
+        name[:-3] + "_r" + name[-3:],
+        name[:-3] + "r" + name[-3:],
+    )
+    name_r = next((x for x in schemes if x in data_index[p]), None)
+    axis_limit = bool(grid.axis.size) and name_r is not None
+    names = [name]
+    if with_sqrt_g and data_index[p][name]["coordinates"] == "rtz":
+        names += ["sqrt(g)"] + ([name_r, "sqrt(g)_r"] if axis_limit else [])
+    data = _compute_tasks([(eq, names, grid)])[0]
     values, ylabel = _compute(
-        eq, name, grid, kwargs.pop("component", None), reshape=False
+        eq, name, grid, kwargs.pop("component", None), reshape=False, data=data
     )
     ylabel = ylabel.split("~")
     if (
@@ -1195,27 +1536,22 @@ def plot_fsa(  # noqa: C901
     else:
         compute_surface_averages = surface_averages_map(grid, expand_out=False)
         if with_sqrt_g:  # flux surface average
-            sqrt_g = _compute(eq, "sqrt(g)", grid, reshape=False)[0]
+            sqrt_g = _compute(eq, "sqrt(g)", grid, reshape=False, data=data)[0]
             # Attempt to compute the magnetic axis limit.
-            # Compute derivative depending on various naming schemes.
-            # e.g. B -> B_r, V(r) -> V_r(r), S_r(r) -> S_rr(r)
-            schemes = (
-                name + "_r",
-                name[:-3] + "_r" + name[-3:],
-                name[:-3] + "r" + name[-3:],
+            values_r = (
+                _compute(eq, name_r, grid, reshape=False, data=data)[0]
+                if axis_limit
+                else np.nan
             )
-            values_r = next(
-                (
-                    _compute(eq, x, grid, reshape=False)[0]
-                    for x in schemes
-                    if x in data_index[p]
-                ),
-                np.nan,
-            )
-            if (np.isfinite(values) & np.isfinite(values_r))[grid.axis].all():
+            if (
+                axis_limit
+                and (np.isfinite(values) & np.isfinite(values_r))[grid.axis].all()
+            ):
                 # Otherwise cannot compute axis limit in this agnostic manner.
                 sqrt_g = grid.replace_at_axis(
-                    sqrt_g, _compute(eq, "sqrt(g)_r", grid, reshape=False)[0], copy=True
+                    sqrt_g,
+                    _compute(eq, "sqrt(g)_r", grid, reshape=False, data=data)[0],
+                    copy=True,
                 )
             averages = compute_surface_averages(values, sqrt_g=sqrt_g)
             ylabel = r"$\langle " + ylabel[0][1:] + r" \rangle~" + "~".join(ylabel[1:])
@@ -1279,7 +1615,15 @@ def plot_fsa(  # noqa: C901
 
 
 def plot_section(
-    eq, name, grid=None, log=False, norm_F=False, ax=None, return_data=False, **kwargs
+    eq,
+    name,
+    grid=None,
+    log=False,
+    norm_F=False,
+    ax=None,
+    return_data=False,
+    plot_data=None,
+    **kwargs,
 ):
     """Plot Poincare sections.
 
@@ -1301,6 +1645,10 @@ def plot_section(
         Axis to plot on.
     return_data : bool
         if True, return the data plotted as well as fig,ax
+    plot_data : dict, optional
+        Data returned by a previous call with ``return_data=True``. If given, it is
+        plotted instead of recomputing it. The other arguments should be the same
+        as in that call.
     **kwargs : dict, optional
         Specify properties of the figure, axis, and plot appearance e.g.::
 
@@ -1347,50 +1695,42 @@ def plot_section(
     if isinstance(phi, numbers.Integral):
         phi = np.linspace(0, 2 * np.pi / eq.NFP, phi, endpoint=False)
     phi = np.atleast_1d(phi)
-    nphi = len(phi)
     if grid is None:
-        nfp = eq.NFP
         grid_kwargs = {
             "L": 25,
-            "NFP": nfp,
+            "NFP": eq.NFP,
             "axis": False,
             "theta": np.linspace(0, 2 * np.pi, 91, endpoint=True),
             "zeta": phi,
         }
         grid = _get_grid(**grid_kwargs)
-        nr, nt, nz = grid.num_rho, grid.num_theta, grid.num_zeta
-        coords = map_coordinates(
-            eq,
-            grid.nodes,
-            ["rho", "theta", "phi"],
-            ["rho", "theta", "zeta"],
-            period=(np.inf, 2 * np.pi, 2 * np.pi),
-            guess=grid.nodes,
-        )
-        grid = Grid(coords, sort=False)
-
     else:
         phi = np.unique(grid.nodes[:, 2])
-        nphi = phi.size
-        nr, nt, nz = grid.num_rho, grid.num_theta, grid.num_zeta
-        coords = map_coordinates(
-            eq,
-            grid.nodes,
-            ["rho", "theta", "phi"],
-            ["rho", "theta", "zeta"],
-            period=(np.inf, 2 * np.pi, 2 * np.pi),
-            guess=grid.nodes,
-        )
-        grid = Grid(coords, sort=False)
+    nphi = phi.size
     rows = np.floor(np.sqrt(nphi)).astype(int)
     cols = np.ceil(nphi / rows).astype(int)
+    component = kwargs.pop("component", None)
+    norm_name = kwargs.pop("norm_name", "<|grad(|B|^2)|/2mu0>_vol")
 
-    data, label = _compute(eq, name, grid, kwargs.pop("component", None), reshape=False)
-    if norm_F:
-        # normalize force by B pressure gradient
-        norm_name = kwargs.pop("norm_name", "<|grad(|B|^2)|/2mu0>_vol")
-        norm_data, _ = _compute(eq, norm_name, grid, reshape=False)
-        data = data / np.nanmean(np.abs(norm_data))  # normalize
+    if plot_data is None:
+        nr, nt, nz = grid.num_rho, grid.num_theta, grid.num_zeta
+        grid = _map_section_grid(eq, grid)
+        # compute everything needed on the section grid in a single call
+        names = [name, "R", "Z"] + ([norm_name] if norm_F else [])
+        coords = _compute_tasks([(eq, names, grid)])[0]
+        data, _ = _compute(eq, name, grid, component, reshape=False, data=coords)
+        normalization = 1
+        if norm_F:
+            # normalize force by B pressure gradient
+            norm_data, _ = _compute(eq, norm_name, grid, reshape=False, data=coords)
+            normalization = np.nanmean(np.abs(norm_data))
+            data = data / normalization
+        R = coords["R"].reshape((nt, nr, nz), order="F")
+        Z = coords["Z"].reshape((nt, nr, nz), order="F")
+        data = data.reshape((nt, nr, nz), order="F")
+    else:
+        R, Z, data = plot_data["R"], plot_data["Z"], plot_data[name]
+        normalization = plot_data.get("normalization", 1)
 
     figw = 5 * cols
     figh = 5 * rows
@@ -1403,13 +1743,6 @@ def plot_section(
     )
     ax = np.atleast_1d(ax).flatten()
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        coords = eq.compute(["R", "Z"], grid=grid)
-    R = coords["R"].reshape((nt, nr, nz), order="F")
-    Z = coords["Z"].reshape((nt, nr, nz), order="F")
-    data = data.reshape((nt, nr, nz), order="F")
-
     contourf_kwargs = {}
     if log:
         data = np.abs(data)  # ensure data is positive for log plot
@@ -1481,11 +1814,7 @@ def plot_section(
             )
     _set_tight_layout(fig)
 
-    plot_data = {"R": R, "Z": Z, name: data}
-    if norm_F:
-        plot_data["normalization"] = np.nanmean(np.abs(norm_data))
-    else:
-        plot_data["normalization"] = 1
+    plot_data = {"R": R, "Z": Z, name: data, "normalization": normalization}
 
     if return_data:
         return fig, ax, plot_data
@@ -1493,7 +1822,16 @@ def plot_section(
     return fig, ax
 
 
-def plot_surfaces(eq, rho=8, theta=8, phi=None, ax=None, return_data=False, **kwargs):
+def plot_surfaces(
+    eq,
+    rho=8,
+    theta=8,
+    phi=None,
+    ax=None,
+    return_data=False,
+    plot_data=None,
+    **kwargs,
+):
     """Plot flux surfaces.
 
     Parameters
@@ -1514,6 +1852,10 @@ def plot_surfaces(eq, rho=8, theta=8, phi=None, ax=None, return_data=False, **kw
         Axis to plot on.
     return_data : bool
         if True, return the data plotted as well as fig,ax
+    plot_data : dict, optional
+        Data returned by a previous call with ``return_data=True``. If given, it is
+        plotted instead of recomputing it. The other arguments should be the same
+        as in that call.
     **kwargs : dict, optional
         Specify properties of the figure, axis, and plot appearance e.g.::
 
@@ -1607,67 +1949,17 @@ def plot_surfaces(eq, rho=8, theta=8, phi=None, ax=None, return_data=False, **kw
     phi = np.atleast_1d(phi)
     nphi = len(phi)
 
-    grid_kwargs = {
-        "rho": rho,
-        "NFP": nfp,
-        "theta": np.linspace(0, 2 * np.pi, NT, endpoint=True),
-        "zeta": phi,
-    }
-    r_grid = _get_grid(**grid_kwargs)
-    rnr, rnt, rnz = r_grid.num_rho, r_grid.num_theta, r_grid.num_zeta
-    r_grid = Grid(
-        map_coordinates(
-            eq,
-            r_grid.nodes,
-            ["rho", "theta", "phi"],
-            ["rho", "theta", "zeta"],
-            period=(np.inf, 2 * np.pi, 2 * np.pi),
-            guess=r_grid.nodes,
-        ),
-        sort=False,
-    )
-    grid_kwargs = {
-        "rho": np.linspace(0, 1, NR),
-        "NFP": nfp,
-        "theta": theta,
-        "zeta": phi,
-    }
-    if plot_theta:
-        # Note: theta* (also known as vartheta) is the poloidal straight field line
-        # angle in PEST-like flux coordinates
-        t_grid = _get_grid(**grid_kwargs)
-        tnr, tnt, tnz = t_grid.num_rho, t_grid.num_theta, t_grid.num_zeta
-        v_grid = Grid(
-            map_coordinates(
-                eq,
-                t_grid.nodes,
-                ["rho", "theta_PEST", "phi"],
-                ["rho", "theta", "zeta"],
-                period=(np.inf, 2 * np.pi, 2 * np.pi),
-                guess=t_grid.nodes,
-            ),
-            sort=False,
-        )
     rows = np.floor(np.sqrt(nphi)).astype(int)
     cols = np.ceil(nphi / rows).astype(int)
 
-    # rho contours
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        r_coords = eq.compute(["R", "Z"], grid=r_grid)
-    Rr = r_coords["R"].reshape((rnt, rnr, rnz), order="F")
-    Zr = r_coords["Z"].reshape((rnt, rnr, rnz), order="F")
-    plot_data = {}
-
+    if plot_data is None:
+        plot_data = _surfaces_data(
+            [eq], rho, theta if plot_theta else None, phi, NR, NT
+        )[0]
+    plot_theta = "vartheta_R_coords" in plot_data
+    Rr, Zr = plot_data["rho_R_coords"], plot_data["rho_Z_coords"]
     if plot_theta:
-        # vartheta contours
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            v_coords = eq.compute(["R", "Z"], grid=v_grid)
-        Rv = v_coords["R"].reshape((tnt, tnr, tnz), order="F")
-        Zv = v_coords["Z"].reshape((tnt, tnr, tnz), order="F")
-        plot_data["vartheta_R_coords"] = Rv
-        plot_data["vartheta_Z_coords"] = Zv
+        Rv, Zv = plot_data["vartheta_R_coords"], plot_data["vartheta_Z_coords"]
 
     figw = 4 * cols
     figh = 5 * rows
@@ -1718,8 +2010,6 @@ def plot_surfaces(eq, rho=8, theta=8, phi=None, ax=None, return_data=False, **kw
 
     _set_tight_layout(fig)
 
-    plot_data["rho_R_coords"] = Rr
-    plot_data["rho_Z_coords"] = Zr
     if return_data:
         return fig, ax, plot_data
 
@@ -1876,7 +2166,15 @@ def poincare_plot(
     return fig, ax
 
 
-def plot_boundary(eq, phi=None, plot_axis=True, ax=None, return_data=False, **kwargs):
+def plot_boundary(
+    eq,
+    phi=None,
+    plot_axis=True,
+    ax=None,
+    return_data=False,
+    plot_data=None,
+    **kwargs,
+):
     """Plot stellarator boundary at multiple toroidal coordinates.
 
     Parameters
@@ -1893,6 +2191,10 @@ def plot_boundary(eq, phi=None, plot_axis=True, ax=None, return_data=False, **kw
         Axis to plot on.
     return_data : bool
         if True, return the data plotted as well as fig,ax
+    plot_data : dict, optional
+        Data returned by a previous call with ``return_data=True``. If given, it is
+        plotted instead of recomputing it. The other arguments should be the same
+        as in that call.
     **kwargs : dict, optional
         Specify properties of the figure, axis, and plot appearance e.g.::
 
@@ -1953,41 +2255,22 @@ def plot_boundary(eq, phi=None, plot_axis=True, ax=None, return_data=False, **kw
         phi = np.linspace(0, 2 * np.pi / eq.NFP, phi, endpoint=False)
     phi = np.atleast_1d(phi)
     nphi = len(phi)
-    # don't plot axis for FourierRZToroidalSurface, since it's not defined.
-    plot_axis = plot_axis and eq.L > 0
-    rho = np.array([0.0, 1.0]) if plot_axis else np.array([1.0])
-
-    grid_kwargs = {"NFP": eq.NFP, "rho": rho, "theta": 100, "zeta": phi}
-    grid = _get_grid(**grid_kwargs)
-    nr, nt, nz = grid.num_rho, grid.num_theta, grid.num_zeta
-    grid = Grid(
-        map_coordinates(
-            eq,
-            grid.nodes,
-            ["rho", "theta", "phi"],
-            ["rho", "theta", "zeta"],
-            period=(np.inf, 2 * np.pi, 2 * np.pi),
-            guess=grid.nodes,
-        ),
-        sort=False,
-    )
-
     if colors is None:
         colors = _get_cmap(cmap)((phi * eq.NFP / (2 * np.pi)) % 1)
     if lw is None:
         lw = 1
     if isinstance(lw, int):
-        lw = [lw for _ in range(nz)]
+        lw = [lw for _ in range(nphi)]
     if ls is None:
         ls = "-"
     if isinstance(ls, str):
-        ls = [ls for _ in range(nz)]
+        ls = [ls for _ in range(nphi)]
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        coords = eq.compute(["R", "Z"], grid=grid)
-    R = coords["R"].reshape((nt, nr, nz), order="F")
-    Z = coords["Z"].reshape((nt, nr, nz), order="F")
+    if plot_data is None:
+        plot_data = _boundaries_data([eq], phi, plot_axis)[0]
+    R, Z = plot_data["R"], plot_data["Z"]
+    # magnetic axis is included if the grid had more than one surface
+    plot_axis = R.shape[1] > 1
 
     fig, ax = _format_ax(ax, figsize=figsize, equal=True)
 
@@ -2002,7 +2285,7 @@ def plot_boundary(eq, phi=None, plot_axis=True, ax=None, return_data=False, **kw
                 eq.NFP * phi[i] / (2 * np.pi)
             ),
         )
-        if rho[0] == 0:
+        if plot_axis:
             ax.scatter(R[0, 0, i], Z[0, 0, i], color=colors[i], marker=marker, s=size)
 
     ax.set_xlabel(_AXIS_LABELS_RPZ[0], fontsize=xlabel_fontsize)
@@ -2012,10 +2295,6 @@ def plot_boundary(eq, phi=None, plot_axis=True, ax=None, return_data=False, **kw
     fig.legend(**legend_kw)
     _set_tight_layout(fig)
 
-    plot_data = {}
-    plot_data["R"] = R
-    plot_data["Z"] = Z
-
     if return_data:
         return fig, ax, plot_data
 
@@ -2023,7 +2302,15 @@ def plot_boundary(eq, phi=None, plot_axis=True, ax=None, return_data=False, **kw
 
 
 def plot_boundaries(
-    eqs, labels=None, phi=None, plot_axis=True, ax=None, return_data=False, **kwargs
+    eqs,
+    labels=None,
+    phi=None,
+    plot_axis=True,
+    ax=None,
+    return_data=False,
+    plot_data=None,
+    max_workers=1,
+    **kwargs,
 ):
     """Plot stellarator boundaries at multiple toroidal coordinates.
 
@@ -2043,6 +2330,13 @@ def plot_boundaries(
         Axis to plot on.
     return_data : bool
         if True, return the data plotted as well as fig,ax
+    plot_data : dict, optional
+        Data returned by a previous call with ``return_data=True``. If given, it is
+        plotted instead of recomputing it. The other arguments should be the same
+        as in that call.
+    max_workers : int or None
+        Maximum number of threads used to compute the data of the equilibria.
+        Default is 1, which computes them serially.
     **kwargs : dict, optional
         Specify properties of the figure, axis, and plot appearance e.g.::
 
@@ -2117,43 +2411,18 @@ def plot_boundaries(
         ls = [ls for i in range(neq)]
 
     fig, ax = _format_ax(ax, figsize=figsize, equal=True)
-    plot_data = {}
-    plot_data["R"] = []
-    plot_data["Z"] = []
+    if plot_data is None:
+        data = _boundaries_data(eqs, phi, plot_axis, max_workers)
+        plot_data = {"R": [d["R"] for d in data], "Z": [d["Z"] for d in data]}
 
     for i in range(neq):
-        # don't plot axis for FourierRZToroidalSurface, since it's not defined.
-        plot_axis_i = plot_axis and eqs[i].L > 0
-        rho = np.array([0.0, 1.0]) if plot_axis_i else np.array([1.0])
-
-        grid_kwargs = {"NFP": eqs[i].NFP, "theta": 100, "zeta": phi, "rho": rho}
-        grid = _get_grid(**grid_kwargs)
-        nr, nt, nz = grid.num_rho, grid.num_theta, grid.num_zeta
-        grid = Grid(
-            map_coordinates(
-                eqs[i],
-                grid.nodes,
-                ["rho", "theta", "phi"],
-                ["rho", "theta", "zeta"],
-                period=(np.inf, 2 * np.pi, 2 * np.pi),
-                guess=grid.nodes,
-            ),
-            sort=False,
-        )
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            coords = eqs[i].compute(["R", "Z"], grid=grid)
-        R = coords["R"].reshape((nt, nr, nz), order="F")
-        Z = coords["Z"].reshape((nt, nr, nz), order="F")
-
-        plot_data["R"].append(R)
-        plot_data["Z"].append(Z)
-
+        R, Z = plot_data["R"][i], plot_data["Z"][i]
+        nz = R.shape[2]
         for j in range(nz - 1):
             (line,) = ax.plot(
                 R[:, -1, j], Z[:, -1, j], color=colors[i], linestyle=ls[i], lw=lw[i]
             )
-            if rho[0] == 0:
+            if R.shape[1] > 1:
                 ax.scatter(
                     R[0, 0, j], Z[0, 0, j], color=colors[i], marker=marker, s=size
                 )
@@ -2191,6 +2460,8 @@ def plot_comparison(
     ls=None,
     labels=None,
     return_data=False,
+    plot_data=None,
+    max_workers=1,
     **kwargs,
 ):
     """Plot comparison between flux surfaces of multiple equilibria.
@@ -2224,6 +2495,13 @@ def plot_comparison(
         Array the same length as eqs of labels to apply to each equilibrium.
     return_data : bool
         if True, return the data plotted as well as fig,ax
+    plot_data : dict, optional
+        Data returned by a previous call with ``return_data=True``. If given, it is
+        plotted instead of recomputing it. The other arguments should be the same
+        as in that call.
+    max_workers : int or None
+        Maximum number of threads used to compute the data of the equilibria.
+        Default is 1, which computes them serially.
     **kwargs : dict, optional
         Specify properties of the figure, axis, and plot appearance e.g.::
 
@@ -2300,21 +2578,37 @@ def plot_comparison(
     fig, ax = _format_ax(ax, rows=rows, cols=cols, figsize=figsize, equal=True)
     ax = np.atleast_1d(ax).flatten()
 
-    plot_data = {}
-    for string in [
-        "rho_R_coords",
-        "rho_Z_coords",
-        "vartheta_R_coords",
-        "vartheta_Z_coords",
-    ]:
-        plot_data[string] = []
+    if plot_data is None:
+        if isinstance(rho, numbers.Integral):
+            rho = np.linspace(0, 1, rho + 1)
+        rho = np.atleast_1d(rho)
+        vartheta = None
+        if theta:
+            vartheta = np.atleast_1d(
+                np.linspace(0, 2 * np.pi, theta, endpoint=False)
+                if isinstance(theta, numbers.Integral)
+                else theta
+            )
+        data = _surfaces_data(eqs, rho, vartheta, phi, max_workers=max_workers)
+        plot_data = {
+            key: [d[key] for d in data if key in d]
+            for key in [
+                "rho_R_coords",
+                "rho_Z_coords",
+                "vartheta_R_coords",
+                "vartheta_Z_coords",
+            ]
+        }
+    else:
+        plot_data = {key: list(val) for key, val in plot_data.items()}
     for i, eq in enumerate(eqs):
-        fig, ax, _plot_data = plot_surfaces(
+        fig, ax = plot_surfaces(
             eq,
             rho,
             theta,
             phi,
             ax,
+            plot_data={key: val[i] for key, val in plot_data.items() if len(val)},
             theta_color=color[i % len(color)],
             theta_ls=ls[i % len(ls)],
             theta_lw=lw[i % len(lw)],
@@ -2332,10 +2626,7 @@ def plot_comparison(
             title_fontsize=title_fontsize,
             xlabel_fontsize=xlabel_fontsize,
             ylabel_fontsize=ylabel_fontsize,
-            return_data=True,
         )
-        for key in _plot_data.keys():
-            plot_data[key].append(_plot_data[key])
 
     if any(labels) and kwargs.pop("legend", True):
         fig.legend(**kwargs.pop("legend_kw", {}))
@@ -2568,7 +2859,7 @@ def plot_boozer_modes(  # noqa: C901
     elif np.isscalar(rho) and rho > 1:
         rho = np.linspace(1, 0, num=rho, endpoint=False)
 
-    B_mn = np.array([[]])
+    rho = np.atleast_1d(rho)
     M_booz = kwargs.pop("M_booz", 2 * eq.M)
     N_booz = kwargs.pop("N_booz", 2 * eq.N)
     linestyle = kwargs.pop("ls", "-")
@@ -2576,26 +2867,23 @@ def plot_boozer_modes(  # noqa: C901
     xlabel_fontsize = kwargs.pop("xlabel_fontsize", None)
     ylabel_fontsize = kwargs.pop("ylabel_fontsize", None)
 
-    basis = get_transforms(
-        "|B|_mn", obj=eq, grid=Grid(np.array([])), M_booz=M_booz, N_booz=N_booz
-    )["B"].basis
+    # Boozer transform of all surfaces at once
+    grid = LinearGrid(M=2 * eq.M_grid, N=2 * eq.N_grid, NFP=eq.NFP, rho=rho)
+    transforms = get_transforms(
+        "|B|_mn", obj=eq, grid=grid, M_booz=M_booz, N_booz=N_booz
+    )
     if helicity:
         matrix, modes, symidx = ptolemy_linear_transform(
-            basis.modes, helicity=helicity, NFP=eq.NFP
+            transforms["B"].basis.modes, helicity=helicity, NFP=eq.NFP
         )
     else:
-        matrix, modes = ptolemy_linear_transform(basis.modes)
-
-    for i, r in enumerate(rho):
-        grid = LinearGrid(M=2 * eq.M_grid, N=2 * eq.N_grid, NFP=eq.NFP, rho=np.array(r))
-        transforms = get_transforms(
-            "|B|_mn", obj=eq, grid=grid, M_booz=M_booz, N_booz=N_booz
-        )
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            data = eq.compute("|B|_mn", grid=grid, transforms=transforms)
-        b_mn = np.atleast_2d(matrix @ data["|B|_mn"])
-        B_mn = np.vstack((B_mn, b_mn)) if B_mn.size else b_mn
+        matrix, modes = ptolemy_linear_transform(transforms["B"].basis.modes)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        data = eq.compute("|B|_mn", grid=grid, transforms=transforms)
+    B_mn = data["|B|_mn"].reshape((grid.num_rho, -1)) @ matrix.T
+    # surfaces of the grid are sorted by rho
+    B_mn = B_mn[np.searchsorted(grid.compress(grid.nodes[:, 0]), rho)]
 
     zidx = np.where((modes[:, 1:] == np.array([[0, 0]])).all(axis=1))[0]
     if norm:
@@ -2985,26 +3273,28 @@ def plot_qs_error(  # noqa: 16 fxn too complex
     f_C = np.array([])
     f_T = np.array([])
     plot_data = {}
+    if fB:
+        # Boozer transform of all surfaces at once
+        grid = LinearGrid(M=2 * eq.M_grid, N=2 * eq.N_grid, NFP=eq.NFP, rho=rho)
+        transforms = get_transforms(
+            "|B|_mn", obj=eq, grid=grid, M_booz=M_booz, N_booz=N_booz
+        )
+        matrix, modes, idx = ptolemy_linear_transform(
+            transforms["B"].basis.modes,
+            helicity=helicity,
+            NFP=transforms["B"].basis.NFP,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            data = eq.compute(["|B|_mn", "B modes"], grid=grid, transforms=transforms)
+        B_mn = data["|B|_mn"].reshape((grid.num_rho, -1)) @ matrix.T
+        # surfaces of the grid are sorted by rho
+        B_mn = B_mn[np.searchsorted(grid.compress(grid.nodes[:, 0]), rho)]
+        f_B = np.sqrt(np.sum(B_mn[:, idx] ** 2, axis=-1)) / np.sqrt(
+            np.sum(B_mn**2, axis=-1)
+        )
     for i, r in enumerate(rho):
         grid = LinearGrid(M=2 * eq.M_grid, N=2 * eq.N_grid, NFP=eq.NFP, rho=np.array(r))
-        if fB:
-            transforms = get_transforms(
-                "|B|_mn", obj=eq, grid=grid, M_booz=M_booz, N_booz=N_booz
-            )
-            if i == 0:  # only need to do this once for the first rho surface
-                matrix, modes, idx = ptolemy_linear_transform(
-                    transforms["B"].basis.modes,
-                    helicity=helicity,
-                    NFP=transforms["B"].basis.NFP,
-                )
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                data = eq.compute(
-                    ["|B|_mn", "B modes"], grid=grid, transforms=transforms
-                )
-            B_mn = matrix @ data["|B|_mn"]
-            f_b = np.sqrt(np.sum(B_mn[idx] ** 2)) / np.sqrt(np.sum(B_mn**2))
-            f_B = np.append(f_B, f_b)
         if fC:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
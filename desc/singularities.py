@@ -4,10 +4,9 @@ from abc import ABC, abstractmethod
 
 import numpy as np
 import scipy
-from interpax import fft_interp2d
 
 from desc.backend import fori_loop, jnp, put, vmap
-from desc.basis import DoubleFourierSeries
+from desc.basis import DoubleFourierSeries, fourier
 from desc.compute import rpz2xyz, rpz2xyz_vec, xyz2rpz_vec
 from desc.compute.utils import safediv, safenorm
 from desc.grid import LinearGrid
@@ -83,7 +82,6 @@ class _BIESTInterpolator(IOAble, ABC):
         """int: Order of quadrature in polar domain."""
         return self._q
 
-    @abstractmethod
     def __call__(self, f, i):
         """Interpolate data to polar grid points.
 
@@ -99,6 +97,19 @@ class _BIESTInterpolator(IOAble, ABC):
         fi : ndarray
             Source data interpolated to ith polar node.
         """
+        return self._interpolate(self._transform(f), i)
+
+    @abstractmethod
+    def _transform(self, f):
+        """Transform source data to the representation used for interpolation.
+
+        This is the part of the interpolation that doesn't depend on the polar node,
+        so it only needs to be done once when interpolating to many polar nodes.
+        """
+
+    @abstractmethod
+    def _interpolate(self, c, i):
+        """Interpolate transformed source data c to the ith polar node."""
 
 
 class FFTInterpolator(_BIESTInterpolator):
@@ -117,7 +128,14 @@ class FFTInterpolator(_BIESTInterpolator):
 
     """
 
-    _io_attrs_ = _BIESTInterpolator._io_attrs_ + ["_h_t", "_h_z", "_st", "_sz"]
+    _io_attrs_ = _BIESTInterpolator._io_attrs_ + [
+        "_h_t",
+        "_h_z",
+        "_st",
+        "_sz",
+        "_shift_t",
+        "_shift_z",
+    ]
 
     def __init__(self, eval_grid, source_grid, s, q):
         # current fft interpolating can't handle symmetric grids correctly
@@ -197,37 +215,48 @@ class FFTInterpolator(_BIESTInterpolator):
         self._st = s / 2 * self._h_t * r * jnp.sin(w)
         self._sz = s / 2 * self._h_z * r * jnp.cos(w)
 
-    def __call__(self, f, i):
-        """Interpolate data to polar grid points.
+        # phase shifts of each Fourier mode to each polar node, so that
+        # interpolating is just a multiply and an inverse transform
+        kt = jnp.fft.fftfreq(source_grid.num_theta)[:, None]
+        kz = jnp.fft.fftfreq(source_grid.num_zeta)[:, None]
+        self._shift_t = jnp.exp(-1j * 2 * jnp.pi * kt * self._st / self._h_t)
+        self._shift_z = jnp.exp(-1j * 2 * jnp.pi * kz * self._sz / self._h_z)
 
-        Parameters
-        ----------
-        f : ndarray
-            Data at source grid points to interpolate.
-        i : int
-            Index of polar node.
-
-        Returns
-        -------
-        fi : ndarray
-            Source data interpolated to ith polar node.
-        """
-        shp = f.shape[1:]
+    def _transform(self, f):
+        """Fourier transform source data, shape(num_theta, num_zeta, ...)."""
         f = f.reshape(
-            (self._source_grid.num_theta, self._source_grid.num_zeta, -1), order="F"
-        )
-        g = fft_interp2d(
-            f,
-            self._eval_grid.num_theta,
-            self._eval_grid.num_zeta,
-            sx=self._st[i],
-            sy=self._sz[i],
-            dx=self._h_t,
-            dy=self._h_z,
+            (self._source_grid.num_theta, self._source_grid.num_zeta, *f.shape[1:]),
+            order="F",
         )
+        return jnp.fft.ifft2(f, axes=(0, 1))
+
+    def _interpolate(self, c, i):
+        """Interpolate Fourier transformed source data c to the ith polar node."""
+        shp = c.shape[2:]
+        c = c.reshape((*c.shape[:2], -1))
+        c = c * self._shift_t[:, i, None, None] * self._shift_z[None, :, i, None]
+        c = _pad_fourier(c, self._eval_grid.num_theta, axis=0)
+        c = _pad_fourier(c, self._eval_grid.num_zeta, axis=1)
+        g = jnp.fft.fft2(c, axes=(0, 1)).real
         return g.reshape((self._eval_grid.num_nodes, *shp), order="F")
 
 
+def _pad_fourier(c, n, axis):
+    """Zero pad or truncate Fourier coefficients c along axis to n modes."""
+    nx = c.shape[axis]
+    if n == nx:
+        return c
+    pad = ((n - nx) // 2, n - nx - (n - nx) // 2)
+    if nx % 2 != 0:
+        pad = pad[::-1]
+    c = jnp.moveaxis(jnp.fft.fftshift(c, axes=axis), axis, 0)
+    c = c[max(-pad[0], 0) : nx - max(-pad[1], 0)]
+    npad = [(0, 0)] * c.ndim
+    npad[0] = (max(pad[0], 0), max(pad[1], 0))
+    c = jnp.pad(c, npad)
+    return jnp.fft.ifftshift(jnp.moveaxis(c, 0, axis), axes=axis)
+
+
 class DFTInterpolator(_BIESTInterpolator):
     """Fourier interpolation matrix required for high order singular integration.
 
@@ -244,7 +273,7 @@ class DFTInterpolator(_BIESTInterpolator):
 
     """
 
-    _io_attrs_ = _BIESTInterpolator._io_attrs_ + ["_mat"]
+    _io_attrs_ = _BIESTInterpolator._io_attrs_ + ["_mat_t", "_mat_z", "_Ainv"]
 
     def __init__(self, eval_grid, source_grid, s, q):
         # need source_grid to be linearly spaced in theta, zeta,
@@ -301,39 +330,27 @@ class DFTInterpolator(_BIESTInterpolator):
         A = basis.evaluate(source_grid.nodes)
         Ainv = jnp.linalg.pinv(A)
 
-        B = jnp.zeros((*theta_q.shape, basis.num_modes))
-
-        def body(i, B):
-            x = jnp.array(
-                [
-                    jnp.zeros_like(theta_q[i]),
-                    theta_q[i],
-                    zeta_q[i],
-                ]
-            ).T
-            Bi = basis.evaluate(jnp.atleast_2d(x))
-            B = put(B, i, Bi)
-            return B
-
-        B = fori_loop(0, B.shape[0], body, B)
-        self._mat = B @ Ainv
-
-    def __call__(self, f, i):
-        """Interpolate data to polar grid points.
-
-        Parameters
-        ----------
-        f : ndarray
-            Data at source grid points to interpolate.
-        i : int
-            Index of polar node.
-
-        Returns
-        -------
-        fi : ndarray
-            Source data interpolated to ith polar node.
-        """
-        return self._mat[:, i] @ f
+        # The basis is a tensor product of poloidal and toroidal Fourier series, so
+        # rather than the full interpolation matrix of shape
+        # (eval nodes, polar nodes, source nodes) we store the 1D factors and the
+        # coefficients of the source data on a (poloidal, toroidal) mode grid.
+        m = np.arange(-source_grid.M, source_grid.M + 1)
+        n = np.arange(-source_grid.N, source_grid.N + 1)
+        self._mat_t = fourier(theta_q[..., None], m)
+        self._mat_z = fourier(zeta_q[..., None], n, source_grid.NFP)
+        idx_m = np.searchsorted(m, basis.modes[:, 1])
+        idx_n = np.searchsorted(n, basis.modes[:, 2])
+        Ainv_mn = np.zeros((m.size, n.size, source_grid.num_nodes))
+        Ainv_mn[idx_m, idx_n] = Ainv
+        self._Ainv = jnp.asarray(Ainv_mn)
+
+    def _transform(self, f):
+        """Fourier coefficients of source data, shape(num_m, num_n, ...)."""
+        return jnp.tensordot(self._Ainv, f, axes=1)
+
+    def _interpolate(self, c, i):
+        """Interpolate source Fourier coefficients c to the ith polar node."""
+        return jnp.einsum("em,mn...,en->e...", self._mat_t[:, i], c, self._mat_z[:, i])
 
 
 def _chi(rho):
@@ -350,8 +367,32 @@ def _rho(theta, zeta, theta0, zeta0, dtheta, dzeta, s):
     return 2 / s * jnp.sqrt((dt / dtheta) ** 2 + (dz / dzeta) ** 2)
 
 
+def _chunk_indices(n, chunk_size):
+    """Split range(n) into blocks of chunk_size.
+
+    Returns
+    -------
+    idx : ndarray, shape(num_chunks, chunk_size)
+        Indices in each block. The last block is padded with n-1.
+    mask : ndarray, shape(num_chunks, chunk_size)
+        False for the padded entries.
+
+    """
+    chunk_size = min(chunk_size, n)
+    num_chunks = -(-n // chunk_size)
+    idx = np.arange(num_chunks * chunk_size).reshape((num_chunks, chunk_size))
+    return jnp.asarray(np.minimum(idx, n - 1)), jnp.asarray(idx < n)
+
+
 def _nonsingular_part(
-    eval_data, eval_grid, source_data, source_grid, s, kernel, loop=False
+    eval_data,
+    eval_grid,
+    source_data,
+    source_grid,
+    s,
+    kernel,
+    loop=False,
+    chunk_size=None,
 ):
     """Integrate kernel over non-singular points.
 
@@ -370,6 +411,8 @@ def _nonsingular_part(
 
     source_phi = source_data["phi"]
     keys = kernel.keys
+    if chunk_size is not None:
+        idx, _ = _chunk_indices(eval_grid.num_nodes, chunk_size)
 
     def nfp_loop(j, f_data):
         # calculate effects at all eval pts from all source pts on a single field
@@ -413,9 +456,17 @@ def _nonsingular_part(
             f_temp = eval_pt_vmap(i)
             return put(fj, i, f_temp.reshape(fj[i].shape))
 
+        def eval_chunk_loop(j, fj):
+            # effect at a block of evaluation points, from all others in a single
+            # field period. loop over blocks to get all pts
+            f_temp = vmap(eval_pt_vmap)(idx[j])
+            return put(fj, idx[j], f_temp.reshape((-1, kernel.ndim)))
+
         # vmap for inner part found more efficient than fori_loop, especially on gpu,
         # but for jacobian looped seems to be better and less memory
-        if loop:
+        if chunk_size is not None:
+            fj = fori_loop(0, idx.shape[0], eval_chunk_loop, jnp.zeros_like(f))
+        elif loop:
             fj = fori_loop(0, eval_grid.num_nodes, eval_pt_loop, jnp.zeros_like(f))
         else:
             fj = vmap(eval_pt_vmap)(jnp.arange(eval_grid.num_nodes))
@@ -436,6 +487,219 @@ def _nonsingular_part(
     return f
 
 
+def _hmatrix_blocks(eval_grid, source_grid, num_skeleton, leaf_size, eta=1.0):
+    """Partition interactions between eval and source nodes into a block tree.
+
+    Nodes are grouped into tiles by recursively bisecting the (θ, ζ) domain, with
+    source nodes taken over the full torus (NFP copies of source_grid). Distances
+    are measured in units of the source grid spacing, and the domain is first split
+    along ζ into roughly square tiles. A pair of tiles is admissible (well
+    separated) if the distance between them is at least ``eta`` times their
+    diameter. Admissible pairs are kept at the coarsest level possible, other pairs
+    are refined until the tiles have about ``leaf_size`` nodes, after which they
+    are evaluated directly.
+
+    Parameters
+    ----------
+    eval_grid, source_grid : Grid
+        Evaluation and source points for the integral transform.
+    num_skeleton : int
+        Approximate number of skeleton nodes in each tile, spread uniformly over
+        the tile.
+    leaf_size : int
+        Approximate number of nodes in the smallest tiles.
+    eta : float
+        Admissibility parameter.
+
+    Returns
+    -------
+    blocks : list of tuple of ndarray
+        For each level with admissible pairs, (eval_idx, source_idx, eval_skel,
+        source_skel) of each block, of shape (num_blocks, tile size) for the first
+        two and (num_blocks, num skeleton nodes) for the last two. Padding is
+        given by index -1.
+    near : tuple of ndarray
+        (eval_idx, source_idx) of shape (num_leaves, leaf size) and
+        (num_leaves, near size), eval nodes in each leaf tile and all source nodes
+        not in admissible blocks with that tile.
+
+    """
+    NFP = int(source_grid.NFP)
+    # size of the domain in units of source grid spacing
+    nt = source_grid.num_theta
+    nz = source_grid.num_zeta * NFP
+    num_roots = max(int(round(nz / nt)), 1)
+    num_levels = max(
+        int(np.round(np.log(nt * nz / num_roots / leaf_size) / np.log(4))), 0
+    )
+    p = int(np.ceil(np.sqrt(num_skeleton)))
+
+    def coords(theta, zeta):
+        return (theta % (2 * np.pi)) / (2 * np.pi), (zeta % (2 * np.pi)) / (2 * np.pi)
+
+    eval_coords = coords(eval_grid.nodes[:, 1], eval_grid.nodes[:, 2])
+    source_coords = coords(
+        np.tile(source_grid.nodes[:, 1], NFP),
+        np.tile(source_grid.nodes[:, 2], NFP)
+        + np.repeat(np.arange(NFP), source_grid.num_nodes) * 2 * np.pi / NFP,
+    )
+
+    def tiles(u, v, level):
+        # map from (θ bin, ζ bin) to node indices and skeleton node indices
+        nu, nv = 2**level, num_roots * 2**level
+        iu = np.minimum((u * nu).astype(int), nu - 1)
+        iv = np.minimum((v * nv).astype(int), nv - 1)
+        out = {}
+        for i, key in enumerate(zip(iu, iv)):
+            out.setdefault(key, []).append(i)
+        skel = {}
+        for key, idx in out.items():
+            # nodes closest to a p x p lattice over the tile
+            lattice = (np.arange(p) + 0.5) / p
+            lu = ((key[0] + lattice) / nu)[:, None]
+            lv = ((key[1] + lattice) / nv)[None, :]
+            du = (u[idx][:, None, None] - lu[None]) * nt
+            dv = (v[idx][:, None, None] - lv[None]) * nz
+            nearest = np.argmin(du**2 + dv**2, axis=0).flatten()
+            skel[key] = list(np.array(idx)[np.unique(nearest)])
+        return out, skel
+
+    eval_tiles = [tiles(*eval_coords, l) for l in range(num_levels + 1)]
+    source_tiles = [tiles(*source_coords, l) for l in range(num_levels + 1)]
+
+    def admissible(a, b, level):
+        nu, nv = 2**level, num_roots * 2**level
+        wu, wv = nt / nu, nz / nv
+        du = abs(a[0] - b[0])
+        dv = abs(a[1] - b[1])
+        du = max(min(du, nu - du) - 1, 0) * wu
+        dv = max(min(dv, nv - dv) - 1, 0) * wv
+        return np.hypot(du, dv) >= eta * np.hypot(wu, wv)
+
+    def children(key, level, tiles):
+        out = []
+        for i in range(2):
+            for j in range(2):
+                child = (2 * key[0] + i, 2 * key[1] + j)
+                if child in tiles[level + 1][0]:
+                    out.append(child)
+        return out
+
+    far = [[] for _ in range(num_levels + 1)]
+    near = {}
+    pairs = [(e, s) for e in eval_tiles[0][0] for s in source_tiles[0][0]]
+    for level in range(num_levels + 1):
+        (etiles, eskel), (stiles, sskel) = eval_tiles[level], source_tiles[level]
+        new_pairs = []
+        for e, s in pairs:
+            if admissible(e, s, level):
+                far[level].append((etiles[e], stiles[s], eskel[e], sskel[s]))
+            elif level == num_levels:
+                near.setdefault(e, []).extend(stiles[s])
+            else:
+                new_pairs += [
+                    (ec, sc)
+                    for ec in children(e, level, eval_tiles)
+                    for sc in children(s, level, source_tiles)
+                ]
+        pairs = new_pairs
+
+    def pad(idx):
+        n = max(len(i) for i in idx)
+        return np.array([i + [-1] * (n - len(i)) for i in idx])
+
+    blocks = [tuple(pad(list(idx)) for idx in zip(*b)) for b in far if len(b)]
+    near = (
+        pad([eval_tiles[num_levels][0][e] for e in near]),
+        pad([near[e] for e in near]),
+    )
+    return blocks, near
+
+
+def _nonsingular_part_hmatrix(
+    eval_data, eval_grid, source_data, source_grid, s, kernel, tol
+):
+    """Integrate kernel over non-singular points using a hierarchical matrix.
+
+    Interactions between well separated groups of points are approximated by low
+    rank blocks, which only need the rows and columns of each block corresponding
+    to a few skeleton points spread over each group. Close interactions are
+    computed directly.
+    """
+    assert source_grid.NFP == int(source_grid.NFP)
+    NFP = int(source_grid.NFP)
+    # number of skeleton nodes per tile in each direction, roughly the order of
+    # polynomial needed to resolve a smooth kernel to the given tolerance
+    p = int(np.ceil(-np.log10(tol))) + 2
+    blocks, near = _hmatrix_blocks(eval_grid, source_grid, p**2, 8 * p**2)
+
+    # source data over the full torus
+    keys = kernel.keys
+    shift = jnp.repeat(jnp.arange(NFP), source_grid.num_nodes) * 2 * np.pi / NFP
+    source_full = {
+        key: jnp.concatenate([source_data[key]] * NFP) for key in keys if key != "phi"
+    }
+    source_full["phi"] = (jnp.tile(source_data["phi"], NFP) + shift) % (2 * np.pi)
+    source_theta = jnp.tile(jnp.asarray(source_grid.nodes[:, 1]), NFP)
+    source_zeta = (jnp.tile(jnp.asarray(source_grid.nodes[:, 2]), NFP) + shift) % (
+        2 * np.pi
+    )
+    w = jnp.tile(source_grid.weights * source_data["|e_theta x e_zeta|"] / NFP, NFP)
+    eval_theta = jnp.asarray(eval_grid.nodes[:, 1])
+    eval_zeta = jnp.asarray(eval_grid.nodes[:, 2])
+    eval_keys = {key: val for key, val in eval_data.items() if key in keys}
+    h_t = jnp.mean(source_grid.spacing[:, 1])
+    h_z = jnp.mean(source_grid.spacing[:, 2] / NFP)
+
+    def interaction(ie, js):
+        # kernel times quadrature weight for eval nodes ie and source nodes js,
+        # shape(len(ie), len(js), ndim). Padding (-1) gives zero.
+        mask = (ie >= 0)[:, None] & (js >= 0)[None, :]
+        ie, js = jnp.where(ie >= 0, ie, 0), jnp.where(js >= 0, js, 0)
+        k = kernel(
+            {key: val[ie] for key, val in eval_keys.items()},
+            {key: val[js] for key, val in source_full.items()},
+        ).reshape((ie.size, js.size, kernel.ndim))
+        rho = _rho(
+            source_theta[js][None, :],
+            source_zeta[js][None, :],
+            eval_theta[ie][:, None],
+            eval_zeta[ie][:, None],
+            h_t,
+            h_z,
+            s,
+        )
+        eta = _chi(rho)  # from eq 36 of [2]
+        return k * jnp.where(mask, (1 - eta) * w[js][None, :], 0)[:, :, None]
+
+    def far_block(ie, js, ie_skel, js_skel):
+        # A @ 1 ≈ A[:, J] @ pinv(A[I, J]) @ A[I, :] @ 1 for skeleton rows and
+        # columns I, J of the block A
+        C = interaction(ie, js_skel).transpose((0, 2, 1))
+        R = interaction(ie_skel, js).sum(axis=1).flatten()
+        U = interaction(ie_skel, js_skel).transpose((0, 2, 1))
+        U = U.reshape((-1, U.shape[-1]))
+        return C @ (jnp.linalg.pinv(U, tol) @ R)
+
+    f = jnp.zeros((eval_grid.num_nodes + 1, kernel.ndim))
+    for ie, js, ie_skel, js_skel in blocks:
+        fb = vmap(far_block)(*map(jnp.asarray, (ie, js, ie_skel, js_skel)))
+        f = f.at[ie.flatten()].add(fb.reshape((-1, kernel.ndim)))
+    ie, js = near
+    fn = vmap(lambda ie, js: interaction(ie, js).sum(axis=1))(
+        jnp.asarray(ie), jnp.asarray(js)
+    )
+    f = f.at[ie.flatten()].add(fn.reshape((-1, kernel.ndim)))
+    # padding was added to the last row
+    f = f[:-1]
+
+    # we sum distance vectors, so they need to be in xyz for that to work
+    # but then need to convert vectors back to rpz
+    if kernel.ndim == 3:
+        f = xyz2rpz_vec(f, phi=eval_data["phi"])
+    return f
+
+
 def _singular_part(
     eval_data,
     eval_grid,
@@ -446,6 +710,7 @@ def _singular_part(
     kernel,
     interpolator,
     loop=False,
+    chunk_size=None,
 ):
     """Integrate singular point by interpolating to polar grid.
 
@@ -470,7 +735,8 @@ def _singular_part(
     keys = list(set(["|e_theta x e_zeta|"] + kernel.keys))
     if "phi" in keys:
         keys += ["omega"]
-    fsource = [source_data[key] for key in keys]
+    # transform source data once, rather than for each polar node
+    fsource = [interpolator._transform(source_data[key]) for key in keys]
 
     def polar_pt_vmap(i):
         # evaluate the effect from a single polar node around each eval point
@@ -483,7 +749,7 @@ def _singular_part(
 
         # data interpolated to each eval pt offset by dt,dz
         source_data_polar = {
-            key: interpolator(val, i) for key, val in zip(keys, fsource)
+            key: interpolator._interpolate(val, i) for key, val in zip(keys, fsource)
         }
 
         # can't interpolate phi directly since its not periodic, so we interpolate
@@ -512,9 +778,18 @@ def _singular_part(
         f_temp = polar_pt_vmap(i)
         return f + f_temp.reshape((eval_grid.num_nodes, kernel.ndim))
 
+    def polar_chunk_loop(j, f):
+        # effect from a block of polar nodes around each eval point.
+        # loop over blocks to get all polar nodes
+        f_temp = vmap(polar_pt_vmap)(idx[j]) * mask[j][:, None, None]
+        return f + f_temp.sum(axis=0)
+
     f = jnp.zeros((eval_grid.num_nodes, kernel.ndim))
     # vmap found more efficient than fori_loop, esp on gpu, but uses more memory
-    if loop:
+    if chunk_size is not None:
+        idx, mask = _chunk_indices(v.size, chunk_size)
+        f = fori_loop(0, idx.shape[0], polar_chunk_loop, f)
+    elif loop:
         f = fori_loop(0, v.size, polar_pt_loop, f)
     else:
         f = vmap(polar_pt_vmap)(jnp.arange(v.size)).sum(axis=0)
@@ -533,6 +808,8 @@ def singular_integral(
     kernel,
     interpolator,
     loop=False,
+    chunk_size=None,
+    far_field_tol=None,
 ):
     """Evaluate a singular integral transform on a surface.
 
@@ -578,6 +855,19 @@ def singular_integral(
     loop : bool
         If True, evaluate integral using loops, as opposed to vmap. Slower, but uses
         less memory.
+    chunk_size : int, optional
+        If given, evaluate integral in blocks of this many evaluation points (for the
+        non-singular part) and polar nodes (for the singular part), using vmap
+        within a block and loops over blocks. Memory use scales with chunk_size, so
+        this can be used to trade speed for memory between the two extremes of
+        ``loop``. Overrides ``loop``.
+    far_field_tol : float, optional
+        If given, interactions between well separated parts of the surface are
+        approximated by a hierarchical matrix, with low rank blocks found by
+        adaptive cross approximation to this relative tolerance. This reduces the
+        cost of the non-singular part from O(N²) to about O(N log N) for N source
+        and evaluation points, so is worthwhile for high resolution grids.
+        ``loop`` and ``chunk_size`` then only apply to the singular part.
 
     Returns
     -------
@@ -604,11 +894,25 @@ def singular_integral(
     eval_grid, source_grid = interpolator._eval_grid, interpolator._source_grid
 
     out2 = _singular_part(
-        eval_data, eval_grid, source_data, source_grid, s, q, kernel, interpolator, loop
-    )
-    out1 = _nonsingular_part(
-        eval_data, eval_grid, source_data, source_grid, s, kernel, loop
+        eval_data,
+        eval_grid,
+        source_data,
+        source_grid,
+        s,
+        q,
+        kernel,
+        interpolator,
+        loop,
+        chunk_size,
     )
+    if far_field_tol is None:
+        out1 = _nonsingular_part(
+            eval_data, eval_grid, source_data, source_grid, s, kernel, loop, chunk_size
+        )
+    else:
+        out1 = _nonsingular_part_hmatrix(
+            eval_data, eval_grid, source_data, source_grid, s, kernel, far_field_tol
+        )
     return out1 + out2
 
 
@@ -713,7 +1017,9 @@ kernels = {
 }
 
 
-def virtual_casing_biot_savart(eval_data, source_data, interpolator, loop=True):
+def virtual_casing_biot_savart(
+    eval_data, source_data, interpolator, loop=True, chunk_size=None, far_field_tol=None
+):
     """Evaluate magnetic field on surface due to sheet current on surface.
 
     The magnetic field due to the plasma current can be written as a Biot-Savart
@@ -755,6 +1061,12 @@ def virtual_casing_biot_savart(eval_data, source_data, interpolator, loop=True):
     loop : bool
         If True, evaluate integral using loops, as opposed to vmap. Slower, but uses
         less memory.
+    chunk_size : int, optional
+        If given, evaluate integral in blocks of this size, vectorized within a block
+        and looped over blocks. Overrides ``loop``. See ``singular_integral``.
+    far_field_tol : float, optional
+        If given, approximate interactions between well separated points with a
+        hierarchical low rank matrix to this tolerance. See ``singular_integral``.
 
     Returns
     -------
@@ -773,10 +1085,19 @@ def virtual_casing_biot_savart(eval_data, source_data, interpolator, loop=True):
         _kernel_biot_savart,
         interpolator,
         loop,
+        chunk_size,
+        far_field_tol,
     )
 
 
-def compute_B_plasma(eq, eval_grid, source_grid=None, normal_only=False):
+def compute_B_plasma(
+    eq,
+    eval_grid,
+    source_grid=None,
+    normal_only=False,
+    chunk_size=None,
+    far_field_tol=None,
+):
     """Evaluate magnetic field on surface due to enclosed plasma currents.
 
     The magnetic field due to the plasma current can be written as a Biot-Savart
@@ -811,6 +1132,12 @@ def compute_B_plasma(eq, eval_grid, source_grid=None, normal_only=False):
         Source points for integral.
     normal_only : bool
         If True, only compute and return the normal component of the plasma field 𝐁ᵥ⋅𝐧
+    chunk_size : int, optional
+        If given, evaluate integral in blocks of this size, vectorized within a block
+        and looped over blocks. See ``singular_integral``.
+    far_field_tol : float, optional
+        If given, approximate interactions between well separated points with a
+        hierarchical low rank matrix to this tolerance. See ``singular_integral``.
 
     Returns
     -------
@@ -851,7 +1178,13 @@ def compute_B_plasma(eq, eval_grid, source_grid=None, normal_only=False):
         interpolator = DFTInterpolator(eval_grid, source_grid, s, q)
     if hasattr(eq.surface, "Phi_mn"):
         source_data["K_vc"] += eq.surface.compute("K", grid=source_grid)["K"]
-    Bplasma = virtual_casing_biot_savart(eval_data, source_data, interpolator)
+    Bplasma = virtual_casing_biot_savart(
+        eval_data,
+        source_data,
+        interpolator,
+        chunk_size=chunk_size,
+        far_field_tol=far_field_tol,
+    )
     # need extra factor of B/2 bc we're evaluating on plasma surface
     Bplasma = Bplasma + eval_data["B"] / 2
     if normal_only:
@@ -10,6 +10,7 @@ from netCDF4 import Dataset, stringtochar
 from scipy import integrate, interpolate, optimize
 from scipy.constants import mu_0
 
+from desc.backend import jnp
 from desc.basis import DoubleFourierSeries
 from desc.compat import ensure_positive_jacobian
 from desc.compute.utils import surface_averages
@@ -34,6 +35,18 @@ from desc.vmec_utils import (
 )
 
 
+def _select_surfaces(data, grid, idx):
+    """Select the flux surfaces idx from data computed on a LinearGrid."""
+    shape = (grid.num_theta, grid.num_rho, grid.num_zeta)
+    out = {}
+    for key, val in data.items():
+        if jnp.ndim(val) and jnp.shape(val)[0] == grid.num_nodes:
+            val = val.reshape(shape + val.shape[1:], order="F")[:, idx]
+            val = val.reshape((-1,) + val.shape[3:], order="F")
+        out[key] = val
+    return out
+
+
 class VMECIO:
     """Performs input from VMEC netCDF files to DESC Equilibrium and vice-versa."""
 
@@ -273,51 +286,51 @@ class VMECIO:
         if verbose > 0:
             print("Computing data")
 
-        grid_axis = LinearGrid(M=M_nyq, N=N_nyq, rho=np.array([0.0]), NFP=NFP)
-        grid_lcfs = LinearGrid(M=M_nyq, N=N_nyq, rho=np.array([1.0]), NFP=NFP)
+        # evaluate everything on a single grid with the full and half mesh surfaces
+        # interleaved, which includes the magnetic axis and the boundary
+        grid = LinearGrid(
+            M=M_nyq, N=N_nyq, NFP=NFP, rho=np.sort(np.concatenate([r_full, r_half]))
+        )
         grid_half = LinearGrid(M=M_nyq, N=N_nyq, NFP=NFP, rho=r_half)
         grid_full = LinearGrid(M=M_nyq, N=N_nyq, NFP=NFP, rho=r_full)
+        grid_core = LinearGrid(M=M_nyq, N=N_nyq, NFP=NFP, rho=r_full[1:])
+        grid_lcfs = LinearGrid(M=M_nyq, N=N_nyq, rho=np.array([1.0]), NFP=NFP)
 
         data_quad = eq.compute(
             ["R0/a", "V", "<|B|>_rms", "<beta>_vol", "<beta_pol>_vol", "<beta_tor>_vol"]
         )
-        data_axis = eq.compute(["G", "p", "R", "<|B|^2>", "<|B|>"], grid=grid_axis)
-        data_lcfs = eq.compute(["G", "I", "R", "Z"], grid=grid_lcfs)
-        data_half = eq.compute(
-            [
-                "B_rho",
-                "B_theta",
-                "B_zeta",
-                "G",
-                "I",
-                "J",
-                "iota",
-                "p",
-                "sqrt(g)",
-                "V_r(r)",
-                "|B|",
-                "<|B|^2>",
-            ],
-            grid=grid_half,
-        )
-        data_full = eq.compute(
+        data = eq.compute(
             [
                 "B_rho",
                 "B_theta",
                 "B_zeta",
                 "current",
                 "D_Mercier",
+                "G",
+                "I",
                 "iota",
                 "J",
                 "J^theta*sqrt(g)",
                 "J^zeta",
                 "p",
+                "R",
                 "sqrt(g)",
+                "V_r(r)",
+                "Z",
+                "|B|",
+                "<|B|>",
                 "<|B|^2>",
                 "<J*B>",
             ],
-            grid=grid_full,
+            grid=grid,
         )
+        idx_full = np.arange(0, 2 * surfs - 1, 2)
+        data_full = _select_surfaces(data, grid, idx_full)
+        data_half = _select_surfaces(data, grid, idx_full[:-1] + 1)
+        # full mesh without the magnetic axis, for quantities that are NaN there
+        data_core = _select_surfaces(data, grid, idx_full[1:])
+        data_axis = _select_surfaces(data, grid, idx_full[:1])
+        data_lcfs = _select_surfaces(data, grid, idx_full[-1:])
 
         timer.stop("compute")
         if verbose > 1:
@@ -826,28 +839,44 @@ class VMECIO:
         full_basis = DoubleFourierSeries(M=M_nyq, N=N_nyq, NFP=NFP, sym=None)
         if eq.sym:
             sin_transform = Transform(
-                grid=grid_lcfs, basis=sin_basis, build=False, build_pinv=True
+                grid=grid_lcfs,
+                basis=sin_basis,
+                build=False,
+                build_pinv=True,
+                method="direct1",
             )
             cos_transform = Transform(
-                grid=grid_lcfs, basis=cos_basis, build=False, build_pinv=True
+                grid=grid_lcfs,
+                basis=cos_basis,
+                build=False,
+                build_pinv=True,
+                method="direct1",
             )
-
-            def cosfit(x):
-                y = cos_transform.fit(x)
-                return np.where(cos_transform.basis.modes[:, 1] < 0, -y, y)
-
-            def sinfit(x):
-                y = sin_transform.fit(x)
-                return np.where(sin_transform.basis.modes[:, 1] < 0, -y, y)
-
         else:
-            full_transform = Transform(
-                grid=grid_lcfs, basis=full_basis, build=False, build_pinv=True
+            sin_transform = cos_transform = Transform(
+                grid=grid_lcfs,
+                basis=full_basis,
+                build=False,
+                build_pinv=True,
+                method="direct1",
+            )
+
+        def fit(x, transform, grid):
+            # least squares fit on all flux surfaces of grid at once
+            x = (
+                x.reshape((grid.num_theta, grid.num_rho, grid.num_zeta), order="F")
+                .transpose((1, 0, 2))
+                .reshape((grid.num_rho, -1), order="F")
             )
+            m = transform.basis.modes[:, 1]
+            n = transform.basis.modes[:, 2]
+            y = np.asarray(x @ transform.matrices["pinv"].T)
+            return ptolemy_identity_rev(m, n, np.where(m < 0, -y, y))
 
-            def fullfit(x):
-                y = full_transform.fit(x)
-                return np.where(full_transform.basis.modes[:, 1] < 0, -y, y)
+        def extrapolate_axis(x):
+            # linear extrapolation from the first two surfaces to the magnetic axis
+            # TODO: evaluate at rho=0 nodes instead of extrapolation
+            return x[0, :] - (x[1, :] - x[0, :]) / (s_full[2] - s_full[1]) * s_full[1]
 
         rmin_surf = file.createVariable("rmin_surf", np.float64)
         rmin_surf.long_name = "minimum R coordinate range"
@@ -871,30 +900,14 @@ class VMECIO:
         gmnc = file.createVariable("gmnc", np.float64, ("radius", "mn_mode_nyq"))
         gmnc.long_name = "cos(m*t-n*p) component of Jacobian, on half mesh"
         gmnc.units = "m"
-        m = cos_basis.modes[:, 1]
-        n = cos_basis.modes[:, 2]
         if not eq.sym:
             gmns = file.createVariable("gmns", np.float64, ("radius", "mn_mode_nyq"))
             gmns.long_name = "sin(m*t-n*p) component of Jacobian, on half mesh"
             gmns.units = "m"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
         # d(rho)/d(s) = 1/(2*rho)
-        data = (
-            (data_half["sqrt(g)"] / (2 * data_half["rho"]))
-            .reshape(
-                (grid_half.num_theta, grid_half.num_rho, grid_half.num_zeta), order="F"
-            )
-            .transpose((1, 0, 2))
-            .reshape((grid_half.num_rho, -1), order="F")
+        xm, xn, s, c = fit(
+            data_half["sqrt(g)"] / (2 * data_half["rho"]), cos_transform, grid_half
         )
-        x_mn = np.zeros((surfs - 1, m.size))
-        for i in range(surfs - 1):
-            if eq.sym:
-                x_mn[i, :] = cosfit(data[i, :])
-            else:
-                x_mn[i, :] = fullfit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
         gmnc[0, :] = 0
         gmnc[1:, :] = -c  # negative sign for negative Jacobian
         if not eq.sym:
@@ -911,29 +924,11 @@ class VMECIO:
         bmnc = file.createVariable("bmnc", np.float64, ("radius", "mn_mode_nyq"))
         bmnc.long_name = "cos(m*t-n*p) component of |B|, on half mesh"
         bmnc.units = "T"
-        m = cos_basis.modes[:, 1]
-        n = cos_basis.modes[:, 2]
         if not eq.sym:
             bmns = file.createVariable("bmns", np.float64, ("radius", "mn_mode_nyq"))
             bmns.long_name = "sin(m*t-n*p) component of |B|, on half mesh"
             bmns.units = "T"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
-        data = (
-            data_half["|B|"]
-            .reshape(
-                (grid_half.num_theta, grid_half.num_rho, grid_half.num_zeta), order="F"
-            )
-            .transpose((1, 0, 2))
-            .reshape((grid_half.num_rho, -1), order="F")
-        )
-        x_mn = np.zeros((surfs - 1, m.size))
-        for i in range(surfs - 1):
-            if eq.sym:
-                x_mn[i, :] = cosfit(data[i, :])
-            else:
-                x_mn[i, :] = full_transform.fit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
+        xm, xn, s, c = fit(data_half["|B|"], cos_transform, grid_half)
         bmnc[0, :] = 0
         bmnc[1:, :] = c
         if not eq.sym:
@@ -952,31 +947,13 @@ class VMECIO:
         )
         bsupumnc.long_name = "cos(m*t-n*p) component of B^theta, on half mesh"
         bsupumnc.units = "T/m"
-        m = cos_basis.modes[:, 1]
-        n = cos_basis.modes[:, 2]
         if not eq.sym:
             bsupumns = file.createVariable(
                 "bsupumns", np.float64, ("radius", "mn_mode_nyq")
             )
             bsupumns.long_name = "sin(m*t-n*p) component of B^theta, on half mesh"
             bsupumns.units = "T/m"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
-        data = (
-            data_half["B^theta"]
-            .reshape(
-                (grid_half.num_theta, grid_half.num_rho, grid_half.num_zeta), order="F"
-            )
-            .transpose((1, 0, 2))
-            .reshape((grid_half.num_rho, -1), order="F")
-        )
-        x_mn = np.zeros((surfs - 1, m.size))
-        for i in range(surfs - 1):
-            if eq.sym:
-                x_mn[i, :] = cosfit(data[i, :])
-            else:
-                x_mn[i, :] = full_transform.fit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
+        xm, xn, s, c = fit(data_half["B^theta"], cos_transform, grid_half)
         bsupumnc[0, :] = 0
         bsupumnc[1:, :] = -c  # negative sign for negative Jacobian
         if not eq.sym:
@@ -995,31 +972,13 @@ class VMECIO:
         )
         bsupvmnc.long_name = "cos(m*t-n*p) component of B^zeta, on half mesh"
         bsupvmnc.units = "T/m"
-        m = cos_basis.modes[:, 1]
-        n = cos_basis.modes[:, 2]
         if not eq.sym:
             bsupvmns = file.createVariable(
                 "bsupvmns", np.float64, ("radius", "mn_mode_nyq")
             )
             bsupvmns.long_name = "sin(m*t-n*p) component of B^zeta, on half mesh"
             bsupvmns.units = "T/m"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
-        data = (
-            data_half["B^zeta"]
-            .reshape(
-                (grid_half.num_theta, grid_half.num_rho, grid_half.num_zeta), order="F"
-            )
-            .transpose((1, 0, 2))
-            .reshape((grid_half.num_rho, -1), order="F")
-        )
-        x_mn = np.zeros((surfs - 1, m.size))
-        for i in range(surfs - 1):
-            if eq.sym:
-                x_mn[i, :] = cosfit(data[i, :])
-            else:
-                x_mn[i, :] = full_transform.fit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
+        xm, xn, s, c = fit(data_half["B^zeta"], cos_transform, grid_half)
         bsupvmnc[0, :] = 0
         bsupvmnc[1:, :] = c
         if not eq.sym:
@@ -1038,39 +997,21 @@ class VMECIO:
         )
         bsubsmns.long_name = "sin(m*t-n*p) component of B_psi, on full mesh"
         bsubsmns.units = "T*m"
-        m = sin_basis.modes[:, 1]
-        n = sin_basis.modes[:, 2]
         if not eq.sym:
             bsubsmnc = file.createVariable(
                 "bsubsmnc", np.float64, ("radius", "mn_mode_nyq")
             )
             bsubsmnc.long_name = "cos(m*t-n*p) component of B_psi, on full mesh"
             bsubsmnc.units = "T*m"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
-        data = data_full["B_rho"].reshape(
-            (grid_full.num_theta, grid_full.num_rho, grid_full.num_zeta), order="F"
-        ).transpose((1, 0, 2)).reshape((grid_full.num_rho, -1), order="F") / (
-            2 * r_full[:, np.newaxis]
-        )
         # B_rho -> B_psi conversion: d(rho)/d(s) = 1/(2*rho)
-        x_mn = np.zeros((surfs, m.size))
-        for i in range(surfs):
-            if eq.sym:
-                x_mn[i, :] = sinfit(data[i, :])
-            else:
-                x_mn[i, :] = fullfit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
-        bsubsmns[:, :] = s
-        bsubsmns[0, :] = (  # linear extrapolation for coefficient at the magnetic axis
-            s[1, :] - (s[2, :] - s[1, :]) / (s_full[2] - s_full[1]) * s_full[1]
+        xm, xn, s, c = fit(
+            data_core["B_rho"] / (2 * data_core["rho"]), sin_transform, grid_core
         )
-        # TODO: evaluate current at rho=0 nodes instead of extrapolation
+        bsubsmns[0, :] = extrapolate_axis(s)
+        bsubsmns[1:, :] = s
         if not eq.sym:
-            bsubsmnc[:, :] = c
-            bsubsmnc[0, :] = (
-                c[1, :] - (c[2, :] - c[1, :]) / (s_full[2] - s_full[1]) * s_full[1]
-            )
+            bsubsmnc[0, :] = extrapolate_axis(c)
+            bsubsmnc[1:, :] = c
         timer.stop("B_psi")
         if verbose > 1:
             timer.disp("B_psi")
@@ -1084,31 +1025,13 @@ class VMECIO:
         )
         bsubumnc.long_name = "cos(m*t-n*p) component of B_theta, on half mesh"
         bsubumnc.units = "T*m"
-        m = cos_basis.modes[:, 1]
-        n = cos_basis.modes[:, 2]
         if not eq.sym:
             bsubumns = file.createVariable(
                 "bsubumns", np.float64, ("radius", "mn_mode_nyq")
             )
             bsubumns.long_name = "sin(m*t-n*p) component of B_theta, on half mesh"
             bsubumns.units = "T*m"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
-        data = (
-            data_half["B_theta"]
-            .reshape(
-                (grid_half.num_theta, grid_half.num_rho, grid_half.num_zeta), order="F"
-            )
-            .transpose((1, 0, 2))
-            .reshape((grid_half.num_rho, -1), order="F")
-        )
-        x_mn = np.zeros((surfs - 1, m.size))
-        for i in range(surfs - 1):
-            if eq.sym:
-                x_mn[i, :] = cosfit(data[i, :])
-            else:
-                x_mn[i, :] = fullfit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
+        xm, xn, s, c = fit(data_half["B_theta"], cos_transform, grid_half)
         bsubumnc[0, :] = 0
         bsubumnc[1:, :] = -c  # negative sign for negative Jacobian
         if not eq.sym:
@@ -1127,31 +1050,13 @@ class VMECIO:
         )
         bsubvmnc.long_name = "cos(m*t-n*p) component of B_zeta, on half mesh"
         bsubvmnc.units = "T*m"
-        m = cos_basis.modes[:, 1]
-        n = cos_basis.modes[:, 2]
         if not eq.sym:
             bsubvmns = file.createVariable(
                 "bsubvmns", np.float64, ("radius", "mn_mode_nyq")
             )
             bsubvmns.long_name = "sin(m*t-n*p) component of B_zeta, on half mesh"
             bsubvmns.units = "T*m"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
-        data = (
-            data_half["B_zeta"]
-            .reshape(
-                (grid_half.num_theta, grid_half.num_rho, grid_half.num_zeta), order="F"
-            )
-            .transpose((1, 0, 2))
-            .reshape((grid_half.num_rho, -1), order="F")
-        )
-        x_mn = np.zeros((surfs - 1, m.size))
-        for i in range(surfs - 1):
-            if eq.sym:
-                x_mn[i, :] = cosfit(data[i, :])
-            else:
-                x_mn[i, :] = fullfit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
+        xm, xn, s, c = fit(data_half["B_zeta"], cos_transform, grid_half)
         bsubvmnc[0, :] = 0
         bsubvmnc[1:, :] = c
         if not eq.sym:
@@ -1170,8 +1075,6 @@ class VMECIO:
         )
         currumnc.long_name = "cos(m*t-n*p) component of sqrt(g)*J^theta, on full mesh"
         currumnc.units = "A/m^3"
-        m = cos_basis.modes[:, 1]
-        n = cos_basis.modes[:, 2]
         if not eq.sym:
             currumns = file.createVariable(
                 "currumns", np.float64, ("radius", "mn_mode_nyq")
@@ -1180,33 +1083,16 @@ class VMECIO:
                 "sin(m*t-n*p) component of sqrt(g)*J^theta, on full mesh"
             )
             currumns.units = "A/m^3"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
-        data = (
-            (data_full["J^theta*sqrt(g)"] / (2 * data_full["rho"]))
-            .reshape(
-                (grid_full.num_theta, grid_full.num_rho, grid_full.num_zeta), order="F"
-            )
-            .transpose((1, 0, 2))
-            .reshape((grid_full.num_rho, -1), order="F")
-        )
-        x_mn = np.zeros((surfs, m.size))
-        for i in range(1, surfs):  # skip NaN values at magnetic axis
-            if eq.sym:
-                x_mn[i, :] = cosfit(data[i, :])
-            else:
-                x_mn[i, :] = fullfit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
-        currumnc[:, :] = c
-        currumnc[0, :] = (  # linear extrapolation for coefficient at the magnetic axis
-            s[1, :] - (c[2, :] - c[1, :]) / (s_full[2] - s_full[1]) * s_full[1]
+        xm, xn, s, c = fit(
+            data_core["J^theta*sqrt(g)"] / (2 * data_core["rho"]),
+            cos_transform,
+            grid_core,
         )
-        # TODO: evaluate current at rho=0 nodes instead of extrapolation
+        currumnc[0, :] = extrapolate_axis(c)
+        currumnc[1:, :] = c
         if not eq.sym:
-            currumns[:, :] = s
-            currumns[0, :] = (
-                s[1, :] - (s[2, :] - s[1, :]) / (s_full[2] - s_full[1]) * s_full[1]
-            )
+            currumns[0, :] = extrapolate_axis(s)
+            currumns[1:, :] = s
         timer.stop("J^theta*sqrt(g)")
         if verbose > 1:
             timer.disp("J^theta*sqrt(g)")
@@ -1220,8 +1106,6 @@ class VMECIO:
         )
         currvmnc.long_name = "cos(m*t-n*p) component of sqrt(g)*J^zeta, on full mesh"
         currvmnc.units = "A/m^3"
-        m = cos_basis.modes[:, 1]
-        n = cos_basis.modes[:, 2]
         if not eq.sym:
             currvmns = file.createVariable(
                 "currvmns", np.float64, ("radius", "mn_mode_nyq")
@@ -1230,33 +1114,16 @@ class VMECIO:
                 "sin(m*t-n*p) component of sqrt(g)*J^zeta, on full mesh"
             )
             currvmns.units = "A/m^3"
-            m = full_basis.modes[:, 1]
-            n = full_basis.modes[:, 2]
-        data = (
-            (data_full["J^zeta"] * data_full["sqrt(g)"] / (2 * data_full["rho"]))
-            .reshape(
-                (grid_full.num_theta, grid_full.num_rho, grid_full.num_zeta), order="F"
-            )
-            .transpose((1, 0, 2))
-            .reshape((grid_full.num_rho, -1), order="F")
+        xm, xn, s, c = fit(
+            data_core["J^zeta"] * data_core["sqrt(g)"] / (2 * data_core["rho"]),
+            cos_transform,
+            grid_core,
         )
-        x_mn = np.zeros((surfs, m.size))
-        for i in range(1, surfs):  # skip NaN values at magnetic axis
-            if eq.sym:
-                x_mn[i, :] = cosfit(data[i, :])
-            else:
-                x_mn[i, :] = fullfit(data[i, :])
-        xm, xn, s, c = ptolemy_identity_rev(m, n, x_mn)
-        currvmnc[:, :] = -c  # negative sign for negative Jacobian
-        currvmnc[0, :] = -(  # linear extrapolation for coefficient at the magnetic axis
-            s[1, :] - (c[2, :] - c[1, :]) / (s_full[2] - s_full[1]) * s_full[1]
-        )
-        # TODO: evaluate current at rho=0 nodes instead of extrapolation
+        currvmnc[0, :] = -extrapolate_axis(c)  # negative sign for negative Jacobian
+        currvmnc[1:, :] = -c
         if not eq.sym:
-            currvmns[:, :] = -s
-            currumns[0, :] = -(
-                s[1, :] - (s[2, :] - s[1, :]) / (s_full[2] - s_full[1]) * s_full[1]
-            )
+            currvmns[0, :] = -extrapolate_axis(s)
+            currvmns[1:, :] = -s
         timer.stop("J^zeta*sqrt(g)")
         if verbose > 1:
             timer.disp("J^zeta*sqrt(g)")
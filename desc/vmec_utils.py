@@ -342,13 +342,11 @@ def zernike_to_fourier(x_lmn, basis, rho):
     m = mn[:, 0]
     n = mn[:, 1]
 
-    x_mn = np.zeros((rho.size, m.size))
+    # index of the double Fourier mode of each Fourier-Zernike mode
+    k = (basis.modes[:, 1] + M) * (2 * N + 1) + basis.modes[:, 2] + N
     As = zernike_radial(rho[:, np.newaxis], basis.modes[:, 0], basis.modes[:, 1])
-    for k in range(len(m)):
-        idx = np.where((basis.modes[:, 1:] == [m[k], n[k]]).all(axis=1))[0]
-        if len(idx):
-            A = As[:, idx]
-            x_mn[:, k] = np.matmul(A, x_lmn[idx])
+    x_mn = np.zeros((rho.size, m.size))
+    np.add.at(x_mn.T, k, (np.asarray(As) * np.asarray(x_lmn)).T)
 
     return m, n, x_mn
 
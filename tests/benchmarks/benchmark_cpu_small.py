@@ -1,5 +1,8 @@
 """Benchmarks for timing comparison on cpu (that are small enough to run on CI)."""
 
+import subprocess
+import sys
+
 import jax
 import numpy as np
 import pytest
@@ -29,6 +32,20 @@ from desc.perturbations import perturb
 from desc.transform import Transform
 
 
+@pytest.mark.benchmark()
+def test_import_desc(benchmark):
+    """Test time to import desc.equilibrium and desc.io in a fresh interpreter."""
+
+    def run():
+        subprocess.run(
+            [sys.executable, "-c", "import desc.io; import desc.equilibrium"],
+            check=True,
+            capture_output=True,
+        )
+
+    benchmark.pedantic(run, iterations=1, rounds=10)
+
+
 @pytest.mark.benchmark()
 def test_build_transform_fft_lowres(benchmark):
     """Test time to build a transform (after compilation) for low resolution."""
@@ -7,7 +7,10 @@ import pytest
 import desc
 
 desc.set_device("gpu")
+import desc.examples
 from desc.__main__ import main
+from desc.equilibrium import EquilibriaFamily, Equilibrium
+from desc.io import InputReader
 
 
 @pytest.mark.benchmark(min_rounds=5, max_time=300, disable_gc=True, warmup=False)
@@ -147,3 +150,33 @@ def test_W7X_run(tmpdir_factory, benchmark):
     args = ["-o", str(desc_h5_path), input_filename, "-vv", "-g"]
     benchmark(main, args)
     return None
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("adaptive", [False, True], ids=["fixed", "adaptive"])
+@pytest.mark.parametrize("name", ["DSHAPE", "HELIOTRON", "ESTELL"])
+@pytest.mark.benchmark(disable_gc=True, warmup=False)
+def test_continuation_automatic(benchmark, name, adaptive):
+    """Benchmark automatic continuation for the examples with fixed/adaptive steps."""
+    input_filename = os.path.join(os.path.dirname(desc.examples.__file__), name)
+    inputs = InputReader([input_filename]).inputs[-1]
+
+    def run():
+        eq = Equilibrium(**inputs, check_kwargs=False)
+        return EquilibriaFamily.solve_continuation_automatic(
+            eq,
+            objective=inputs["objective"],
+            optimizer=inputs["optimizer"],
+            pert_order=inputs["pert_order"],
+            ftol=inputs["ftol"],
+            xtol=inputs["xtol"],
+            gtol=inputs["gtol"],
+            maxiter=inputs["maxiter"],
+            verbose=0,
+            adaptive=adaptive,
+        )
+
+    # compare the fixed and adaptive schedules for each example side by side
+    benchmark.group = "continuation_automatic_" + name
+    eqfam = benchmark.pedantic(run, rounds=1, iterations=1)
+    benchmark.extra_info["steps"] = len(eqfam)
@@ -1,9 +1,11 @@
 """Tests for backend functions."""
 
+import os
+
 import numpy as np
 import pytest
 
-from desc.backend import put, sign, vmap
+from desc.backend import _prune_compilation_cache, put, sign, vmap
 
 
 @pytest.mark.unit
@@ -35,3 +37,51 @@ def test_vmap():
     outputs = np.array([[0, 1, 8], [125, 64, 27], [0, -1, -8]])
     np.testing.assert_allclose(vmap(f)(inputs), outputs)
     np.testing.assert_allclose(vmap(f, out_axes=1)(inputs), outputs.T)
+
+
+@pytest.mark.unit
+def test_prune_compilation_cache(tmp_path):
+    """Test that the least recently used cache entries are evicted first."""
+    for i in range(4):
+        f = tmp_path / f"entry{i}"
+        f.write_bytes(b"0" * 1024)
+        os.utime(f, (1000 + i, 1000 + i))
+    # limit to 2.5 kB, so the 2 oldest should be removed
+    removed = _prune_compilation_cache(str(tmp_path), 2.5 * 1024 / 1024**3)
+    assert sorted(os.path.basename(f) for f in removed) == ["entry0", "entry1"]
+    assert sorted(os.listdir(tmp_path)) == ["entry2", "entry3"]
+    assert _prune_compilation_cache(str(tmp_path / "nonexistent"), 1.0) == []
+
+
+@pytest.mark.unit
+def test_precision():
+    """Test computing in single precision within a context."""
+    import desc
+    from desc.backend import jit, jnp
+    from desc.examples import get
+    from desc.grid import LinearGrid
+
+    f = jit(lambda x: jnp.sin(x) ** 2)
+    x = np.linspace(0, 1, 10)
+    assert f(x).dtype == np.float64
+    with desc.precision("float32"):
+        assert desc.config["precision"] == "float32"
+        assert f(x).dtype == np.float32
+        with desc.precision("float64"):
+            assert f(x).dtype == np.float64
+        assert f(x).dtype == np.float32
+    assert desc.config["precision"] == "float64"
+    assert f(x).dtype == np.float64
+
+    eq = get("DSHAPE")
+    grid = LinearGrid(rho=np.linspace(0.1, 1, 5), M=eq.M_grid, N=eq.N_grid)
+    data64 = eq.compute(["|B|", "iota"], grid=grid)
+    with desc.precision("float32"):
+        data32 = eq.compute(["|B|", "iota"], grid=grid)
+    assert data32["|B|"].dtype == np.float32
+    np.testing.assert_allclose(data32["|B|"], data64["|B|"], rtol=1e-5)
+    np.testing.assert_allclose(data32["iota"], data64["iota"], rtol=1e-5, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        with desc.precision("float16"):
+            pass
@@ -113,6 +113,39 @@ class TestBootstrapCompute:
                 rtol=1e-3,
             )
 
+    @pytest.mark.unit
+    def test_trapped_fraction_quadrature(self):
+        """Test pitch angle quadrature options for the trapped fraction."""
+        NFP = 3
+        grid = LinearGrid(rho=[0.5, 1], M=50, N=20, NFP=NFP)
+        theta = grid.nodes[:, 1]
+        zeta = grid.nodes[:, 2]
+        modB = np.where(
+            grid.inverse_rho_idx == 1,
+            9.0 + 3.7 * np.sin(theta - NFP * zeta),
+            13.0 + 2.6 * np.cos(theta),
+        )
+        data = trapped_fraction(grid, modB, np.ones_like(modB), sqrt_g_r=np.nan)
+        transforms = {"grid": grid}
+        f_t = {
+            (n_gauss, quad): _trapped_fraction(
+                None, transforms, None, data.copy(), n_gauss=n_gauss, lambda_quad=quad
+            )["trapped fraction"]
+            for n_gauss in [20, 400]
+            for quad in ["legendre", "graded"]
+        }
+        np.testing.assert_allclose(
+            f_t[(20, "graded")], f_t[(400, "legendre")], rtol=1e-8
+        )
+        np.testing.assert_allclose(
+            f_t[(400, "graded")], f_t[(400, "legendre")], rtol=1e-8
+        )
+        np.testing.assert_allclose(
+            f_t[(20, "legendre")], f_t[(400, "legendre")], rtol=1e-4
+        )
+        with pytest.raises(ValueError):
+            _trapped_fraction(None, transforms, None, data.copy(), lambda_quad="x")
+
     @pytest.mark.unit
     @pytest.mark.mpl_image_compare(
         remove_text=pytest_mpl_remove_text, tolerance=pytest_mpl_tol
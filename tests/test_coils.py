@@ -12,8 +12,9 @@ from desc.coils import (
     FourierXYZCoil,
     MixedCoilSet,
     SplineXYZCoil,
+    _symmetry_map,
 )
-from desc.compute import get_params, get_transforms, xyz2rpz, xyz2rpz_vec
+from desc.compute import get_params, get_transforms, rpz2xyz, xyz2rpz, xyz2rpz_vec
 from desc.examples import get
 from desc.geometry import FourierRZCurve, FourierRZToroidalSurface
 from desc.grid import Grid, LinearGrid
@@ -676,6 +677,42 @@ def test_symmetry_magnetic_field(DummyCoilSet):
     np.testing.assert_allclose(B_sym_xyz, B_asym_xyz, atol=1e-14)
 
 
+@pytest.mark.unit
+def test_symmetry_reduced_magnetic_field(DummyCoilSet):
+    """Tests field from the unique sector of a symmetric grid matches full grid."""
+    coilset_sym = load(
+        load_from=str(DummyCoilSet["output_path_sym"]), file_format="hdf5"
+    )
+    coilset_asym = load(
+        load_from=str(DummyCoilSet["output_path_asym"]), file_format="hdf5"
+    )
+    NFP = coilset_sym.NFP
+
+    # full torus grid that is periodic and stellarator symmetric
+    grid = LinearGrid(rho=[1.0], M=6, zeta=4 * NFP, NFP=1)
+    theta, zeta = grid.nodes[:, 1], grid.nodes[:, 2]
+    nodes_rpz = np.array(
+        [10 + np.cos(theta), zeta, np.sin(theta) + 0.1 * np.sin(theta - NFP * zeta)]
+    ).T
+    unique, src, flip = _symmetry_map(nodes_rpz, NFP, coilset_sym.sym)
+    assert unique.size < grid.num_nodes / NFP
+    np.testing.assert_allclose(nodes_rpz[unique][src][:, 0], nodes_rpz[:, 0])
+    np.testing.assert_allclose(
+        nodes_rpz[unique][src][:, 2] * np.where(flip, -1, 1),
+        nodes_rpz[:, 2],
+        atol=1e-14,
+    )
+
+    B_asym = coilset_asym.compute_magnetic_field(nodes_rpz, basis="rpz")
+    B_sym = coilset_sym.compute_magnetic_field(nodes_rpz, basis="rpz")
+    np.testing.assert_allclose(B_sym, B_asym, rtol=1e-10, atol=1e-12)
+
+    nodes_xyz = rpz2xyz(nodes_rpz)
+    B_asym = coilset_asym.compute_magnetic_field(nodes_xyz, basis="xyz")
+    B_sym = coilset_sym.compute_magnetic_field(nodes_xyz, basis="xyz")
+    np.testing.assert_allclose(B_sym, B_asym, rtol=1e-10, atol=1e-12)
+
+
 @pytest.mark.unit
 def test_load_and_save_makegrid_coils(tmpdir_factory):
     """Test loading in and saving CoilSets from MAKEGRID format files."""
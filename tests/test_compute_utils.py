@@ -10,6 +10,7 @@ from desc.compute.geom_utils import rotation_matrix
 from desc.compute.utils import (
     _get_grid_surface,
     line_integrals,
+    nufft2d1,
     surface_averages,
     surface_integrals,
     surface_integrals_transform,
@@ -18,7 +19,7 @@ from desc.compute.utils import (
     surface_variance,
 )
 from desc.examples import get
-from desc.grid import ConcentricGrid, LinearGrid, QuadratureGrid
+from desc.grid import ConcentricGrid, Grid, LinearGrid, QuadratureGrid
 from desc.transform import Transform
 
 # arbitrary choice
@@ -80,10 +81,13 @@ class TestComputeUtils:
             has_endpoint_dupe = (grid.nodes[grid.unique_zeta_idx[0], 2] == 0) & (
                 grid.nodes[grid.unique_zeta_idx[-1], 2] == 2 * np.pi / grid.NFP
             )
-        weights = (spacing.prod(axis=1) * np.nan_to_num(q).T).T
+        weights = (np.prod(spacing, axis=1) * np.nan_to_num(q).T).T
+        weights = np.asarray(weights)
 
         surfaces = {}
-        nodes = grid.nodes[:, {"rho": 0, "theta": 1, "zeta": 2}[surface_label]]
+        nodes = np.asarray(grid.nodes)[
+            :, {"rho": 0, "theta": 1, "zeta": 2}[surface_label]
+        ]
         # collect node indices for each surface_label surface
         for grid_row_idx, surface_label_value in enumerate(nodes):
             surfaces.setdefault(surface_label_value, []).append(grid_row_idx)
@@ -130,6 +134,35 @@ class TestComputeUtils:
                 # theta integrals are poorly defined on concentric grids
                 test_b_theta(label, cg_sym, eq)
 
+    @pytest.mark.unit
+    def test_surface_integrals_fast_paths(self):
+        """Test reshape and segment sum integrals against a direct computation."""
+        rho = np.linspace(0.1, 1, 4)
+        theta = np.linspace(0, 2 * np.pi, 7, endpoint=False)
+        zeta = np.linspace(0, 2 * np.pi / NFP, 5, endpoint=False)
+        grids = [
+            # tensor-product grids with their nodes in different orders
+            LinearGrid(rho=rho, theta=theta, zeta=zeta, NFP=NFP),
+            LinearGrid(L=L, M=M, N=N, NFP=NFP, sym=True, endpoint=True),
+            QuadratureGrid(L=L, M=M, N=N, NFP=NFP),
+            Grid.create_meshgrid([rho, theta, zeta], NFP=NFP),
+            # grids which need a segment sum
+            LinearGrid(rho=[0.5, 0.5, 1], M=M, N=N, NFP=NFP),
+            ConcentricGrid(L=L, M=M, N=N, NFP=NFP),
+        ]
+        for grid in grids:
+            q = np.random.default_rng(0).random((grid.num_nodes, 3))
+            for label in ("rho", "theta", "zeta"):
+                if label == "theta" and isinstance(grid, ConcentricGrid):
+                    # theta integrals are poorly defined on concentric grids
+                    continue
+                np.testing.assert_allclose(
+                    surface_integrals(grid, q, label, expand_out=False),
+                    self.surface_integrals(grid, q, label),
+                    atol=1e-14,
+                    err_msg=f"{grid} {label}",
+                )
+
     @pytest.mark.unit
     def test_unknown_unique_grid_integral(self):
         """Test that averages are invariant to whether grids have unique_idx."""
@@ -622,3 +655,35 @@ def test_rotation_matrix():
     np.testing.assert_allclose(rotation_matrix(x0), np.eye(3))
     np.testing.assert_allclose(dfdx_fwd(x0), np.zeros((3, 3, 3)))
     np.testing.assert_allclose(dfdx_rev(x0), np.zeros((3, 3, 3)))
+
+
+@pytest.mark.unit
+def test_nufft2d1():
+    """Test type 1 NUFFT against the direct sum, including derivatives."""
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-2, 8, 500)
+    y = rng.uniform(-5, 5, 500)
+    c = rng.standard_normal(500)
+    M, N = 6, 3
+
+    def direct(x, y, c):
+        m = jnp.arange(-M, M + 1)[:, None, None]
+        n = jnp.arange(-N, N + 1)[None, :, None]
+        return jnp.sum(c * jnp.exp(-1j * (m * x + n * y)), axis=-1)
+
+    def fun(f):
+        return lambda x: jnp.abs(f(x, y, c * x)).sum()
+
+    scale = np.abs(c).sum()
+    np.testing.assert_allclose(
+        nufft2d1(x, y, c, M, N), direct(x, y, c), atol=1e-12 * scale
+    )
+    np.testing.assert_allclose(
+        nufft2d1(x, y, c, M, N, eps=1e-6), direct(x, y, c), atol=1e-6 * scale
+    )
+    np.testing.assert_allclose(
+        jax.grad(fun(lambda *a: nufft2d1(*a, M, N)))(x),
+        jax.grad(fun(direct))(x),
+        rtol=1e-8,
+        atol=1e-8,
+    )
@@ -203,7 +203,7 @@ class TestFourierRZCurve:
 
         # pass in non-monotonic s
         grid = LinearGrid(N=20, endpoint=False)
-        s = grid.nodes[:, 2]
+        s = grid.nodes[:, 2].copy()
         s[-2] = s[-1]
         with pytest.raises(ValueError):
             xyz = rz.to_FourierXYZ(N=2, grid=grid, s=s)
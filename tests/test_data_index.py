@@ -1,13 +1,18 @@
 """Tests for things related to data_index."""
 
 import inspect
+import json
 import re
 
 import pytest
 
 import desc.compute
-from desc.compute import data_index
-from desc.compute.data_index import _class_inheritance
+from desc.compute import data_index, get_data_deps
+from desc.compute.data_index import (
+    _class_inheritance,
+    load_data_index_cache,
+    save_data_index_cache,
+)
 from desc.utils import errorif
 
 
@@ -135,3 +140,46 @@ def test_data_index_deps():
                 assert queried_deps[p][name]["data"] == data | axis_limit_data, err_msg
             assert queried_deps[p][name]["profiles"] == profiles, err_msg
             assert queried_deps[p][name]["params"] == params, err_msg
+
+
+@pytest.mark.unit
+def test_data_index_lazy_dependencies():
+    """Test that full dependencies are resolved on first access."""
+    p = "desc.equilibrium.equilibrium.Equilibrium"
+    entry = data_index[p]["B"]
+    full = entry["full_dependencies"]
+    assert "full_dependencies" in entry
+    assert full["data"] == get_data_deps("B", p, has_axis=False)
+    assert entry["full_with_axis_dependencies"]["data"] == get_data_deps(
+        "B", p, has_axis=True
+    )
+    assert "B^theta" in full["data"]
+    assert entry["tier"] > data_index[p]["B^theta"]["tier"]
+    with pytest.raises(KeyError):
+        entry["not a key"]
+
+
+@pytest.mark.unit
+def test_data_index_cache(tmp_path):
+    """Test saving and loading the resolved dependencies of the data_index."""
+    path = str(tmp_path / "data_index.json")
+    assert not load_data_index_cache(path)
+    save_data_index_cache(path)
+    p = "desc.equilibrium.equilibrium.Equilibrium"
+    full = data_index[p]["|B|_mn"]["full_dependencies"]
+    full_with_axis = data_index[p]["|B|_mn"]["full_with_axis_dependencies"]
+    tier = data_index[p]["|B|_mn"]["tier"]
+    assert load_data_index_cache(path)
+    assert data_index[p]["|B|_mn"]["full_dependencies"] == full
+    assert data_index[p]["|B|_mn"]["full_with_axis_dependencies"] == full_with_axis
+    assert data_index[p]["|B|_mn"]["tier"] == tier
+    assert data_index[p]["R"]["full_with_axis_dependencies"] is (
+        data_index[p]["R"]["full_dependencies"]
+    )
+    # stale cache should be ignored
+    with open(path) as f:
+        cache = json.load(f)
+    cache["hash"] = "0"
+    with open(path, "w") as f:
+        json.dump(cache, f)
+    assert not load_data_index_cache(path)
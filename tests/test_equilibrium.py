@@ -11,6 +11,7 @@ from desc.__main__ import main
 from desc.backend import sign
 from desc.equilibrium import EquilibriaFamily, Equilibrium
 from desc.examples import get
+from desc.geometry import FourierRZToroidalSurface
 from desc.grid import Grid, LinearGrid
 from desc.io import InputReader
 from desc.objectives import ForceBalance, ObjectiveFunction, get_equilibrium_objective
@@ -186,6 +187,68 @@ def test_continuation_resolution(tmpdir_factory):
         main(args)
 
 
+@pytest.mark.slow
+@pytest.mark.regression
+def test_continuation_resume(tmpdir_factory, monkeypatch):
+    """Test that automatic continuation picks up from an interrupted run."""
+    output_dir = tmpdir_factory.mktemp("result")
+    surf = FourierRZToroidalSurface(
+        R_lmn=[10, 1, 0.2],
+        Z_lmn=[-1, -0.2],
+        modes_R=[[0, 0], [1, 0], [1, 1]],
+        modes_Z=[[-1, 0], [-1, 1]],
+        NFP=3,
+    )
+    kwargs = dict(mres_step=4, pres_step=0.5, bdry_step=0.5, ftol=1e-4, maxiter=20)
+
+    def get_eq():
+        return Equilibrium(
+            L=4,
+            M=4,
+            N=1,
+            NFP=3,
+            surface=surf,
+            pressure=PowerSeriesProfile([1e3, 0, -1e3]),
+            iota=PowerSeriesProfile([1, 0, 0.3]),
+        )
+
+    path = str(output_dir.join("full.h5"))
+    eqfam = EquilibriaFamily.solve_continuation_automatic(
+        get_eq(), checkpoint_path=path, **kwargs
+    )
+    # axisymmetric, 2 pressure steps, 2 shaping steps
+    assert len(eqfam) == 5
+
+    solves = []
+    solve = Equilibrium.solve
+
+    def counting_solve(self, *args, **kwargs):
+        solves.append(self.copy())
+        return solve(self, *args, **kwargs)
+
+    monkeypatch.setattr(Equilibrium, "solve", counting_solve)
+
+    # interrupted halfway through adding shaping
+    partial_path = str(output_dir.join("partial.h5"))
+    EquilibriaFamily(*eqfam[:4]).save(partial_path)
+    eqfam2 = EquilibriaFamily.solve_continuation_automatic(
+        get_eq(), checkpoint_path=partial_path, resume=True, **kwargs
+    )
+    assert len(solves) == 1
+    assert len(eqfam2) == len(eqfam)
+    np.testing.assert_allclose(eqfam2[-1].R_lmn, eqfam[-1].R_lmn)
+    np.testing.assert_allclose(eqfam2[-1].Z_lmn, eqfam[-1].Z_lmn)
+    np.testing.assert_allclose(eqfam2[-1].L_lmn, eqfam[-1].L_lmn)
+
+    # already finished, nothing left to do
+    eqfam3 = EquilibriaFamily.solve_continuation_automatic(
+        get_eq(), checkpoint_path=path, resume=True, **kwargs
+    )
+    assert len(solves) == 1
+    assert len(eqfam3) == len(eqfam)
+    np.testing.assert_allclose(eqfam3[-1].R_lmn, eqfam[-1].R_lmn)
+
+
 @pytest.mark.unit
 def test_grid_resolution_warning():
     """Test that a warning is thrown if grid resolution is too low."""
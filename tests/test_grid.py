@@ -14,6 +14,8 @@ from desc.grid import (
     dec_to_cf,
     find_least_rational_surfaces,
     find_most_rational_surfaces,
+    most_rational,
+    n_most_rational,
 )
 from desc.profiles import PowerSeriesProfile
 
@@ -754,6 +756,57 @@ class TestGrid:
         np.testing.assert_allclose(grid.inverse_zeta_idx, inverse)
 
 
+@pytest.mark.unit
+def test_grid_cache():
+    """Test that grids with the same arguments share their arrays."""
+    grid = LinearGrid(rho=[0.3, 0.6, 1], M=4, N=3, NFP=2, sym=True)
+    same = LinearGrid(rho=np.array([0.3, 0.6, 1]), M=4, N=3, NFP=2, sym=True)
+    assert grid is not same
+    assert grid.nodes is same.nodes
+    assert grid.inverse_rho_idx is same.inverse_rho_idx
+    assert not grid.nodes.flags.writeable
+    assert LinearGrid(rho=[0.3, 0.6, 1], M=4, N=3, NFP=2).nodes is not grid.nodes
+    # integer rho is the number of surfaces, not a radial coordinate
+    assert LinearGrid(rho=1).nodes is not LinearGrid(rho=1.0).nodes
+    assert ConcentricGrid(4, 4, 2).weights is ConcentricGrid(4, 4, 2).weights
+    assert QuadratureGrid(4, 4, 2).spacing is QuadratureGrid(4, 4, 2).spacing
+
+    # changing one grid does not change the others
+    del same._unique_rho_idx
+    grid.change_resolution(2, 2, 2)
+    np.testing.assert_allclose(
+        LinearGrid(rho=[0.3, 0.6, 1], M=4, N=3, NFP=2, sym=True).nodes, same.nodes
+    )
+    assert hasattr(LinearGrid(rho=[0.3, 0.6, 1], M=4, N=3, NFP=2), "_unique_rho_idx")
+
+
+@pytest.mark.unit
+def test_most_rational():
+    """Test finding the most rational number in many intervals at once."""
+    a = np.array([0.3, 0.34, -0.9, 2.5, -0.2, 1.0, 0.3125, 1.41])
+    b = np.array([0.34, 0.3, -0.7, 3.5, 0.1, 1.0, 1 / 3, 1.43])
+    desired = np.array([1 / 3, 1 / 3, -3 / 4, 3, 0, 1, 1 / 3, 1 + 3 / 7])
+    np.testing.assert_allclose(most_rational(a, b), desired, rtol=1e-14)
+    # intervals without fractions in the table use continued fractions
+    np.testing.assert_allclose(
+        most_rational(a, b, max_denominator=3), desired, rtol=1e-14
+    )
+    for ai, bi, d in zip(a, b, desired):
+        assert np.isscalar(most_rational(ai, bi))
+        np.testing.assert_allclose(most_rational(ai, bi), d, rtol=1e-14)
+
+    np.testing.assert_allclose(
+        np.sort(n_most_rational(0, 1, 9)),
+        [0, 1 / 5, 1 / 4, 1 / 3, 1 / 2, 2 / 3, 3 / 4, 4 / 5, 1],
+        rtol=1e-14,
+    )
+    np.testing.assert_allclose(
+        np.sort(n_most_rational(-1, -2, 5)),
+        np.sort(-n_most_rational(1, 2, 5)),
+        rtol=1e-14,
+    )
+
+
 @pytest.mark.unit
 def test_find_most_rational_surfaces():
     """Test finding the most rational surfaces and their locations."""
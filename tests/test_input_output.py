@@ -10,8 +10,9 @@ import pytest
 
 import desc.examples
 from desc.basis import FourierZernikeBasis
-from desc.equilibrium import Equilibrium
+from desc.equilibrium import EquilibriaFamily, Equilibrium
 from desc.grid import LinearGrid
+from desc.input_reader import get_parser
 from desc.io import InputReader, hdf5Reader, hdf5Writer, load
 from desc.io.ascii_io import read_ascii, write_ascii
 from desc.magnetic_fields import (
@@ -310,6 +311,28 @@ class TestInputReader:
             ir.inputs[0]["verbose"] == 0
         ), "value of inputs['verbose'] incorrect on quiet argument"
 
+    @pytest.mark.unit
+    def test_compilation_cache_args(self):
+        """Test parsing of compilation cache options."""
+        parser = get_parser()
+        args = parser.parse_args(self.argv2)
+        assert args.compilation_cache is None
+        assert args.cache_max_size is None
+        assert args.warm_cache is False
+        args = parser.parse_args(
+            self.argv2
+            + [
+                "--compilation-cache",
+                "cache",
+                "--cache-max-size",
+                "2.5",
+                "--warm-cache",
+            ]
+        )
+        assert args.compilation_cache == "cache"
+        assert args.cache_max_size == 2.5
+        assert args.warm_cache is True
+
     @pytest.mark.unit
     def test_vacuum_objective_with_iota_yields_current(self):
         """Test that input file with vacuum objective always uses zero current."""
@@ -477,6 +500,90 @@ def test_reader_read_obj(reader_test_file):
         assert hasattr(submo, key)
 
 
+@pytest.mark.unit
+def test_reader_lazy_memmap(tmpdir_factory):
+    """Test that lazy reader memory maps uncompressed arrays."""
+    path = str(tmpdir_factory.mktemp("lazy").join("lazy.h5"))
+    a = np.arange(12.0).reshape(3, 4)
+    with h5py.File(path, "w") as f:
+        f.create_dataset("a", data=a)
+        f.create_dataset("b", data=a, compression="gzip")
+        f.create_dataset("c", data=2.0)
+    mo = MockObject()
+    reader = hdf5Reader(path, lazy=True)
+    reader.read_obj(mo)
+    reader.close()
+    assert isinstance(mo.a, np.memmap)
+    assert not isinstance(mo.b, np.memmap)
+    np.testing.assert_array_equal(mo.a, a)
+    np.testing.assert_array_equal(mo.b, a)
+    assert mo.c == 2.0
+    # copy on write, file should not change
+    mo.a[0, 0] = 100
+    with h5py.File(path, "r") as f:
+        np.testing.assert_array_equal(f["a"][()], a)
+
+
+@pytest.mark.unit
+def test_load_lazy():
+    """Test lazily loading an EquilibriaFamily."""
+    path = os.path.join(os.path.dirname(desc.examples.__file__), "DSHAPE_output.h5")
+    eqf = load(path)
+    lazy_eqf = load(path, lazy=True)
+    assert not any(lazy_eqf._equilibria.loaded)
+    assert len(lazy_eqf) == len(eqf)
+    eq = lazy_eqf[-1]
+    assert lazy_eqf._equilibria.loaded == [False] * (len(eqf) - 1) + [True]
+    assert eq is lazy_eqf[-1]
+    assert equals(eq, eqf[-1])
+    assert equals(lazy_eqf, eqf)
+    assert all(lazy_eqf._equilibria.loaded)
+
+
+@pytest.mark.unit
+def test_writer_compression(tmpdir_factory):
+    """Test writer compression options."""
+    tmpdir = tmpdir_factory.mktemp("compression")
+    eq = desc.examples.get("DSHAPE")
+    for compression in ["gzip", "lzf", None]:
+        path = str(tmpdir.join(f"{compression}.h5"))
+        chunks = {"_R_lmn": (16,)} if compression else None
+        eq.save(path, compression=compression, chunks=chunks)
+        with h5py.File(path, "r") as f:
+            assert f["_R_lmn"].compression == compression
+            assert f["_R_lmn"].chunks == ((16,) if compression else None)
+            assert f["_pressure"]["_params"].compression == compression
+        eq1 = load(path, lazy=True)
+        assert isinstance(eq1.R_lmn, np.memmap) == (compression is None)
+        assert equals(eq, eq1)
+    with pytest.raises(ValueError):
+        eq.save(str(tmpdir.join("bad.h5")), compression="szip")
+
+
+@pytest.mark.unit
+def test_writer_append(tmpdir_factory):
+    """Test that append mode only writes list members that have changed."""
+    path = str(tmpdir_factory.mktemp("append").join("append.h5"))
+    eqf = desc.examples.get("DSHAPE", "all")
+    eqf1 = EquilibriaFamily(*eqf[:2])
+    # uncompressed so that datasets have an offset in the file
+    eqf1.save(path, file_mode="a", compression=None)
+    with h5py.File(path, "r") as f:
+        ids = [f["_equilibria"][str(i)]["_R_lmn"].id.get_offset() for i in range(2)]
+    eqf1.append(eqf[2])
+    eqf1[1].R_lmn = eqf1[1].R_lmn + 1e-3
+    eqf1.save(path, file_mode="a", compression=None)
+    with h5py.File(path, "r") as f:
+        assert f["_equilibria"]["0"]["_R_lmn"].id.get_offset() == ids[0]
+        assert f["_equilibria"]["1"]["_R_lmn"].id.get_offset() != ids[1]
+        assert len(f["_equilibria"]) == 4  # __class__ + 3 equilibria
+    assert equals(load(path), eqf1)
+    # shrinking the family removes stale members
+    eqf2 = EquilibriaFamily(*eqf[:1])
+    eqf2.save(path, file_mode="a")
+    assert equals(load(path), eqf2)
+
+
 @pytest.mark.unit
 @pytest.mark.solve
 def test_pickle_io(tmpdir_factory):
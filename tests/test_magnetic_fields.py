@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 from scipy.constants import mu_0
 
+import desc
 from desc.backend import jit, jnp
 from desc.basis import DoubleFourierSeries
 from desc.compute import rpz2xyz_vec, xyz2rpz_vec
@@ -671,6 +672,39 @@ class TestMagneticFields:
             atol=1e-8,
         )
 
+    @pytest.mark.unit
+    def test_spline_field_precompute_coefs(self):
+        """Test spline field from precomputed cell coefficients matches interp3d."""
+        field1 = ScalarPotentialField(phi_lm, args)
+        R = np.linspace(0.5, 1.5, 10)
+        Z = np.linspace(-1.5, 1.5, 12)
+        p = np.linspace(0, 2 * np.pi / 5, 8, endpoint=False)
+        field2 = SplineMagneticField.from_field(field1, R, p, Z, NFP=5)
+        field3 = SplineMagneticField.from_field(
+            field1, R, p, Z, NFP=5, precompute_coefs=True
+        )
+        rng = np.random.default_rng(0)
+        coords = np.array(
+            [
+                rng.uniform(0.4, 1.6, 50),
+                rng.uniform(-np.pi, np.pi, 50),
+                rng.uniform(-1.6, 1.6, 50),
+            ]
+        ).T
+        B2 = field2.compute_magnetic_field(coords)
+        B3 = field3.compute_magnetic_field(coords)
+        assert np.any(np.isnan(B2))
+        np.testing.assert_allclose(B2, B3, rtol=1e-12, atol=1e-12)
+
+        # same in the axisymmetric case
+        field2 = SplineMagneticField.from_field(field1, R, [0.0], Z)
+        field3 = SplineMagneticField.from_field(
+            field1, R, [0.0], Z, precompute_coefs=True
+        )
+        B2 = field2.compute_magnetic_field(coords)
+        B3 = field3.compute_magnetic_field(coords)
+        np.testing.assert_allclose(B2, B3, rtol=1e-12, atol=1e-12)
+
     @pytest.mark.unit
     def test_spline_field_axisym(self):
         """Test computing axisymmetric magnetic field using SplineMagneticField."""
@@ -718,6 +752,30 @@ class TestMagneticFields:
         np.testing.assert_allclose(r[-1], 10, rtol=1e-6, atol=1e-6)
         np.testing.assert_allclose(z[-1], 0.001, rtol=1e-6, atol=1e-6)
 
+    @pytest.mark.unit
+    def test_field_line_integrate_float32(self):
+        """Test field line integration and spline fields in single precision."""
+        field = ToroidalMagneticField(2, 10) + PoloidalMagneticField(2, 10, 0.25)
+        r0 = [10.001]
+        z0 = [0.0]
+        phis = [0, 2 * np.pi]
+        with desc.precision("float32"):
+            r, z = field_line_integrate(r0, z0, phis, field)
+        assert r.dtype == np.float32
+        np.testing.assert_allclose(r[-1], 10, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(z[-1], 0.001, rtol=1e-5, atol=1e-5)
+
+        R = np.linspace(9.5, 10.5, 20)
+        Z = np.linspace(-0.5, 0.5, 20)
+        p = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+        spline = SplineMagneticField.from_field(field, R, p, Z)
+        coords = np.array([[10.1, 0.3, 0.2], [9.8, 2.0, -0.1]])
+        B64 = spline.compute_magnetic_field(coords)
+        with desc.precision("float32"):
+            B32 = spline.compute_magnetic_field(coords)
+        assert B32.dtype == np.float32
+        np.testing.assert_allclose(B32, B64, rtol=1e-5)
+
     @pytest.mark.unit
     def test_field_line_integrate_bounds(self):
         """Test field line integration with bounding box."""
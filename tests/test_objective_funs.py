@@ -437,11 +437,25 @@ class TestObjectiveFunction:
         with pytest.raises(ValueError):
             QuasisymmetryBoozer(eq=eq, grid=grid).build()
 
-        # multiple flux surfaces
-        grid = LinearGrid(M=eq.M, N=eq.N, NFP=eq.NFP, rho=[0.25, 0.5, 0.75, 1])
+        # different nodes on each flux surface
+        grid = ConcentricGrid(L=eq.L, M=eq.M, N=eq.N, NFP=eq.NFP, sym=False)
         with pytest.raises(ValueError):
             QuasisymmetryBoozer(eq=eq, grid=grid).build()
 
+        # multiple flux surfaces are the same as one objective per surface
+        rho = np.array([0.25, 0.5, 1])
+        grid = LinearGrid(M=2 * eq.M, N=2 * eq.N, NFP=eq.NFP, rho=rho)
+        obj = QuasisymmetryBoozer(eq=eq, grid=grid)
+        obj.build()
+        f = obj.compute_unscaled(*obj.xs(eq))
+        f_surfaces = []
+        for r in rho:
+            grid = LinearGrid(M=2 * eq.M, N=2 * eq.N, NFP=eq.NFP, rho=r)
+            obj = QuasisymmetryBoozer(eq=eq, grid=grid)
+            obj.build()
+            f_surfaces.append(obj.compute_unscaled(*obj.xs(eq)))
+        np.testing.assert_allclose(f, np.concatenate(f_surfaces), atol=1e-12)
+
     @pytest.mark.unit
     def test_mercier_stability(self):
         """Test calculation of mercier stability criteria."""
@@ -543,6 +557,18 @@ class TestObjectiveFunction:
         f = obj.compute_scaled_error(*obj.xs())
         np.testing.assert_allclose(f, 0, atol=2e-3)
 
+        # reusing the factorization from the initial boundary should still give
+        # the same answer for a nearby boundary
+        obj_lu = BoundaryErrorNESTOR(eq, coilset, field_grid=coil_grid, reuse_lu=True)
+        obj_lu.build()
+        params = eq.params_dict
+        params["R_lmn"] = params["R_lmn"] * 1.001
+        np.testing.assert_allclose(
+            obj_lu.compute_scaled_error(params),
+            obj.compute_scaled_error(params),
+            atol=1e-8,
+        )
+
     @pytest.mark.unit
     def test_target_mean_iota(self):
         """Test calculation of iota profile average."""
@@ -696,6 +722,26 @@ class TestObjectiveFunction:
         d = obj.compute_unscaled(*obj.xs(eq, surface))
         np.testing.assert_allclose(d, a_s - a_p)
 
+        # only comparing to points in nearby toroidal sectors should give the same
+        # result as comparing to all points
+        surf_grid = LinearGrid(M=5, N=6)
+        plas_grid = LinearGrid(M=5, N=12)
+        obj = PlasmaVesselDistance(
+            eq=eq, plasma_grid=plas_grid, surface_grid=surf_grid, surface=surface
+        )
+        obj.build()
+        d = obj.compute_unscaled(*obj.xs(eq, surface))
+        obj = PlasmaVesselDistance(
+            eq=eq,
+            plasma_grid=plas_grid,
+            surface_grid=surf_grid,
+            surface=surface,
+            num_sectors=12,
+        )
+        obj.build()
+        assert obj.constants["sector_points"].shape[1] < plas_grid.num_nodes
+        np.testing.assert_allclose(obj.compute_unscaled(*obj.xs(eq, surface)), d)
+
     @pytest.mark.unit
     def test_mean_curvature(self):
         """Test for mean curvature objective function."""
@@ -870,11 +916,12 @@ class TestObjectiveFunction:
         """Tests minimum distance between coils in a coilset."""
 
         def test(coils, mindist, grid=None, expect_intersect=False, tol=None):
-            obj = CoilSetMinDistance(coils, grid=grid)
-            obj.build()
-            f = obj.compute(params=coils.params_dict)
-            assert f.size == coils.num_coils
-            np.testing.assert_allclose(f, mindist)
+            for prune in [False, True]:
+                obj = CoilSetMinDistance(coils, grid=grid, prune=prune)
+                obj.build()
+                f = obj.compute(params=coils.params_dict)
+                assert f.size == coils.num_coils
+                np.testing.assert_allclose(f, mindist)
             assert coils.is_self_intersecting(grid=grid, tol=tol) == expect_intersect
 
         # linearly spaced planar coils, all coils are min distance from their neighbors
@@ -940,23 +987,25 @@ class TestObjectiveFunction:
             eq_fixed=False,
             coils_fixed=False,
         ):
-            obj = PlasmaCoilSetMinDistance(
-                eq=eq,
-                coil=coils,
-                plasma_grid=plasma_grid,
-                coil_grid=coil_grid,
-                eq_fixed=eq_fixed,
-                coils_fixed=coils_fixed,
-            )
-            obj.build()
-            if eq_fixed:
-                f = obj.compute(params_1=coils.params_dict)
-            elif coils_fixed:
-                f = obj.compute(params_1=eq.params_dict)
-            else:
-                f = obj.compute(params_1=eq.params_dict, params_2=coils.params_dict)
-            assert f.size == coils.num_coils
-            np.testing.assert_allclose(f, mindist)
+            for prune in [False, True]:
+                obj = PlasmaCoilSetMinDistance(
+                    eq=eq,
+                    coil=coils,
+                    plasma_grid=plasma_grid,
+                    coil_grid=coil_grid,
+                    eq_fixed=eq_fixed,
+                    coils_fixed=coils_fixed,
+                    prune=prune,
+                )
+                obj.build()
+                if eq_fixed:
+                    f = obj.compute(params_1=coils.params_dict)
+                elif coils_fixed:
+                    f = obj.compute(params_1=eq.params_dict)
+                else:
+                    f = obj.compute(params_1=eq.params_dict, params_2=coils.params_dict)
+                assert f.size == coils.num_coils
+                np.testing.assert_allclose(f, mindist)
 
         plasma_grid = LinearGrid(M=4, zeta=16)
         coil_grid = LinearGrid(N=8)
@@ -1106,6 +1155,45 @@ class TestObjectiveFunction:
         # check that they're the same since we set B_plasma = 0
         np.testing.assert_allclose(f, Bnorm * dA, atol=1e-14)
 
+    @pytest.mark.unit
+    def test_quadratic_flux_fixed_shape(self):
+        """Test quadratic flux from precomputed coil current response."""
+        eq = load("./tests/inputs/vacuum_nonaxisym.h5")
+        coil = FourierPlanarCoil(
+            current=1e5, center=[1, 0.1, 0.05], normal=[0, 1, 0.1], r_n=0.5
+        )
+        coilset = CoilSet.linspaced_angular(coil, n=2, angle=np.pi / eq.NFP)
+        coilset = CoilSet(*coilset, NFP=eq.NFP, sym=True)
+        coilset[1].current = 2e5
+        field = MixedCoilSet(coilset, FourierXYZCoil(3e4))
+
+        obj = QuadraticFlux(eq, field, vacuum=True)
+        obj.build(verbose=0)
+        obj_fixed = QuadraticFlux(eq, field, vacuum=True, fixed_shape=True)
+        obj_fixed.build(verbose=0)
+        assert obj_fixed.constants["current_response"].shape == (obj.dim_f, 3)
+
+        np.testing.assert_allclose(
+            obj_fixed.compute(field.params_dict),
+            obj.compute(field.params_dict),
+            rtol=1e-10,
+            atol=1e-12,
+        )
+        # fields are linear in the currents
+        field[0][0].current = -1e5
+        field[1].current = 5e4
+        np.testing.assert_allclose(
+            obj_fixed.compute(field.params_dict),
+            obj.compute(field.params_dict),
+            rtol=1e-10,
+            atol=1e-12,
+        )
+
+        with pytest.raises(ValueError):
+            QuadraticFlux(
+                eq, ToroidalMagneticField(1, 1), vacuum=True, fixed_shape=True
+            ).build(verbose=0)
+
     @pytest.mark.unit
     def test_toroidal_flux(self):
         """Test calculation of toroidal flux from coils."""
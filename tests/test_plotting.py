@@ -26,6 +26,8 @@ from desc.magnetic_fields import (
     ToroidalMagneticField,
 )
 from desc.plotting import (
+    PlotSession,
+    _compute_tasks,
     plot_1d,
     plot_2d,
     plot_3d,
@@ -73,6 +75,69 @@ def test_kwarg_future_warning(DummyStellarator):
     return None
 
 
+@pytest.mark.unit
+def test_compute_tasks():
+    """Test that plotting tasks on the same grid are computed together."""
+    eq = get("DSHAPE")
+    grid = LinearGrid(L=5, M=5, N=0)
+    tasks = [
+        (eq, "R", grid),
+        (eq, ["Z", "|B|"], LinearGrid(L=5, M=5, N=0)),
+        (eq, ["R", "<|B|>_vol"], grid),
+        (eq, "R", LinearGrid(L=6, M=5, N=0)),
+    ]
+    data = _compute_tasks(tasks)
+    data_par = _compute_tasks(tasks, max_workers=4)
+    # quantities on identical grids are merged into one call
+    assert {"R", "Z", "|B|"} <= data[0].keys()
+    assert "<|B|>_vol" in data[2]
+    assert data[3]["R"].size != data[0]["R"].size
+    for d, d_par in zip(data, data_par):
+        assert d.keys() == d_par.keys()
+        for key in d:
+            np.testing.assert_allclose(d[key], d_par[key])
+    np.testing.assert_allclose(
+        data[2]["<|B|>_vol"], eq.compute("<|B|>_vol", grid=grid)["<|B|>_vol"]
+    )
+
+
+@pytest.mark.unit
+def test_plot_session():
+    """Test that plots in a PlotSession compute requested quantities together."""
+    eq = get("DSHAPE")
+    grid = LinearGrid(rho=np.linspace(0, 1, 5))
+    _, _, ref_B = plot_fsa(eq, "B", return_data=True)
+    _, _, ref_R = plot_1d(eq, "R", grid=grid, return_data=True)
+    _, _, ref_modB = plot_1d(eq, "|B|", grid=grid, return_data=True)
+
+    calls = []
+    compute = eq.compute
+
+    def spy(names, *args, **kwargs):
+        calls.append(names)
+        return compute(names, *args, **kwargs)
+
+    eq.compute = spy
+    with PlotSession() as session:
+        session.request(eq, ["R", "<|B|>_vol"], grid)
+        _, _, data_modB = plot_1d(eq, "|B|", grid=grid, return_data=True)
+        _, _, data_R = plot_1d(eq, "R", grid=grid, return_data=True)
+        _, _, data_B = plot_fsa(eq, "B", return_data=True)
+        _, _, data_B2 = plot_fsa(eq, "B", return_data=True)
+        assert {"R", "|B|", "B"} <= session.get_data(eq, grid).keys()
+    plot_1d(eq, "R", grid=grid)
+    plt.close("all")
+    # |B| and R are computed together and the volume average by itself, then
+    # plot_fsa once for both plots, and R again after the session ended
+    assert len(calls) == 4
+    assert set(calls[0]) == {"R", "|B|"}
+    assert calls[1] == ["<|B|>_vol"]
+    np.testing.assert_allclose(data_R["R"], ref_R["R"])
+    np.testing.assert_allclose(data_modB["|B|"], ref_modB["|B|"])
+    np.testing.assert_allclose(data_B["<B>_fsa"], ref_B["<B>_fsa"])
+    np.testing.assert_allclose(data_B2["<B>_fsa"], ref_B["<B>_fsa"])
+
+
 class TestPlot1D:
     """Tests for plot_1d."""
 
@@ -522,6 +587,21 @@ class TestPlotBoundary:
 
         return fig
 
+    @pytest.mark.unit
+    def test_plot_boundaries_plot_data(self):
+        """Test computing boundaries in parallel and replotting returned data."""
+        eqs = (get("SOLOVEV"), get("DSHAPE"), FourierRZToroidalSurface())
+        _, _, data = plot_boundaries(eqs, return_data=True)
+        _, _, data_par = plot_boundaries(eqs, return_data=True, max_workers=3)
+        for key in ["R", "Z"]:
+            for x, y in zip(data[key], data_par[key]):
+                np.testing.assert_allclose(x, y)
+        # surface has no magnetic axis
+        assert data["R"][2].shape[1] == 1
+        fig, ax, data_re = plot_boundaries(eqs, return_data=True, plot_data=data)
+        assert data_re is data
+        plt.close("all")
+
 
 class TestPlotComparison:
     """Tests for plot_comparison."""
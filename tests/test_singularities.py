@@ -158,3 +158,48 @@ def test_biest_interpolators():
         g2 = interp2(f(source_theta, source_zeta), i)
         np.testing.assert_allclose(g1, g2)
         np.testing.assert_allclose(g1, ff)
+
+
+@pytest.mark.unit
+def test_singular_integral_chunked():
+    """Test that evaluating singular integral in blocks gives the same result."""
+    eq = desc.examples.get("ESTELL")
+    eval_grid = LinearGrid(M=4, N=4, NFP=eq.NFP)
+    source_grid = LinearGrid(M=8, N=8, NFP=eq.NFP)
+    keys = ["K_vc", "R", "phi", "Z", "|e_theta x e_zeta|"]
+    source_data = eq.compute(keys, grid=source_grid)
+    eval_data = eq.compute(keys, grid=eval_grid)
+
+    for interpolator in [
+        FFTInterpolator(eval_grid, source_grid, 8, 6),
+        DFTInterpolator(eval_grid, source_grid, 8, 6),
+    ]:
+        B1 = virtual_casing_biot_savart(
+            eval_data, source_data, interpolator, loop=False
+        )
+        # chunk_size not dividing number of eval points or polar nodes
+        B2 = virtual_casing_biot_savart(
+            eval_data, source_data, interpolator, chunk_size=7
+        )
+        np.testing.assert_allclose(B1, B2, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.unit
+def test_singular_integral_hmatrix():
+    """Test approximating far field interactions with a hierarchical matrix."""
+    eq = desc.examples.get("HELIOTRON")
+    grid = LinearGrid(M=12, N=12, NFP=eq.NFP, sym=False)
+    keys = ["K_vc", "R", "phi", "Z", "|e_theta x e_zeta|"]
+    data = eq.compute(keys, grid=grid)
+    interpolator = FFTInterpolator(grid, grid, 12, 10)
+    B1 = virtual_casing_biot_savart(data, data, interpolator, loop=False)
+    B2 = virtual_casing_biot_savart(
+        data, data, interpolator, loop=False, far_field_tol=1e-6
+    )
+    np.testing.assert_allclose(B1, B2, atol=1e-5 * np.max(np.abs(B1)))
+    B3 = virtual_casing_biot_savart(
+        data, data, interpolator, loop=False, far_field_tol=1e-2
+    )
+    # check that something was actually approximated
+    assert not np.allclose(B1, B3, rtol=1e-8, atol=0)
+    np.testing.assert_allclose(B1, B3, atol=1e-2 * np.max(np.abs(B1)))
@@ -507,6 +507,7 @@ class TestTransform:
 
         g = LinearGrid(rho=2, theta=2, zeta=5)
         b = DoubleFourierSeries(M=1, N=1)
+        g._nodes = g.nodes.copy()
         g._nodes[:, 2] = np.where(g._nodes[:, 2] == 0, 0.01, g.nodes[:, 2])
         with pytest.warns(UserWarning, match="nodes to be equally spaced in zeta"):
             t = Transform(g, b, method="fft")